@@ -4,9 +4,26 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
 import json
-import time
-import random
-import math
+import os
+
+from components.job_search import render_job_search
+from components.automation_panel import render_automation_panel
+from utils.live_metrics import get_live_metrics, time_ago
+from utils.timeseries import get_posting_timeseries, pick_resolution
+from utils.figure_cache import downsample_frame, get_figure_cache
+
+# ⚡ How often live fragments re-read the metrics snapshot
+REFRESH_SECONDS = int(os.getenv("CAREERCRYSTAL_REFRESH_SECONDS", "5"))
+
+# 📈 Live stream chart zoom levels and series colors
+STREAM_WINDOWS = {
+    "30 min": timedelta(minutes=30),
+    "24 hours": timedelta(hours=24),
+    "7 days": timedelta(days=7),
+    "90 days": timedelta(days=90),
+    "All": timedelta(days=3 * 365),
+}
+STREAM_COLORS = {'AI/ML': '#FFB3D9', 'Data Science': '#E6D7FF', 'Software Engineering': '#C8E6C9'}
 
 # 💎 CareerCrystal Configuration
 st.set_page_config(
@@ -165,75 +182,139 @@ st.markdown("""
         box-shadow: 0 6px 20px rgba(255,179,217,0.5);
     }
 </style>
+""", unsafe_allow_html=True)
 
-<script>
-// JAVASCRIPT FOR REAL-TIME UPDATES
-let previousValues = {};
+# 🔄 Live Stats - a ready-made snapshot the scheduler refreshes after every run
+def get_live_stats():
+    """Real job market counters from the precomputed live metrics snapshot"""
+    metrics = get_live_metrics().snapshot()
+    avg_salary = metrics.get('avg_salary')
+    return {
+        'jobs_today': metrics.get('jobs_today', 0),
+        'jobs_change': metrics.get('jobs_change', 0),
+        'avg_salary': f"${avg_salary:,}" if avg_salary else "n/a",
+        'salary_change': metrics.get('salary_change_pct', 0),
+        'growth_rate': metrics.get('growth_rate', 0),
+        'ai_jobs': metrics.get('ai_jobs', 0),
+        'recent_jobs': metrics.get('new_jobs_last_scrape', 0),
+        'activity': metrics.get('activity', []),
+        'timestamp': metrics.get('updated_at', '')[11:19]
+    }
 
-function updateCounter(elementId, newValue, isIncrease) {
-    const element = document.getElementById(elementId);
-    if (element) {
-        // Add animation class
-        element.className = isIncrease ? 'live-counter counter-up' : 'live-counter counter-down';
-        element.innerHTML = newValue;
+# ⚡ Live fragments - rerun on their own every REFRESH_SECONDS, never the whole page.
+# Each tick only reads the in-memory snapshot, so idle tabs cost almost nothing.
+@st.fragment(run_every=REFRESH_SECONDS)
+def render_live_metrics():
+    """🔥 Stock-style metric cards"""
+    stats = get_live_stats()
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.markdown(f"""
+        <div class='metric-card updating'>
+            <div class='live-counter' id='jobs-counter'>{stats['jobs_today']:,}</div>
+            <p style='color: #8B4C8C; margin: 5px 0 0 0; font-weight: bold;'>🔥 Jobs Today</p>
+            <p style='color: #28a745; margin: 2px 0 0 0; font-size: 0.8rem;'>↗ +{stats['recent_jobs']} last scrape • {stats['jobs_change']:+,} vs yesterday</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div class='metric-card updating'>
+            <div class='live-counter' id='salary-counter'>{stats['avg_salary']}</div>
+            <p style='color: #8B4C8C; margin: 5px 0 0 0; font-weight: bold;'>💰 Avg Salary</p>
+            <p style='color: #17a2b8; margin: 2px 0 0 0; font-size: 0.8rem;'>📈 {stats['salary_change']:+d}% this week</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+        <div class='metric-card updating'>
+            <div class='live-counter' id='growth-counter'>{stats['growth_rate']:+d}%</div>
+            <p style='color: #8B4C8C; margin: 5px 0 0 0; font-weight: bold;'>📈 Market Growth</p>
+            <p style='color: #28a745; margin: 2px 0 0 0; font-size: 0.8rem;'>🚀 Postings vs last week</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(f"""
+        <div class='metric-card updating'>
+            <div class='live-counter' id='ai-counter'>{stats['ai_jobs']:,}</div>
+            <p style='color: #8B4C8C; margin: 5px 0 0 0; font-weight: bold;'>🎯 AI/ML Jobs</p>
+            <p style='color: #ff6b35; margin: 2px 0 0 0; font-size: 0.8rem;'>🔥 Across all postings</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+@st.fragment(run_every=REFRESH_SECONDS)
+def render_activity_stream():
+    """⚡ Activity feed"""
+    activities = get_live_stats()['activity']
+    if not activities:
+        st.info("No activity yet - start the automation to begin collecting jobs.")
+    
+    for activity in activities:
+        ago = time_ago(activity['at'])
+        activity_class = "activity-item new" if ago in ("just now", "1m ago") else "activity-item"
         
-        // Remove animation class after animation completes
-        setTimeout(() => {
-            element.className = 'live-counter';
-        }, 2000);
-    }
-}
+        st.markdown(f"""
+        <div class='{activity_class}'>
+            <span class='live-indicator'></span>
+            <strong>{activity['text']}</strong>
+            <span style='float: right; color: #28a745; font-size: 0.8rem; font-weight: bold;'>{ago}</span>
+        </div>
+        """, unsafe_allow_html=True)
 
-// Auto-refresh every 3 seconds for ultra-responsive feel
-setInterval(function() {
-    // Trigger Streamlit rerun for live data
-    window.parent.postMessage({type: 'streamlit:rerun'}, '*');
-}, 3000);
+@st.fragment(run_every=REFRESH_SECONDS)
+def render_sidebar_metrics():
+    """📊 Sidebar stream metrics"""
+    stats = get_live_stats()
+    st.markdown(f"**Jobs:** {stats['jobs_today']:,}")
+    st.markdown(f"**AI Jobs:** {stats['ai_jobs']:,}")
+    st.markdown(f"**Growth:** {stats['growth_rate']:+d}%")
+    st.markdown(f"**Updated:** {stats['timestamp']}")
 
-</script>
-""", unsafe_allow_html=True)
+@st.fragment(run_every=REFRESH_SECONDS)
+def render_mini_metrics():
+    """Mini live dashboard for other pages"""
+    stats = get_live_stats()
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.metric("🔥 Jobs Today", f"{stats['jobs_today']:,}", f"{stats['jobs_change']:+,}")
+    with col2:
+        st.metric("💰 Avg Salary", stats['avg_salary'], f"{stats['salary_change']:+d}%") 
+    with col3:
+        st.metric("📈 Weekly Growth", f"{stats['growth_rate']:+d}%", f"+{stats['recent_jobs']} new")
 
-# 🔄 ULTRA-FAST Stats Generation (Like Stock Prices)
-def get_live_stats():
-    """Generate rapidly changing statistics like stock market"""
-    current_time = time.time()
-    
-    # Ultra-smooth fluctuations using multiple sine waves
-    jobs_base = 2847
-    jobs_today = jobs_base + int(
-        30 * math.sin(current_time / 5) +  # Fast changes
-        50 * math.sin(current_time / 20) + # Medium changes  
-        20 * math.sin(current_time / 3)    # Very fast changes
-    )
+# 📈 Live stream chart - built only when the rollups or the window change, then served from the figure cache
+def build_stream_figure(window):
+    """Per-category posting counts over `window`, downsampled for long ranges"""
+    trend_data = downsample_frame(get_posting_timeseries().query(datetime.now() - STREAM_WINDOWS[window]))
     
-    salary_base = 92000
-    avg_salary = salary_base + int(
-        2000 * math.sin(current_time / 8) +
-        1000 * math.sin(current_time / 15) +
-        500 * math.sin(current_time / 4)
-    )
+    # Create animated line chart
+    fig = go.Figure()
     
-    growth_base = 27
-    growth_rate = growth_base + int(
-        3 * math.sin(current_time / 12) +
-        2 * math.sin(current_time / 6) +
-        1 * math.sin(current_time / 2)
-    )
+    for category, color in STREAM_COLORS.items():
+        fig.add_trace(go.Scatter(
+            x=trend_data.index, 
+            y=trend_data[category],
+            mode='lines+markers',
+            name=category,
+            line=dict(color=color, width=3),
+            marker=dict(size=6)
+        ))
     
-    ai_base = 1247
-    ai_jobs = ai_base + int(
-        80 * math.sin(current_time / 7) +
-        40 * math.sin(current_time / 18) +
-        25 * math.sin(current_time / 3)
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(255,255,255,0.9)',
+        font_color='#8B4C8C',
+        title="📊 Live Job Stream • 🔴 STREAMING",
+        xaxis_title="Time",
+        yaxis_title="New Job Postings",
+        hovermode='x unified',
+        showlegend=True
     )
-    
-    return {
-        'jobs_today': max(jobs_today, jobs_base - 100),  # Prevent negative
-        'avg_salary': max(avg_salary, salary_base - 5000),
-        'growth_rate': max(growth_rate, growth_base - 10),
-        'ai_jobs': max(ai_jobs, ai_base - 200),
-        'timestamp': datetime.now().strftime("%H:%M:%S.%f")[:-3]  # Include milliseconds
-    }
+    return fig
 
 # 🌟 Real-time Header
 current_stats = get_live_stats()
@@ -244,7 +325,7 @@ st.markdown(f"""
     <p style='color: white; margin: 10px 0 0 0; font-size: 1.3rem; text-shadow: 1px 1px 2px rgba(0,0,0,0.2);'>AI-Powered Job Market Intelligence Platform</p>
     <p style='color: white; margin: 15px 0 0 0; font-size: 1rem;'>
         <span class='live-indicator'></span>
-        <strong>LIVE STREAM</strong> • {current_stats['timestamp']} • 🚀 Ultra-Fast Updates
+        <strong>LIVE STREAM</strong> • {current_stats['timestamp']} • 🚀 Event-Driven Updates
     </p>
 </div>
 """, unsafe_allow_html=True)
@@ -264,13 +345,14 @@ with st.sidebar:
         <span class='live-indicator'></span><strong>Background:</strong> Crystal Galaxy ✨
     </div>
     <div class='activity-item'>
-        <span class='live-indicator'></span><strong>Updates:</strong> 3-Second Refresh ⚡
+        <span class='live-indicator'></span><strong>Updates:</strong> On New Data ⚡
     </div>
     """, unsafe_allow_html=True)
     
     page = st.selectbox("🧭 Navigate", [
         "🏠 Real-Time Dashboard", 
         "🔮 AI Insights",
+        "🔎 Job Search",
         "📊 Live Market Trends", 
         "💰 Salary Intel",
         "🤖 Automation Center"
@@ -278,168 +360,45 @@ with st.sidebar:
     
     st.markdown("---")
     st.markdown(f"### 📊 Live Stream Metrics")
-    st.markdown(f"**Jobs:** {current_stats['jobs_today']:,}")
-    st.markdown(f"**AI Jobs:** {current_stats['ai_jobs']:,}")
-    st.markdown(f"**Growth:** +{current_stats['growth_rate']}%")
-    st.markdown(f"**Updated:** {current_stats['timestamp']}")
+    render_sidebar_metrics()
 
 # 📊 ULTRA-LIVE DASHBOARD
 if page == "🏠 Real-Time Dashboard":
     
     # 🔥 LIVE METRICS (Stock-Style)
-    col1, col2, col3, col4 = st.columns(4)
-    
-    with col1:
-        st.markdown(f"""
-        <div class='metric-card updating'>
-            <div class='live-counter' id='jobs-counter'>{current_stats['jobs_today']:,}</div>
-            <p style='color: #8B4C8C; margin: 5px 0 0 0; font-weight: bold;'>🔥 Jobs Today</p>
-            <p style='color: #28a745; margin: 2px 0 0 0; font-size: 0.8rem;'>↗ +{random.randint(5, 25)} last minute</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col2:
-        st.markdown(f"""
-        <div class='metric-card updating'>
-            <div class='live-counter' id='salary-counter'>${current_stats['avg_salary']:,}</div>
-            <p style='color: #8B4C8C; margin: 5px 0 0 0; font-weight: bold;'>💰 Avg Salary</p>
-            <p style='color: #17a2b8; margin: 2px 0 0 0; font-size: 0.8rem;'>📈 Live fluctuation</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col3:
-        st.markdown(f"""
-        <div class='metric-card updating'>
-            <div class='live-counter' id='growth-counter'>+{current_stats['growth_rate']}%</div>
-            <p style='color: #8B4C8C; margin: 5px 0 0 0; font-weight: bold;'>📈 Market Growth</p>
-            <p style='color: #28a745; margin: 2px 0 0 0; font-size: 0.8rem;'>🚀 Accelerating</p>
-        </div>
-        """, unsafe_allow_html=True)
-    
-    with col4:
-        st.markdown(f"""
-        <div class='metric-card updating'>
-            <div class='live-counter' id='ai-counter'>{current_stats['ai_jobs']:,}</div>
-            <p style='color: #8B4C8C; margin: 5px 0 0 0; font-weight: bold;'>🎯 AI/ML Jobs</p>
-            <p style='color: #ff6b35; margin: 2px 0 0 0; font-size: 0.8rem;'>🔥 Ultra Hot!</p>
-        </div>
-        """, unsafe_allow_html=True)
+    render_live_metrics()
     
     # 📈 LIVE FLOWING CHART
     st.markdown("### 📈 Live Market Stream (Real-Time)")
     
-    # Generate ultra-smooth streaming data
-    dates = pd.date_range(start=datetime.now() - timedelta(minutes=30), end=datetime.now(), freq='1min')
-    current_second = datetime.now().second
-    current_microsecond = datetime.now().microsecond
-    
-    # Create flowing, realistic data streams
-    base_time = time.time()
-    
-    trend_data = pd.DataFrame({
-        'Time': dates,
-        'AI/ML Jobs': [
-            200 + i*2 + 30*math.sin(i/3 + base_time/2) + 15*math.sin(i/1.5 + base_time/3) 
-            for i in range(len(dates))
-        ],
-        'Data Science': [
-            150 + i*1.5 + 25*math.sin(i/4 + base_time/2.5) + 12*math.sin(i/2 + base_time/4) 
-            for i in range(len(dates))
-        ],
-        'Software Engineering': [
-            300 + i*1 + 40*math.sin(i/5 + base_time/3) + 20*math.sin(i/2.5 + base_time/5) 
-            for i in range(len(dates))
-        ]
-    })
-    
-    # Create animated line chart
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=trend_data['Time'], 
-        y=trend_data['AI/ML Jobs'],
-        mode='lines+markers',
-        name='AI/ML Jobs',
-        line=dict(color='#FFB3D9', width=3),
-        marker=dict(size=6)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=trend_data['Time'], 
-        y=trend_data['Data Science'],
-        mode='lines+markers',
-        name='Data Science',
-        line=dict(color='#E6D7FF', width=3),
-        marker=dict(size=6)
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=trend_data['Time'], 
-        y=trend_data['Software Engineering'],
-        mode='lines+markers',
-        name='Software Engineering',
-        line=dict(color='#C8E6C9', width=3),
-        marker=dict(size=6)
-    ))
-    
-    fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(255,255,255,0.9)',
-        font_color='#8B4C8C',
-        title=f"📊 Live Job Stream • {current_stats['timestamp']} • 🔴 STREAMING",
-        xaxis_title="Time (Live)",
-        yaxis_title="Job Postings",
-        hovermode='x unified',
-        showlegend=True
-    )
+    # Real posting counts from the rollup store - the zoom picks minute, hour or day buckets
+    zoom = st.radio("Window", list(STREAM_WINDOWS), index=1, horizontal=True, key="stream_window")
+    series = get_posting_timeseries()
+    resolution = pick_resolution(STREAM_WINDOWS[zoom])
+    # The current bucket is part of the key so the window slides as time passes
+    params = {"window": zoom, "until": series.bucket_start(datetime.now(), resolution)}
+    fig = get_figure_cache().get("live_stream", series.version(), params, lambda: build_stream_figure(zoom))
     
     st.plotly_chart(fig, use_container_width=True)
     
     # ⚡ ULTRA-FAST ACTIVITY STREAM
-    st.markdown("### ⚡ Live Activity Stream (Ultra-Fast Updates)")
-    
-    activities = [
-        f"🔍 LIVE: Scraped {random.randint(10, 50)} jobs • LinkedIn",
-        f"🤖 AI analyzed {random.randint(20, 100)} descriptions • {random.randint(1, 3)}s ago", 
-        f"📊 TREND: AI jobs spike +{random.randint(2, 15)}% • NOW",
-        f"💰 SALARY: {random.choice(['Google', 'Meta', 'Amazon'])} updated rates • {random.randint(1, 30)}s ago",
-        f"🎯 HOT: {random.choice(['Python', 'React', 'AWS', 'ML', 'Docker'])} demand surge • LIVE",
-        f"🏢 HIRING: {random.randint(2, 15)} companies started mass hiring • {random.randint(1, 60)}s ago",
-        f"📈 MARKET: Growth rate jumped to +{random.randint(25, 35)}% • BREAKING",
-        f"🚨 ALERT: Remote positions +{random.randint(10, 25)}% • {random.randint(1, 45)}s ago"
-    ]
-    
-    for i, activity in enumerate(random.sample(activities, 5)):
-        is_new = random.choice([True, False])
-        activity_class = "activity-item new" if is_new else "activity-item"
-        
-        st.markdown(f"""
-        <div class='{activity_class}'>
-            <span class='live-indicator'></span>
-            <strong>{activity}</strong>
-            <span style='float: right; color: #28a745; font-size: 0.8rem; font-weight: bold;'>LIVE</span>
-        </div>
-        """, unsafe_allow_html=True)
+    st.markdown("### ⚡ Live Activity Stream")
+    
+    render_activity_stream()
+
+elif page == "🔎 Job Search":
+    render_job_search()
+
+elif page == "🤖 Automation Center":
+    # Start, pause or launch the standalone worker and watch its task history
+    render_automation_panel()
 
 else:
     # Other pages with live metrics
     st.markdown(f"## {page}")
     st.markdown("🚧 Advanced features in development!")
     
-    # Mini live dashboard for other pages
-    stats = get_live_stats()
-    col1, col2, col3 = st.columns(3)
-    
-    with col1:
-        st.metric("🔥 Live Count", f"{stats['jobs_today']:,}", f"+{random.randint(5, 50)}")
-    with col2:
-        st.metric("💰 Live Salary", f"${stats['avg_salary']:,}", f"+{random.randint(1, 8)}%") 
-    with col3:
-        st.metric("📈 Live Growth", f"+{stats['growth_rate']}%", f"+{random.randint(1, 5)}")
-
-# 🔄 ULTRA-FAST AUTO-REFRESH (3 seconds like stock market)
-time.sleep(3)
-st.rerun()
+    render_mini_metrics()
 
 # Footer with Live Status
 st.markdown("---")
@@ -447,7 +406,7 @@ st.markdown(f"""
 <div style='text-align: center; padding: 25px; background: rgba(255,255,255,0.2); border-radius: 15px; margin-top: 30px; backdrop-filter: blur(10px);'>
     <p style='color: #8B4C8C; margin: 0;'>💎 <strong>CareerCrystal</strong> - Built with ❤️ using AI & Real-Time Technology</p>
     <p style='color: #8B4C8C; margin: 5px 0 0 0; font-size: 0.9rem;'>
-        🤖 Autonomous • 🎨 Crystal Background • ⚡ 3-Second Updates • 
+        🤖 Autonomous • 🎨 Crystal Background • ⚡ Updates On New Data • 
         <span class='live-indicator'></span>
         <strong>ULTRA-LIVE STREAM</strong>
     </p>
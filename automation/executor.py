@@ -0,0 +1,192 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+logger = logging.getLogger(__name__)
+
+_context = threading.local()
+
+
+class TaskCancelled(BaseException):
+    """Raised inside a task at a checkpoint once it was cancelled or ran past its deadline
+
+    A BaseException, like asyncio.CancelledError, so the tasks' own
+    `except Exception` error reporting doesn't swallow it.
+    """
+
+
+class TaskContext:
+    """🎫 Cancellation token for one task run"""
+
+    def __init__(self, name, timeout=None):
+        self.name = name
+        self.timeout = timeout
+        self.deadline = None
+        self.started = None
+        self.reason = None
+        self._cancelled = threading.Event()
+
+    def start(self):
+        """Start the deadline clock - time spent queued behind dependencies doesn't count"""
+        self.started = time.monotonic()
+        if self.timeout is not None:
+            self.deadline = time.monotonic() + self.timeout
+
+    def cancel(self, reason="cancelled"):
+        self.reason = self.reason or reason
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        if not self._cancelled.is_set() and self.deadline is not None and time.monotonic() >= self.deadline:
+            self.cancel("deadline exceeded")
+        return self._cancelled.is_set()
+
+    def check(self):
+        if self.cancelled:
+            raise TaskCancelled(f"{self.name}: {self.reason}")
+
+
+def current_task():
+    """Context of the task running on this thread, or None outside the executor"""
+    return getattr(_context, "task", None)
+
+
+def checkpoint():
+    """Raise TaskCancelled if the task running on this thread should stop - a no-op outside the executor"""
+    ctx = current_task()
+    if ctx is not None:
+        ctx.check()
+
+
+def until_cancelled(iterable):
+    """Yield from `iterable` until the current task is cancelled, then stop quietly
+
+    Lets a streaming pipeline flush and commit what it already has instead of
+    abandoning a half-written batch.
+    """
+    ctx = current_task()
+    for item in iterable:
+        if ctx is not None and ctx.cancelled:
+            logger.warning(f"⏹️ {ctx.name}: {ctx.reason} - stopping early")
+            return
+        yield item
+
+
+class TaskExecutor:
+    """🧵 Runs registered scheduler tasks on a thread pool
+
+    - Independent tasks run in parallel on the pool.
+    - A task never overlaps itself: submitting one that is already queued or
+      running returns the pending run instead of starting another.
+    - Each run gets a deadline; tasks stop cooperatively at `checkpoint()`.
+    - `after` declares dependencies - a run waits for any pending run of the
+      tasks it depends on, so analysis only reads a scrape that has committed.
+    """
+
+    def __init__(self, max_workers=4):
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="careercrystal-task")
+        self._tasks = {}
+        self._pending = {}
+        self._contexts = {}
+        self._history = {}
+        self._lock = threading.Lock()
+
+    def register(self, name, func, deadline=None, after=()):
+        """Add a task; `deadline` is seconds per run, `after` names tasks it must follow"""
+        unknown = [dep for dep in after if dep not in self._tasks]
+        if unknown:
+            raise ValueError(f"{name} depends on unregistered task(s): {', '.join(unknown)}")
+        self._tasks[name] = {"func": func, "deadline": deadline, "after": tuple(after)}
+
+    def submit(self, name):
+        """Queue a run of `name` - returns its Future (the already pending one if it hasn't finished)"""
+        if name not in self._tasks:
+            raise KeyError(f"Unknown task: {name}")
+        with self._lock:
+            pending = self._pending.get(name)
+            if pending is not None and not pending.done():
+                logger.info(f"⏭️ {name} is already queued or running - not starting another run")
+                return pending
+            # Dependencies submitted earlier must finish before this run starts
+            waits_for = [self._pending[dep] for dep in self._tasks[name]["after"]
+                         if dep in self._pending and not self._pending[dep].done()]
+            ctx = TaskContext(name, self._tasks[name]["deadline"])
+            future = self._pool.submit(self._run, name, ctx, waits_for)
+            self._pending[name] = future
+            self._contexts[name] = ctx
+        return future
+
+    def run(self, *names):
+        """Submit several tasks; dependencies among them are honoured in any order given"""
+        ordered = []
+        for name in names:
+            for dep in self._tasks.get(name, {}).get("after", ()):
+                if dep in names and dep not in ordered:
+                    ordered.append(dep)
+            if name not in ordered:
+                ordered.append(name)
+        return {name: self.submit(name) for name in ordered}
+
+    def cancel(self, name):
+        """Stop a queued run, or ask a running one to stop at its next checkpoint"""
+        with self._lock:
+            future = self._pending.get(name)
+            ctx = self._contexts.get(name)
+        if future is None or future.done():
+            return False
+        if ctx is not None:
+            ctx.cancel()
+        future.cancel()
+        return True
+
+    def _run(self, name, ctx, waits_for):
+        for dependency in waits_for:
+            try:
+                dependency.result()
+            except Exception:
+                pass  # A failed dependency is recorded under its own name; this run still goes ahead
+
+        started = datetime.now()
+        record = {"started_at": started.isoformat()}
+        ctx.start()
+        _context.task = ctx
+        try:
+            ctx.check()  # Cancelled while waiting
+            result = self._tasks[name]["func"]()
+            record["status"] = "success"
+            return result
+        except TaskCancelled as e:
+            record["status"] = "timeout" if ctx.reason == "deadline exceeded" else "cancelled"
+            logger.warning(f"⏹️ {e}")
+        except Exception as e:
+            record["status"] = "error"
+            record["error"] = str(e)
+            logger.exception(f"❌ Task {name} failed: {e}")
+            raise
+        finally:
+            _context.task = None
+            record["duration_seconds"] = round((datetime.now() - started).total_seconds(), 3)
+            with self._lock:
+                self._history[name] = record
+
+    def running(self):
+        """Names of tasks with a queued or running run"""
+        with self._lock:
+            return sorted(name for name, future in self._pending.items() if not future.done())
+
+    def snapshot(self):
+        """Per-task state and last finished run"""
+        active = set(self.running())
+        with self._lock:
+            return {
+                name: {"state": "active" if name in active else "idle", "last": self._history.get(name)}
+                for name in self._tasks
+            }
+
+    def shutdown(self, wait=False):
+        for name in self.running():
+            self.cancel(name)
+        self._pool.shutdown(wait=wait, cancel_futures=True)
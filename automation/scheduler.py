@@ -1,9 +1,6 @@
-import schedule
 import time
-import threading
-import json
 from datetime import datetime, timedelta
-import streamlit as st
+import logging
 import sys
 import os
 
@@ -11,72 +8,151 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
 from utils.scraper import JobScraper
+from utils.skills import TAXONOMY_VERSION
+from utils.search import get_search_index
+from utils.atomic_io import atomic_write_json, read_json
+from utils.status_journal import get_status_journal
+from utils.live_metrics import get_live_metrics
+from utils.timeseries import get_posting_timeseries
 from utils.ai_processor import CareerCrystalAI
+from utils.analytics import get_corpus
+from utils.dedup import FingerprintIndex
+from utils.near_dedup import SHINGLE_VERSION, NearDuplicateIndex
+from automation.executor import TaskExecutor, checkpoint, current_task, until_cancelled
+from automation.timer import TimerScheduler
+
+logger = logging.getLogger(__name__)
 
 class CareerCrystalScheduler:
     """⏰ 24/7 Automation Engine - Keeps CareerCrystal running autonomously"""
     
     def __init__(self):
         self.scraper = JobScraper()
+        self.store = self.scraper.store
+        self.max_job_age_days = int(os.getenv("CAREERCRYSTAL_MAX_JOB_AGE_DAYS", "30"))
+        self.fingerprints = FingerprintIndex(max_age_days=self.max_job_age_days)
+        self.near_duplicates = NearDuplicateIndex(
+            threshold=float(os.getenv("CAREERCRYSTAL_NEAR_DUP_THRESHOLD", "0.8"))
+        )
+        if not len(self.fingerprints) and self.store.count():
+            self.fingerprints.rebuild(self.store)
+            self.near_duplicates.rebuild(self.store)
+        elif self.store.get_meta("near_dup_shingles") != SHINGLE_VERSION and self.store.count():
+            # Signatures from an older shingling can't be compared with new ones
+            self.near_duplicates.rebuild(self.store)
+        self.store.set_meta("near_dup_shingles", SHINGLE_VERSION)
+        self.search_index = get_search_index()
+        if self.store.get_meta("skill_taxonomy") != TAXONOMY_VERSION:
+            # Re-tag stored postings so old and new jobs share one skill vocabulary
+            self.store.rewrite_skills(self.scraper.skill_extractor.skills_for)
+            self.store.set_meta("skill_taxonomy", TAXONOMY_VERSION)
+            self.search_index.rebuild(self.store)
+        elif not len(self.search_index) and self.store.count():
+            self.search_index.rebuild(self.store)
+        self.timeseries = get_posting_timeseries()
+        if self.timeseries.is_empty() and self.store.count():
+            self.timeseries.rebuild(self.store)
         self.ai = CareerCrystalAI()
         self.is_running = False
         self.last_run = None
-        self.status_file = "data/scheduler_status.json"
+        self.journal = get_status_journal()
+        self.live_metrics = get_live_metrics()
+        self.executor = self._build_executor()
+        self.timers = TimerScheduler()
+    
+    def _build_executor(self):
+        """Register every task with its deadline and dependencies"""
+        executor = TaskExecutor(max_workers=int(os.getenv("CAREERCRYSTAL_TASK_WORKERS", "4")))
+        executor.register("scrape", self.scrape_jobs_task, deadline=45 * 60)
+        # Analysis and reports read the store, so they wait for an in-flight scrape to commit
+        executor.register("analyze", self.analyze_market_task, deadline=20 * 60, after=("scrape",))
+        executor.register("report", self.generate_daily_report_task, deadline=20 * 60, after=("scrape", "analyze"))
+        executor.register("trends", self.update_trends_task, deadline=5 * 60, after=("scrape",))
+        return executor
+    
+    def run_now(self, *tasks):
+        """Queue tasks on the executor right away - runs already in flight are not duplicated"""
+        return self.executor.run(*tasks)
         
     def start_automation(self):
         """🚀 Start the autonomous operation"""
         
+        if self.is_running:
+            return self.timers.start()
         self.is_running = True
         
-        # Schedule different tasks
-        schedule.every(1).hours.do(self.scrape_jobs_task)
-        schedule.every(6).hours.do(self.analyze_market_task)
-        schedule.every().day.at("09:00").do(self.generate_daily_report_task)
-        schedule.every().day.at("18:00").do(self.update_trends_task)
+        # Schedule different tasks - the timer thread only queues them, the executor runs them
+        self.timers.clear()
+        self.timers.every(60 * 60, lambda: self.executor.submit("scrape"), name="scrape")
+        self.timers.every(6 * 60 * 60, lambda: self.executor.submit("analyze"), name="analyze")
+        self.timers.daily_at("09:00", lambda: self.executor.submit("report"), name="report")
+        self.timers.daily_at("18:00", lambda: self.executor.submit("trends"), name="trends")
         
-        # Run in background thread
-        scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
-        scheduler_thread.start()
+        # Sleeps until the next timer is due - no polling
+        scheduler_thread = self.timers.start()
         
-        st.success("🚀 CareerCrystal automation is now running 24/7!")
+        logger.info("🚀 CareerCrystal automation is now running 24/7!")
         return scheduler_thread
     
-    def _run_scheduler(self):
-        """Internal scheduler loop"""
-        while self.is_running:
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+    def next_runs(self):
+        """Task name -> ISO time of its next scheduled run (empty while paused)"""
+        return {name: moment.isoformat() for name, moment in self.timers.next_runs().items()}
     
     def scrape_jobs_task(self):
         """🔍 Automated job scraping task"""
         try:
-            st.info("🔍 Starting automated job scraping...")
-            
-            # Scrape new jobs
-            jobs = self.scraper.get_all_jobs()
-            
-            # Load existing data
-            existing_jobs = self.scraper.load_jobs_data()
-            
-            # Merge and deduplicate
-            all_jobs = existing_jobs + jobs
-            unique_jobs = self._deduplicate_jobs(all_jobs)
+            logger.info("🔍 Starting automated job scraping...")
             
-            # Save updated data
-            self.scraper.save_jobs_data(unique_jobs)
+            # Only postings with an unseen fingerprint reach the store - O(new jobs), not O(history)
+            dedup_stats = {}
+            near_dup_stats = {}
+            seen_jobs = {}
+            staged_fingerprints = {}
+            # On cancellation or deadline the source stops early and what was fetched still commits
+            fresh_jobs = self.fingerprints.filter_new(until_cancelled(self.scraper.iter_jobs()), stats=dedup_stats,
+                                                      on_seen=seen_jobs.update, staged=staged_fingerprints)
+            # Reposts of the same job on another board are clustered instead of stored again
+            staged_signatures = {}
+            unique_jobs = self.near_duplicates.filter_unique(fresh_jobs, stats=near_dup_stats,
+                                                             staged=staged_signatures)
+            result = self.store.upsert_jobs(unique_jobs)
+            new_jobs = result["inserted"]
+            # Only postings the store committed count as seen - a failed write is retried by the next scrape
+            self.near_duplicates.commit(staged_signatures)
+            self.fingerprints.commit(staged_fingerprints)
+            # Postings still being listed stay alive in the store, picking up any edits
+            updated_jobs = result["updated"] + self.store.refresh_jobs(seen_jobs)
+            self.near_duplicates.touch(seen_jobs)
+            # Searchable as soon as they're stored
+            self.search_index.add_jobs(new_jobs + updated_jobs)
+            self.timeseries.record(new_jobs)
+            expired = self.fingerprints.expire()
+            self.near_duplicates.expire(self.max_job_age_days)
+            expired_keys = []
+            jobs_expired = self.store.expire_jobs(self.max_job_age_days, removed=expired_keys)
+            # Search follows the store exactly - no second clock to drift from last_seen
+            self.search_index.remove_jobs(expired_keys)
+            total_jobs = self.store.count()
+            task = current_task()
             
             # Update status
             self._update_status("job_scraping", {
                 "last_run": datetime.now().isoformat(),
-                "jobs_found": len(jobs),
-                "total_jobs": len(unique_jobs),
-                "status": "success"
+                "jobs_found": dedup_stats.get("checked", 0),
+                "new_jobs": len(new_jobs),
+                "updated_jobs": len(updated_jobs),
+                "near_duplicates": near_dup_stats.get("near_duplicates", 0),
+                "repost_clusters": self.near_duplicates.cluster_stats(),
+                "fingerprints_expired": expired,
+                "jobs_expired": jobs_expired,
+                "total_jobs": total_jobs,
+                "status": "partial" if task and task.cancelled else "success"
             })
             
-            st.success(f"✅ Scraped {len(jobs)} new jobs! Total: {len(unique_jobs)}")
+            logger.info(f"✅ Scraped {len(new_jobs)} new jobs! Total: {total_jobs}")
             
         except Exception as e:
-            st.error(f"❌ Job scraping failed: {str(e)}")
+            logger.exception(f"❌ Job scraping failed: {str(e)}")
             self._update_status("job_scraping", {
                 "last_run": datetime.now().isoformat(),
                 "status": "error",
@@ -86,17 +162,17 @@ class CareerCrystalScheduler:
     def analyze_market_task(self):
         """🤖 Automated market analysis task"""
         try:
-            st.info("🤖 Running AI market analysis...")
+            logger.info("🤖 Running AI market analysis...")
             
-            # Load job data
-            jobs = self.scraper.load_jobs_data()
+            # Shared columnar view of the store - rebuilt only when jobs changed
+            jobs = get_corpus(self.store)
             
             # Generate AI insights
             analysis = self.ai.analyze_job_trends(jobs)
+            checkpoint()  # Don't publish an analysis that ran past its deadline
             
             # Save analysis
-            with open("data/market_analysis.json", 'w') as f:
-                json.dump(analysis, f, indent=2)
+            atomic_write_json("data/market_analysis.json", analysis, lock=True)
             
             self._update_status("market_analysis", {
                 "last_run": datetime.now().isoformat(),
@@ -104,139 +180,117 @@ class CareerCrystalScheduler:
                 "status": "success"
             })
             
-            st.success("🧠 AI market analysis completed!")
+            logger.info("🧠 AI market analysis completed!")
             
         except Exception as e:
-            st.error(f"❌ Market analysis failed: {str(e)}")
+            logger.exception(f"❌ Market analysis failed: {str(e)}")
+            self._update_status("market_analysis", {
+                "last_run": datetime.now().isoformat(),
+                "status": "error",
+                "error": str(e)
+            })
     
     def generate_daily_report_task(self):
         """📊 Generate daily intelligence report"""
         try:
-            st.info("📊 Generating daily market report...")
+            logger.info("📊 Generating daily market report...")
             
-            jobs = self.scraper.load_jobs_data()
+            jobs = get_corpus(self.store)
             
             # Load market trends
-            try:
-                with open("data/market_analysis.json", 'r') as f:
-                    market_trends = json.load(f)
-            except:
-                market_trends = {}
+            market_trends = read_json("data/market_analysis.json", default={})
             
             # Generate comprehensive report
             report = self.ai.generate_daily_report(jobs, market_trends)
+            checkpoint()
             
             # Save report
             report_filename = f"data/daily_reports/report_{datetime.now().strftime('%Y_%m_%d')}.json"
-            os.makedirs("data/daily_reports", exist_ok=True)
-            
-            with open(report_filename, 'w') as f:
-                json.dump(report, f, indent=2)
+            atomic_write_json(report_filename, report, lock=True)
             
             # Update latest report
-            with open("data/latest_report.json", 'w') as f:
-                json.dump(report, f, indent=2)
+            atomic_write_json("data/latest_report.json", report, lock=True)
+            
+            self._update_status("daily_report", {
+                "last_run": datetime.now().isoformat(),
+                "jobs_analyzed": len(jobs),
+                "status": "success"
+            })
             
-            st.success("📰 Daily report generated successfully!")
+            logger.info("📰 Daily report generated successfully!")
             
         except Exception as e:
-            st.error(f"❌ Report generation failed: {str(e)}")
+            logger.exception(f"❌ Report generation failed: {str(e)}")
+            self._update_status("daily_report", {
+                "last_run": datetime.now().isoformat(),
+                "status": "error",
+                "error": str(e)
+            })
     
     def update_trends_task(self):
         """📈 Update market trends data"""
         try:
-            st.info("📈 Updating market trends...")
-            
-            jobs = self.scraper.load_jobs_data()
+            logger.info("📈 Updating market trends...")
             
             # Calculate trends
-            trends = self._calculate_trends(jobs)
+            trends = self._calculate_trends()
             
             # Save trends
-            with open("data/market_trends.json", 'w') as f:
-                json.dump(trends, f, indent=2)
+            atomic_write_json("data/market_trends.json", trends, lock=True)
+            
+            self._update_status("market_trends", {
+                "last_run": datetime.now().isoformat(),
+                "status": "success"
+            })
             
-            st.success("📊 Market trends updated!")
+            logger.info("📊 Market trends updated!")
             
         except Exception as e:
-            st.error(f"❌ Trends update failed: {str(e)}")
+            logger.exception(f"❌ Trends update failed: {str(e)}")
+            self._update_status("market_trends", {
+                "last_run": datetime.now().isoformat(),
+                "status": "error",
+                "error": str(e)
+            })
     
-    def _deduplicate_jobs(self, jobs):
-        """Remove duplicate jobs"""
-        seen = set()
-        unique_jobs = []
-        
-        for job in jobs:
-            # Create unique identifier
-            job_id = f"{job.get('title', '')}-{job.get('company', '')}-{job.get('location', '')}"
-            
-            if job_id not in seen:
-                seen.add(job_id)
-                unique_jobs.append(job)
-        
-        return unique_jobs
+    def _calculate_trends(self, days=None):
+        """Read market trends from the store's maintained day-bucket aggregates"""
+        return self.store.trend_summary(days=days)
     
-    def _calculate_trends(self, jobs):
-        """Calculate market trends from job data"""
-        if not jobs:
-            return {"status": "no_data", "updated_at": datetime.now().isoformat()}
-        
-        # Extract skills
-        all_skills = []
-        for job in jobs:
-            all_skills.extend(job.get('skills', []))
-        
-        # Calculate skill demand
-        from collections import Counter
-        skill_counts = Counter(all_skills)
+    def _update_status(self, task_name, status_data):
+        """Record one task run in the status journal"""
+        task = current_task()
+        if task is not None and task.started is not None:
+            status_data.setdefault("duration_seconds", round(time.monotonic() - task.started, 3))
         
-        trends = {
-            "total_jobs": len(jobs),
-            "top_skills": dict(skill_counts.most_common(10)),
-            "companies_hiring": len(set([job.get('company') for job in jobs if job.get('company')])),
-            "remote_jobs": len([job for job in jobs if 'remote' in job.get('location', '').lower()]),
-            "updated_at": datetime.now().isoformat()
-        }
+        try:
+            # One appended line per run - no rewrite of the whole status file
+            self.journal.record(task_name, status_data)
+            status = self.journal.status()
+        except Exception as e:
+            logger.error(f"Failed to update status: {e}")
+            return
         
-        return trends
-    
-    def _update_status(self, task_name, status_data):
-        """Update scheduler status"""
+        # Pages read the precomputed snapshot instead of querying the store
         try:
-            # Load existing status
-            try:
-                with open(self.status_file, 'r') as f:
-                    status = json.load(f)
-            except:
-                status = {}
-            
-            # Update task status
-            status[task_name] = status_data
-            status['last_updated'] = datetime.now().isoformat()
-            
-            # Save status
-            with open(self.status_file, 'w') as f:
-                json.dump(status, f, indent=2)
-                
+            self.live_metrics.refresh(self.store, status)
         except Exception as e:
-            print(f"Failed to update status: {e}")
+            logger.error(f"Failed to refresh live metrics: {e}")
     
     def get_status(self):
-        """Get current scheduler status"""
-        try:
-            with open(self.status_file, 'r') as f:
-                return json.load(f)
-        except:
-            return {"status": "not_started"}
+        """Get current scheduler status (cached until the journal changes)"""
+        return self.journal.status() or {"status": "not_started"}
     
     def stop_automation(self):
         """🛑 Stop the automation"""
         self.is_running = False
-        schedule.clear()
-        st.warning("🛑 Automation stopped")
+        self.timers.stop()
+        self.timers.clear()
+        logger.warning("🛑 Automation stopped")
 
 # 🧪 Test scheduler
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
     scheduler = CareerCrystalScheduler()
     print("🤖 Starting CareerCrystal automation...")
     scheduler.start_automation()
@@ -0,0 +1,157 @@
+import heapq
+import itertools
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+
+logger = logging.getLogger(__name__)
+
+
+class TimerScheduler:
+    """⏱️ Heap of timers served by one thread that sleeps exactly until the next one is due
+
+    Interval timers run on the monotonic clock, so wall-clock changes never
+    shift them. Daily timers target a wall-clock time; their deadlines are
+    re-derived from the wall clock on every wake, and the thread never sleeps
+    longer than `max_sleep` while one is pending, so a clock jump is noticed
+    within that bound. A jump forward past the target fires the timer once;
+    a jump backward never fires it twice. Adding a timer or stopping wakes
+    the thread at once through a Condition - nothing polls while idle.
+    """
+
+    def __init__(self, max_sleep=300):
+        self.max_sleep = max_sleep
+        self._heap = []
+        self._timers = {}
+        self._ids = itertools.count()
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread = None
+
+    # ➕ Timers
+    def every(self, seconds, func, name=None, first_in=None):
+        """Call `func()` every `seconds` - first after `first_in` seconds (default: one interval)"""
+        timer = {"kind": "interval", "interval": float(seconds), "func": func, "name": name or func.__name__}
+        delay = timer["interval"] if first_in is None else first_in
+        return self._add(timer, time.monotonic() + delay)
+
+    def daily_at(self, at, func, name=None):
+        """Call `func()` every day at local wall-clock time `at` ("HH:MM")"""
+        hour, minute = (int(part) for part in at.split(":"))
+        timer = {"kind": "daily", "hour": hour, "minute": minute, "func": func, "name": name or func.__name__}
+        timer["next_wall"] = self._next_daily(timer, datetime.now())
+        return self._add(timer, self._wall_to_monotonic(timer["next_wall"]))
+
+    def _add(self, timer, due):
+        with self._cond:
+            timer_id = next(self._ids)
+            timer["id"] = timer_id
+            timer["due"] = due
+            self._timers[timer_id] = timer
+            heapq.heappush(self._heap, (due, timer_id))
+            self._cond.notify()  # The new timer may be due before whatever the loop is waiting for
+        return timer_id
+
+    def cancel(self, timer_id):
+        with self._cond:
+            # Stale heap entries are skipped when popped
+            return self._timers.pop(timer_id, None) is not None
+
+    def clear(self):
+        with self._cond:
+            self._timers.clear()
+            self._heap.clear()
+            self._cond.notify()
+
+    # 🕰️ Clock helpers
+    @staticmethod
+    def _next_daily(timer, after):
+        target = after.replace(hour=timer["hour"], minute=timer["minute"], second=0, microsecond=0)
+        return target if target > after else target + timedelta(days=1)
+
+    @staticmethod
+    def _wall_to_monotonic(moment):
+        return time.monotonic() + (moment - datetime.now()).total_seconds()
+
+    def _resync_daily(self):
+        """Re-derive daily deadlines from the wall clock - picks up any jump since the last wake"""
+        resynced = False
+        for timer in self._timers.values():
+            if timer["kind"] == "daily":
+                timer["due"] = self._wall_to_monotonic(timer["next_wall"])
+                resynced = True
+        if resynced:
+            self._heap = [(timer["due"], timer_id) for timer_id, timer in self._timers.items()]
+            heapq.heapify(self._heap)
+        return resynced
+
+    def _reschedule(self, timer, now):
+        if timer["kind"] == "interval":
+            # Keep the original cadence; after a long stall, skip the missed runs instead of bursting
+            timer["due"] += timer["interval"]
+            if timer["due"] <= now:
+                timer["due"] = now + timer["interval"]
+        else:
+            timer["next_wall"] = self._next_daily(timer, max(datetime.now(), timer["next_wall"]))
+            timer["due"] = self._wall_to_monotonic(timer["next_wall"])
+        heapq.heappush(self._heap, (timer["due"], timer["id"]))
+
+    # 🔁 Loop
+    def start(self):
+        with self._cond:
+            if self._running:
+                return self._thread
+            self._running = True
+            self._thread = threading.Thread(target=self._loop, name="careercrystal-timer", daemon=True)
+            self._thread.start()
+        return self._thread
+
+    def stop(self, wait=True):
+        """Stop the loop - takes effect immediately, not at the next tick"""
+        with self._cond:
+            self._running = False
+            self._cond.notify()
+        if wait and self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                due_now = []
+                while self._running:
+                    has_daily = self._resync_daily()
+                    now = time.monotonic()
+                    while self._heap and (self._heap[0][1] not in self._timers
+                                          or self._timers[self._heap[0][1]]["due"] != self._heap[0][0]):
+                        heapq.heappop(self._heap)  # Cancelled or superseded entry
+                    if self._heap and self._heap[0][0] <= now:
+                        while self._heap and self._heap[0][0] <= now:
+                            _, timer_id = heapq.heappop(self._heap)
+                            timer = self._timers.get(timer_id)
+                            if timer is not None and timer["due"] <= now:
+                                due_now.append(timer)
+                                self._reschedule(timer, now)
+                        break
+                    timeout = self._heap[0][0] - now if self._heap else None
+                    if has_daily:
+                        timeout = self.max_sleep if timeout is None else min(timeout, self.max_sleep)
+                    self._cond.wait(timeout)
+                if not self._running:
+                    return
+
+            # Callbacks run outside the lock so they can add or cancel timers
+            for timer in due_now:
+                try:
+                    timer["func"]()
+                except Exception as e:
+                    logger.exception(f"❌ Timer {timer['name']} failed: {e}")
+
+    def next_runs(self):
+        """Timer name -> wall-clock time of its next run"""
+        with self._cond:
+            now_wall, now = datetime.now(), time.monotonic()
+            return {
+                timer["name"]: timer.get("next_wall") or now_wall + timedelta(seconds=max(0.0, timer["due"] - now))
+                for timer in self._timers.values()
+            }
@@ -0,0 +1,254 @@
+import logging
+import os
+import secrets
+import signal
+import socket
+import subprocess
+import sys
+import threading
+from datetime import datetime
+from multiprocessing.connection import Client, Listener
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Add project root to path
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(PROJECT_ROOT)
+
+logger = logging.getLogger(__name__)
+
+WORKER_HOST = "127.0.0.1"
+WORKER_PORT = int(os.getenv("CAREERCRYSTAL_WORKER_PORT", "47651"))
+LOCK_PATH = os.path.join(PROJECT_ROOT, "data", "worker.lock")
+KEY_PATH = os.path.join(PROJECT_ROOT, "data", "worker.key")
+
+class WorkerAlreadyRunning(RuntimeError):
+    pass
+
+
+def _auth_key(create=False):
+    """Shared secret for the control channel - env override, else a per-deployment key file"""
+    env_key = os.getenv("CAREERCRYSTAL_WORKER_AUTHKEY")
+    if env_key:
+        return env_key.encode("utf-8")
+    if create and not os.path.exists(KEY_PATH):
+        os.makedirs(os.path.dirname(KEY_PATH), exist_ok=True)
+        fd = os.open(KEY_PATH, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w") as f:
+            f.write(secrets.token_hex(32))
+    try:
+        with open(KEY_PATH, "r") as f:
+            return f.read().strip().encode("utf-8")
+    except FileNotFoundError:
+        return None
+
+
+class SingleInstanceLock:
+    """🔒 Exclusive, non-blocking lock file - the OS releases it if the worker dies"""
+
+    def __init__(self, path=LOCK_PATH):
+        self.path = path
+        self._file = None
+
+    def acquire(self):
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        self._file = open(self.path, "a+")
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                import msvcrt
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            self._file.close()
+            self._file = None
+            raise WorkerAlreadyRunning(f"Another worker holds {self.path}")
+        self._file.seek(0)
+        self._file.truncate()
+        self._file.write(str(os.getpid()))
+        self._file.flush()
+
+    def release(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class AutomationWorker:
+    """🛠️ Standalone automation process - owns the scheduler and serves a local control channel
+
+    Scraping and AI analysis run here, in their own interpreter, so they never
+    compete with Streamlit page renders for the GIL. A lock file guarantees one
+    worker per deployment; pages talk to it through `WorkerClient`.
+    """
+
+    def __init__(self, host=WORKER_HOST, port=WORKER_PORT):
+        self.address = (host, port)
+        self.lock = SingleInstanceLock()
+        self.scheduler = None
+        self.started_at = None
+        self._stop = threading.Event()
+        self._listener = None
+
+    def serve_forever(self, autostart=True):
+        self.lock.acquire()
+        try:
+            # Imported here so a second worker exits before loading the whole app
+            from automation.scheduler import CareerCrystalScheduler
+            self.scheduler = CareerCrystalScheduler()
+            self.started_at = datetime.now().isoformat()
+            if autostart:
+                self.scheduler.start_automation()
+
+            self._listener = Listener(self.address, authkey=_auth_key(create=True))
+            logger.info(f"🛠️ Worker {os.getpid()} listening on {self.address[0]}:{self.address[1]}")
+            while not self._stop.is_set():
+                try:
+                    conn = self._listener.accept()
+                except Exception as e:
+                    if not self._stop.is_set():
+                        logger.warning(f"Rejected control connection: {e}")
+                    continue
+                threading.Thread(target=self._serve, args=(conn,), daemon=True).start()
+        finally:
+            if self._listener is not None:
+                self._listener.close()
+            if self.scheduler:
+                if self.scheduler.is_running:
+                    self.scheduler.stop_automation()
+                self.scheduler.executor.shutdown()
+            self.lock.release()
+            logger.info("👋 Worker stopped")
+
+    def shutdown(self):
+        self._stop.set()
+        # accept() doesn't return when the socket is closed from another thread - poke it instead
+        try:
+            socket.create_connection(self.address, timeout=1).close()
+        except OSError:
+            pass
+
+    def _serve(self, conn):
+        with conn:
+            try:
+                while True:
+                    request = conn.recv()
+                    conn.send(self.handle(request))
+            except (EOFError, OSError):
+                pass
+
+    def status(self):
+        return {
+            "pid": os.getpid(),
+            "started_at": self.started_at,
+            "automation_running": self.scheduler.is_running,
+            "running_tasks": self.scheduler.executor.running(),
+            "tasks": self.scheduler.executor.snapshot(),
+            "next_runs": self.scheduler.next_runs(),
+        }
+
+    def handle(self, request):
+        """Answer one control command - always returns a dict with "ok" """
+        command = request.get("command")
+        if command in ("ping", "status"):
+            return {"ok": True, **self.status()}
+        if command == "start":
+            if not self.scheduler.is_running:
+                self.scheduler.start_automation()
+            return {"ok": True, **self.status()}
+        if command == "pause":
+            if self.scheduler.is_running:
+                self.scheduler.stop_automation()
+            return {"ok": True, **self.status()}
+        if command == "run":
+            tasks = request.get("tasks") or []
+            unknown = [task for task in tasks if task not in self.scheduler.executor.snapshot()]
+            if unknown:
+                return {"ok": False, "error": f"Unknown task(s): {', '.join(unknown)}"}
+            # Queued on the executor pool, so the control channel stays responsive
+            self.scheduler.run_now(*tasks)
+            return {"ok": True, "queued": tasks, **self.status()}
+        if command == "cancel":
+            cancelled = [task for task in request.get("tasks") or [] if self.scheduler.executor.cancel(task)]
+            return {"ok": True, "cancelled": cancelled, **self.status()}
+        if command == "shutdown":
+            threading.Timer(0.1, self.shutdown).start()
+            return {"ok": True}
+        return {"ok": False, "error": f"Unknown command: {command}"}
+
+
+class WorkerClient:
+    """📡 Control-channel client used by Streamlit pages - never raises when the worker is down"""
+
+    def __init__(self, host=WORKER_HOST, port=WORKER_PORT, timeout=5):
+        self.address = (host, port)
+        self.timeout = timeout
+
+    def request(self, command, **payload):
+        """Send one command; returns the reply, or {"ok": False, "error": ...} if the worker is unreachable"""
+        authkey = _auth_key()
+        if authkey is None:
+            return {"ok": False, "error": "Worker has never been started"}
+        try:
+            with Client(self.address, authkey=authkey) as conn:
+                conn.send({"command": command, **payload})
+                if not conn.poll(self.timeout):
+                    return {"ok": False, "error": "Worker did not answer in time"}
+                return conn.recv()
+        except (OSError, EOFError) as e:
+            return {"ok": False, "error": f"Worker unreachable: {e}"}
+        except Exception as e:  # e.g. AuthenticationError after a key rotation
+            return {"ok": False, "error": str(e)}
+
+    def ping(self):
+        """Worker status, or None when no worker is running"""
+        reply = self.request("ping")
+        return reply if reply.get("ok") else None
+
+    def start(self):
+        return self.request("start")
+
+    def pause(self):
+        return self.request("pause")
+
+    def run(self, *tasks):
+        return self.request("run", tasks=list(tasks))
+
+    def cancel(self, *tasks):
+        return self.request("cancel", tasks=list(tasks))
+
+    def shutdown(self):
+        return self.request("shutdown")
+
+
+def launch_worker():
+    """Start a detached worker process - a no-op beyond a short-lived process if one already runs"""
+    return subprocess.Popen(
+        [sys.executable, "-m", "automation.worker"],
+        cwd=PROJECT_ROOT,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True
+    )
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    # Data paths in the app are relative to the project root
+    os.chdir(PROJECT_ROOT)
+    worker = AutomationWorker()
+    signal.signal(signal.SIGTERM, lambda *_: worker.shutdown())
+    try:
+        worker.serve_forever(autostart=os.getenv("CAREERCRYSTAL_WORKER_AUTOSTART", "1") != "0")
+    except WorkerAlreadyRunning as e:
+        logger.error(f"🔒 {e} - not starting a second worker")
+        sys.exit(1)
+    except KeyboardInterrupt:
+        worker.shutdown()
+
+
+if __name__ == "__main__":
+    main()
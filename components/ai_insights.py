@@ -7,10 +7,14 @@ import plotly.graph_objects as go
 import sys
 import os
 
-# Add utils to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'utils'))
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from ai_processor import CareerCrystalAI
+from utils.ai_processor import CareerCrystalAI
+from utils.analytics import get_corpus
+from utils.atomic_io import atomic_write_json
+from utils.data_access import load_json
+from utils.job_store import get_job_store
 
 def render_ai_insights():
     """🔮 AI-Powered Career Insights Dashboard"""
@@ -31,12 +35,9 @@ def render_ai_insights():
         display_generate_analysis()
 
 def load_ai_analysis():
-    """Load existing AI analysis"""
+    """Load existing AI analysis (cached until the file changes)"""
     try:
-        with open("data/market_analysis.json", 'r') as f:
-            return json.load(f)
-    except FileNotFoundError:
-        return None
+        return load_json("data/market_analysis.json")
     except Exception as e:
         st.error(f"Error loading AI analysis: {e}")
         return None
@@ -140,26 +141,68 @@ def display_generate_analysis():
     st.markdown("No AI analysis found. Generate fresh insights from current job market data!")
     
     if st.button("🚀 Generate AI Insights", type="primary"):
-        with st.spinner("🧠 AI is analyzing job market data..."):
-            ai = CareerCrystalAI()
-            
-            # Load job data
-            try:
-                with open("data/jobs_database.json", 'r') as f:
-                    jobs_data = json.load(f).get('jobs', [])
-            except:
-                jobs_data = []
-            
-            # Generate analysis
-            analysis = ai.analyze_job_trends(jobs_data)
-            
-            # Save analysis
-            os.makedirs("data", exist_ok=True)
-            with open("data/market_analysis.json", 'w') as f:
-                json.dump(analysis, f, indent=2)
-            
-            st.success("✅ AI analysis generated successfully!")
-            st.rerun()
+        ai = CareerCrystalAI()
+        
+        # Load job data
+        try:
+            jobs_data = get_corpus(get_job_store())
+        except Exception:
+            jobs_data = []
+        
+        # One placeholder per section, filled in as the model streams its JSON
+        status = st.empty()
+        status.info("🧠 AI is analyzing job market data...")
+        placeholders = {section: st.empty() for section in STREAMED_SECTIONS}
+        analysis = {}
+        
+        for event, section, value in ai.stream_job_trends(jobs_data):
+            if event == "done":
+                analysis = value
+            elif section in placeholders:
+                placeholders[section].markdown(_render_section(section, value, streaming=event == "partial"),
+                                               unsafe_allow_html=True)
+        
+        # Save analysis
+        atomic_write_json("data/market_analysis.json", analysis, lock=True)
+        
+        status.success("✅ AI analysis generated successfully!")
+        st.rerun()
+
+STREAMED_SECTIONS = ("trend_analysis", "hot_skills", "salary_insights", "growth_prediction", "recommendations")
+
+def _render_section(section, value, streaming=False):
+    """HTML for one analysis section - `streaming` adds a typing cursor while tokens arrive"""
+    cursor = " ▌" if streaming else ""
+    
+    if section == "hot_skills":
+        skills = "".join(f"<li>{skill}</li>" for skill in value)
+        return f"""
+        <div style='background: rgba(255,179,217,0.2); padding: 15px; margin: 10px 0; border-radius: 10px; border-left: 4px solid #FFB3D9;'>
+            <h4 style='color: #8B4C8C; margin-top: 0;'>🔥 Most In-Demand Skills</h4>
+            <ul style='color: #8B4C8C; margin: 0;'>{skills}</ul>{cursor}
+        </div>
+        """
+    
+    if section == "recommendations":
+        recommendations = "".join(f"<p style='color: #8B4C8C; margin: 5px 0;'>💡 {rec}</p>" for rec in value)
+        return f"""
+        <div style='background: rgba(255,248,220,0.3); padding: 15px; margin: 10px 0; border-radius: 10px; border-left: 4px solid #FFF8DC;'>
+            <h4 style='color: #8B4C8C; margin-top: 0;'>🎯 Recommendations</h4>
+            {recommendations}{cursor}
+        </div>
+        """
+    
+    titles = {
+        "trend_analysis": "📊 Market Trend Analysis",
+        "salary_insights": "💰 Salary Intelligence",
+        "growth_prediction": "🚀 Market Growth Forecast"
+    }
+    return f"""
+    <div style='background: rgba(230,215,255,0.3); padding: 20px; border-radius: 15px; margin-bottom: 20px;'>
+        <h4 style='color: #8B4C8C; margin-top: 0;'>{titles[section]}</h4>
+        <p style='font-size: 1.1rem; color: #8B4C8C;'>{value}{cursor}</p>
+    </div>
+    """
 
 if __name__ == "__main__":
     render_ai_insights()
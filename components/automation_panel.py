@@ -1,13 +1,23 @@
 import streamlit as st
-import json
+import pandas as pd
+import plotly.express as px
 from datetime import datetime
 import sys
 import os
 
-# Add automation to path
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'automation'))
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
-from scheduler import CareerCrystalScheduler
+from automation.worker import WorkerClient, launch_worker
+from utils.status_journal import get_status_journal
+
+# Journal task names, in the order the panel lists them
+JOURNAL_TASKS = {
+    "job_scraping": "🔍 Job Scraping",
+    "market_analysis": "🤖 AI Analysis",
+    "daily_report": "📊 Daily Report",
+    "market_trends": "📈 Trend Update",
+}
 
 def render_automation_panel():
     """⚙️ Automation Control Panel - Manage 24/7 operations"""
@@ -19,35 +29,36 @@ def render_automation_panel():
     </div>
     """, unsafe_allow_html=True)
     
-    # Initialize scheduler
-    if 'scheduler' not in st.session_state:
-        st.session_state.scheduler = CareerCrystalScheduler()
+    # The scheduler lives in the standalone worker process - this page only sends it commands
+    client = WorkerClient()
+    worker = client.ping()
     
-    scheduler = st.session_state.scheduler
+    if worker is None:
+        st.warning("🛑 The automation worker is not running. Start it with `python -m automation.worker` or launch it here.")
+        if st.button("🛠️ Launch Worker", type="primary"):
+            launch_worker()
+            st.info("🛠️ Worker starting - refresh in a few seconds")
     
     # Control Panel
     col1, col2, col3 = st.columns(3)
     
     with col1:
-        if st.button("🚀 Start Automation", type="primary"):
-            scheduler.start_automation()
-            st.success("🤖 CareerCrystal is now running autonomously!")
+        if st.button("🚀 Start Automation", type="primary", disabled=worker is None):
+            _report(client.start(), "🤖 CareerCrystal is now running autonomously!")
     
     with col2:
-        if st.button("⏸️ Pause Automation"):
-            scheduler.stop_automation()
-            st.warning("⏸️ Automation paused")
+        if st.button("⏸️ Pause Automation", disabled=worker is None):
+            _report(client.pause(), "⏸️ Automation paused", level="warning")
     
     with col3:
-        if st.button("🔄 Force Update"):
-            st.info("🔄 Running manual update...")
-            scheduler.scrape_jobs_task()
-            scheduler.analyze_market_task()
+        if st.button("🔄 Force Update", disabled=worker is None):
+            _report(client.run("scrape", "analyze"), "🔄 Manual update queued in the worker")
     
     # 📊 Status Dashboard
     st.markdown("### 📊 Automation Status")
     
-    status = scheduler.get_status()
+    journal = get_status_journal()
+    status = journal.status()
     
     # Status Overview
     status_col1, status_col2, status_col3, status_col4 = st.columns(4)
@@ -81,11 +92,14 @@ def render_automation_panel():
         """, unsafe_allow_html=True)
     
     with status_col3:
+        report_status = status.get('daily_report', {})
+        last_report = report_status.get('last_run', 'Never')
+        
         st.markdown(f"""
         <div style='background: rgba(200,230,201,0.3); padding: 15px; border-radius: 10px; text-align: center;'>
             <h3 style='color: #8B4C8C; margin: 0;'>📊 Reports</h3>
-            <p style='margin: 5px 0;'><strong>Status:</strong> Active</p>
-            <p style='margin: 5px 0;'><strong>Daily Reports:</strong> Auto-generated</p>
+            <p style='margin: 5px 0;'><strong>Status:</strong> {report_status.get('status', 'Inactive')}</p>
+            <p style='margin: 5px 0;'><strong>Last Report:</strong> {last_report[:16] if last_report != 'Never' else 'Never'}</p>
             <p style='margin: 5px 0;'><strong>Next Report:</strong> 09:00 AM</p>
         </div>
         """, unsafe_allow_html=True)
@@ -94,9 +108,9 @@ def render_automation_panel():
         st.markdown(f"""
         <div style='background: rgba(255,248,220,0.3); padding: 15px; border-radius: 10px; text-align: center;'>
             <h3 style='color: #8B4C8C; margin: 0;'>🌐 System</h3>
-            <p style='margin: 5px 0;'><strong>Uptime:</strong> {_calculate_uptime()}</p>
-            <p style='margin: 5px 0;'><strong>Health:</strong> ✅ Healthy</p>
-            <p style='margin: 5px 0;'><strong>Mode:</strong> Autonomous</p>
+            <p style='margin: 5px 0;'><strong>Uptime:</strong> {_calculate_uptime(worker)}</p>
+            <p style='margin: 5px 0;'><strong>Health:</strong> {'✅ Healthy' if worker else '⚠️ Worker offline'}</p>
+            <p style='margin: 5px 0;'><strong>Mode:</strong> {_worker_mode(worker)}</p>
         </div>
         """, unsafe_allow_html=True)
     
@@ -106,8 +120,8 @@ def render_automation_panel():
     schedule_data = {
         "Task": ["Job Scraping", "AI Analysis", "Daily Report", "Trend Update"],
         "Frequency": ["Every 1 hour", "Every 6 hours", "Daily at 9:00 AM", "Daily at 6:00 PM"],
-        "Next Run": ["In 23 mins", "In 2.5 hours", "Tomorrow 9:00 AM", "Today 6:00 PM"],
-        "Status": ["🟢 Active", "🟢 Active", "🟢 Active", "🟢 Active"]
+        "Next Run": [_next_run(worker, task) for task in ("scrape", "analyze", "report", "trends")],
+        "Status": [_task_status(worker, task) for task in ("scrape", "analyze", "report", "trends")]
     }
     
     schedule_df = pd.DataFrame(schedule_data)
@@ -124,6 +138,16 @@ def render_automation_panel():
     
     st.dataframe(schedule_df, use_container_width=True, hide_index=True)
     
+    # 📜 Run History
+    st.markdown("### 📜 Run History")
+    
+    history_task = st.selectbox("Task", list(JOURNAL_TASKS), format_func=JOURNAL_TASKS.get)
+    runs = journal.tail(history_task, n=20)
+    if runs:
+        st.dataframe(_history_frame(runs), use_container_width=True, hide_index=True)
+    else:
+        st.info("No runs recorded for this task yet.")
+    
     # 📈 Performance Metrics
     st.markdown("### 📈 Performance Metrics")
     
@@ -131,9 +155,6 @@ def render_automation_panel():
     
     with metrics_col1:
         # Jobs scraped over time (mock data)
-        import pandas as pd
-        import plotly.express as px
-        
         dates = pd.date_range(start="2025-09-15", end="2025-09-19", freq="D")
         jobs_scraped = [245, 312, 289, 401, 356]
         
@@ -173,10 +194,65 @@ def render_automation_panel():
             </div>
             """, unsafe_allow_html=True)
 
-def _calculate_uptime():
-    """Calculate system uptime"""
-    # This would be calculated from actual start time in production
-    return "2d 14h 32m"
+def _report(reply, message, level="success"):
+    """Show the worker's answer to a control command"""
+    if reply.get("ok"):
+        getattr(st, level)(message)
+    else:
+        st.error(f"❌ Worker error: {reply.get('error', 'unknown error')}")
+
+def _worker_mode(worker):
+    """Describe what the worker is doing right now"""
+    if worker is None:
+        return "Offline"
+    if worker.get("running_tasks"):
+        return f"Running {', '.join(worker['running_tasks'])}"
+    return "Autonomous" if worker.get("automation_running") else "Paused"
+
+def _history_frame(runs):
+    """Journal records as a table - fixed columns first, task-specific counters after"""
+    frame = pd.DataFrame(runs)
+    frame = frame.drop(columns=[c for c in ("recorded_at", "repost_clusters") if c in frame.columns])
+    if "last_run" in frame.columns:
+        frame["last_run"] = frame["last_run"].str[:19].str.replace("T", " ")
+    leading = [c for c in ("last_run", "status", "duration_seconds") if c in frame.columns]
+    frame = frame[leading + [c for c in frame.columns if c not in leading]]
+    return frame.rename(columns=lambda c: c.replace("_", " ").title())
+
+def _next_run(worker, task):
+    """Human-readable time until the task's next scheduled run"""
+    next_at = ((worker or {}).get("next_runs") or {}).get(task)
+    if not next_at:
+        return "—"
+    seconds = (datetime.fromisoformat(next_at) - datetime.now()).total_seconds()
+    if seconds < 60:
+        return "Now"
+    if seconds < 3600:
+        return f"In {int(seconds // 60)} mins"
+    if seconds < 86400:
+        return f"In {seconds / 3600:.1f} hours"
+    return datetime.fromisoformat(next_at).strftime("%a %H:%M")
+
+def _task_status(worker, task):
+    """Executor state of one task as reported by the worker"""
+    if worker is None:
+        return "⚪ Offline"
+    info = (worker.get("tasks") or {}).get(task, {})
+    if info.get("state") == "active":
+        return "🔵 Running"
+    last = info.get("last") or {}
+    if last.get("status") in ("error", "timeout"):
+        return f"🔴 Last run: {last['status']}"
+    return "🟢 Active" if worker.get("automation_running") else "⏸️ Paused"
+
+def _calculate_uptime(worker):
+    """Uptime of the automation worker process"""
+    if not worker or not worker.get("started_at"):
+        return "—"
+    seconds = int((datetime.now() - datetime.fromisoformat(worker["started_at"])).total_seconds())
+    days, seconds = divmod(seconds, 86400)
+    hours, seconds = divmod(seconds, 3600)
+    return f"{days}d {hours}h {seconds // 60}m"
 
 if __name__ == "__main__":
     render_automation_panel()
@@ -3,6 +3,16 @@ import plotly.express as px
 import pandas as pd
 from datetime import datetime, timedelta
 import json
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.analytics import get_corpus
+from utils.job_store import get_job_store
+from utils.timeseries import get_posting_timeseries
+from utils.figure_cache import downsample_frame, get_figure_cache
 
 def render_dashboard():
     """🏠 Main Dashboard Component - Real-time job market overview"""
@@ -54,31 +64,10 @@ def render_dashboard():
     # 📊 Market Trends Chart
     st.markdown("### 📈 Live Job Market Trends")
     
-    # Generate realistic sample data
-    dates = pd.date_range(start=datetime.now() - timedelta(days=30), end=datetime.now(), freq='D')
-    trend_data = pd.DataFrame({
-        'Date': dates,
-        'AI/ML Jobs': [200 + i*8 + (i%5)*15 for i in range(len(dates))],
-        'Data Science': [150 + i*6 + (i%4)*12 for i in range(len(dates))],
-        'Software Engineering': [300 + i*4 + (i%6)*18 for i in range(len(dates))],
-        'Product Management': [100 + i*3 + (i%7)*10 for i in range(len(dates))]
-    })
-    
-    fig = px.area(trend_data, x='Date', 
-                  y=['AI/ML Jobs', 'Data Science', 'Software Engineering', 'Product Management'],
-                  color_discrete_map={
-                      'AI/ML Jobs': '#FFB3D9',
-                      'Data Science': '#E6D7FF',
-                      'Software Engineering': '#C8E6C9',
-                      'Product Management': '#FFF8DC'
-                  })
-    
-    fig.update_layout(
-        plot_bgcolor='rgba(0,0,0,0)',
-        paper_bgcolor='rgba(255,255,255,0.9)',
-        font_color='#8B4C8C',
-        showlegend=True
-    )
+    # Rebuilt only when the rollups change (or a new day starts); otherwise the cached figure is reused
+    series = get_posting_timeseries()
+    params = {"days": 30, "until": series.bucket_start(datetime.now(), "day")}
+    fig = get_figure_cache().get("dashboard_trends", series.version(), params, build_trends_figure)
     
     st.plotly_chart(fig, use_container_width=True)
     
@@ -88,19 +77,9 @@ def render_dashboard():
     companies_col1, companies_col2 = st.columns(2)
     
     with companies_col1:
-        company_data = pd.DataFrame({
-            'Company': ['Google', 'Microsoft', 'Amazon', 'Meta', 'Apple'],
-            'Open Positions': [847, 692, 1203, 456, 378],
-            'Avg Salary': [165000, 142000, 138000, 158000, 172000]
-        })
-        
-        fig_companies = px.bar(company_data, x='Company', y='Open Positions',
-                              color='Open Positions', color_continuous_scale='Pinkyl')
-        fig_companies.update_layout(
-            plot_bgcolor='rgba(0,0,0,0)',
-            paper_bgcolor='rgba(255,255,255,0.9)',
-            font_color='#8B4C8C'
-        )
+        store = get_job_store()
+        fig_companies = get_figure_cache().get("top_companies", store.data_version(), {"n": 5},
+                                               lambda: build_companies_figure(store))
         st.plotly_chart(fig_companies, use_container_width=True)
     
     with companies_col2:
@@ -126,6 +105,56 @@ def render_dashboard():
         </div>
         """, unsafe_allow_html=True)
 
+def build_trends_figure():
+    """30-day posting trend per category from the day rollups"""
+    # Daily posting counts per category, straight from the precomputed rollups
+    trend_data = get_posting_timeseries().query(datetime.now() - timedelta(days=30), resolution="day")
+    trend_data = downsample_frame(trend_data)
+    trend_data = trend_data.reset_index().rename(columns={'Time': 'Date'})
+    
+    fig = px.area(trend_data, x='Date', 
+                  y=['AI/ML', 'Data Science', 'Software Engineering', 'Product Management'],
+                  color_discrete_map={
+                      'AI/ML': '#FFB3D9',
+                      'Data Science': '#E6D7FF',
+                      'Software Engineering': '#C8E6C9',
+                      'Product Management': '#FFF8DC'
+                  })
+    
+    fig.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(255,255,255,0.9)',
+        font_color='#8B4C8C',
+        showlegend=True
+    )
+    
+    return fig
+
+def build_companies_figure(store):
+    """Biggest hirers in the store (sample data until jobs are collected)"""
+    corpus = get_corpus(store)
+    top_companies = corpus.top_companies(5)
+    if top_companies:
+        company_data = pd.DataFrame({
+            'Company': list(top_companies),
+            'Open Positions': list(top_companies.values())
+        })
+    else:
+        company_data = pd.DataFrame({
+            'Company': ['Google', 'Microsoft', 'Amazon', 'Meta', 'Apple'],
+            'Open Positions': [847, 692, 1203, 456, 378],
+            'Avg Salary': [165000, 142000, 138000, 158000, 172000]
+        })
+    
+    fig_companies = px.bar(company_data, x='Company', y='Open Positions',
+                          color='Open Positions', color_continuous_scale='Pinkyl')
+    fig_companies.update_layout(
+        plot_bgcolor='rgba(0,0,0,0)',
+        paper_bgcolor='rgba(255,255,255,0.9)',
+        font_color='#8B4C8C'
+    )
+    return fig_companies
+
 if __name__ == "__main__":
     render_dashboard()
 
@@ -0,0 +1,72 @@
+import streamlit as st
+import html
+import time
+import sys
+import os
+
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.job_store import get_job_store
+from utils.search import get_search_index
+from utils.skills import skill_name
+
+def render_job_search():
+    """🔎 Job Search - keyword + semantic search over every stored posting"""
+
+    st.markdown("""
+    <div style='background: linear-gradient(90deg, #FFB3D9, #C8E6C9); padding: 20px; border-radius: 15px; margin-bottom: 30px;'>
+        <h1 style='color: white; text-align: center; margin: 0;'>🔎 Job Search</h1>
+        <p style='color: white; text-align: center; margin: 5px 0 0 0;'>Find roles by title, skill, company or location</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    store = get_job_store()
+    index = get_search_index()
+
+    # The automation worker builds the index on startup and keeps it current after every scrape -
+    # the page only reads what it persisted, never indexes the whole store itself
+    if not len(index) and store.count():
+        st.info("⏳ The search index is still being built by the automation worker - check back in a moment. "
+                "If the worker isn't running, start it from the 🤖 Automation Center.")
+        return
+
+    col1, col2 = st.columns([4, 1])
+    with col1:
+        query = st.text_input("Search jobs", placeholder="e.g. remote python ML", key="job_search_query")
+    with col2:
+        limit = st.selectbox("Results", [10, 20, 50], index=1, key="job_search_limit")
+
+    if not query.strip():
+        st.info(f"💡 {len(index):,} postings indexed - try a skill, title or location")
+        return
+
+    try:
+        started = time.perf_counter()
+        results = index.search(query, limit=limit, store=store)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+    except Exception as e:
+        st.error(f"❌ Search failed: {str(e)}")
+        return
+
+    st.caption(f"{len(results)} results in {elapsed_ms:.0f} ms")
+    if not results:
+        st.warning("No matching jobs found. Try fewer or broader terms.")
+        return
+
+    for job in results:
+        display_search_result(job)
+
+def display_search_result(job):
+    """Display one search hit"""
+    # Postings are scraped from third-party pages - escape every field before it goes into markup
+    skills = ", ".join(html.escape(skill_name(skill)) for skill in job.get('skills', [])[:8])
+
+    st.markdown(f"""
+    <div style='background: rgba(255,255,255,0.9); padding: 15px 20px; border-radius: 15px; margin-bottom: 12px; border-left: 4px solid #FFB3D9;'>
+        <h4 style='color: #8B4C8C; margin: 0;'>{html.escape(str(job.get('title') or 'Untitled role'))}</h4>
+        <p style='color: #8B4C8C; margin: 5px 0;'>🏢 {html.escape(str(job.get('company') or 'Unknown'))} • 📍 {html.escape(str(job.get('location') or 'n/a'))} • 💰 {html.escape(str(job.get('salary') or 'n/a'))}</p>
+        <p style='color: #666; margin: 5px 0; font-size: 0.9rem;'>🎯 {skills or 'No skills listed'}</p>
+        <p style='margin: 0; font-size: 0.8rem; color: #999;'>Match {job['search_score']:.3f} • {html.escape(str(job.get('source', '')))}</p>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,91 @@
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+# Tests import the app's modules the same way the pages do
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from utils.http_client import PooledHttpClient
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Fresh SQLite database file for one test"""
+    return str(tmp_path / "careercrystal.db")
+
+
+@pytest.fixture
+def job():
+    """Factory for a minimal posting"""
+    def make(title="Data Engineer", company="Acme", location="Remote", **fields):
+        posting = {"title": title, "company": company, "location": location,
+                   "salary": "$100K - $120K", "skills": ["python"], "posted_date": "2026-10-01",
+                   "source": "test"}
+        posting.update(fields)
+        return posting
+    return make
+
+
+# A two-posting page in the shape of SELECTOR_SPECS["remoteok"]
+LISTING = """<table>
+<tr class="job"><td><h2>Go Developer</h2><h3>Gopher Inc</h3><div class="location">Remote</div>
+<a class="tag">Golang</a></td></tr>
+<tr class="job"><td><h2>ML Engineer</h2><h3>Tensor Ltd</h3><div class="location">London</div>
+<a class="tag">PyTorch</a></td></tr>
+</table>""".encode()
+
+
+class StubListing(BaseHTTPRequestHandler):
+    """Serves LISTING with an ETag, answering matching conditional GETs with 304"""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append(self.headers.get("If-None-Match"))
+            failing = server.failures > 0
+            server.failures -= 1
+        if failing:
+            self.send_response(503)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == server.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("ETag", server.etag)
+        self.send_header("Content-Length", str(len(server.body)))
+        self.end_headers()
+        self.wfile.write(server.body)
+
+
+@pytest.fixture
+def listing_server():
+    """Local listing page with an ETag - records each request's If-None-Match, fails the first `failures` with 503"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubListing)
+    server.lock = threading.Lock()
+    server.requests = []
+    server.failures = 0
+    server.etag = '"v1"'
+    server.body = LISTING
+    threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True).start()
+    server.url = f"http://127.0.0.1:{server.server_port}/jobs"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def http(tmp_path):
+    """Pooled client with a throwaway response cache and no retry sleeps"""
+    client = PooledHttpClient(cache_dir=str(tmp_path / "http_cache"), backoff_factor=0)
+    yield client
+    client.close()
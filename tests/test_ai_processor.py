@@ -0,0 +1,74 @@
+import json
+
+import pytest
+
+from utils.ai_processor import (MAP_REDUCE_PROMPT, SHARD_MERGE_PROMPT, SHARD_SUMMARY_PROMPT, CareerCrystalAI,
+                                estimate_tokens)
+from utils.llm_cache import LLMResponseCache
+
+NOTES = "Hiring is steady across teams with a clear tilt towards platform and data work. " * 3
+
+
+class StubLLM:
+    """Answers every prompt with a shard-shaped (or final) JSON analysis and records what it was sent"""
+
+    def __init__(self):
+        self.prompts = []
+
+    def complete_many_sync(self, prompts, **kwargs):
+        self.prompts.extend(prompts)
+        return [json.dumps(self._reply(prompt)) for prompt in prompts]
+
+    @staticmethod
+    def _reply(prompt):
+        if prompt.startswith(MAP_REDUCE_PROMPT.split("{")[0]):
+            return {"trend_analysis": "steady", "hot_skills": ["Python"], "salary_insights": "flat",
+                    "growth_prediction": "up", "recommendations": ["learn SQL"]}
+        return {"segment": "slice", "key_trends": NOTES, "hot_skills": ["Python", "SQL"], "salary_notes": NOTES}
+
+
+@pytest.fixture
+def ai(monkeypatch, db_path):
+    monkeypatch.setenv("OPENAI_API_KEY", "key")
+    monkeypatch.setenv("OPENAI_BASE_URL", "http://127.0.0.1:9/v1")
+    monkeypatch.setenv("CAREERCRYSTAL_REDUCE_TOKEN_BUDGET", "600")
+    ai = CareerCrystalAI()
+    ai.llm = StubLLM()
+    ai.cache = LLMResponseCache(db_path)
+    shards = [(f"category-{i}", f"Segment: category-{i}\nJobs: 10") for i in range(12)]
+    monkeypatch.setattr(ai, "_build_shards", lambda corpus: shards)
+    return ai
+
+
+def _templates(prompts):
+    prefixes = {template.split("{")[0]: template for template in
+                (SHARD_SUMMARY_PROMPT, SHARD_MERGE_PROMPT, MAP_REDUCE_PROMPT)}
+    return [next(t for prefix, t in prefixes.items() if prompt.startswith(prefix)) for prompt in prompts]
+
+
+def test_reduce_merges_level_by_level_within_the_budget(ai):
+    analysis = ai._map_reduce_analysis(["posting"] * 120)
+    assert analysis["shards_analyzed"] == 12
+    assert analysis["reduce_levels"] >= 1
+    assert analysis["trend_analysis"] == "steady"
+
+    templates = _templates(ai.llm.prompts)
+    assert templates.count(MAP_REDUCE_PROMPT) == 1
+    assert templates.count(SHARD_MERGE_PROMPT) >= 2
+    for prompt, template in zip(ai.llm.prompts, templates):
+        if template is not SHARD_SUMMARY_PROMPT:
+            assert estimate_tokens(prompt) <= ai.reduce_token_budget
+
+
+def test_small_reduce_needs_no_merge_level(ai, monkeypatch):
+    monkeypatch.setattr(ai, "reduce_token_budget", 100_000)
+    analysis = ai._map_reduce_analysis(["posting"] * 120)
+    assert analysis["reduce_levels"] == 0
+    assert SHARD_MERGE_PROMPT not in _templates(ai.llm.prompts)
+
+
+def test_repeat_run_is_answered_from_the_cache(ai):
+    ai._map_reduce_analysis(["posting"] * 120)
+    sent = len(ai.llm.prompts)
+    ai._map_reduce_analysis(["posting"] * 120)
+    assert len(ai.llm.prompts) == sent
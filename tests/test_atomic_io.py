@@ -0,0 +1,28 @@
+import os
+
+from utils.atomic_io import atomic_write_json, read_json
+
+
+def test_write_then_read_round_trips(tmp_path):
+    path = str(tmp_path / "data" / "jobs.json")
+    atomic_write_json(path, {"jobs": [1, 2]})
+    assert read_json(path) == {"jobs": [1, 2]}
+    assert [name for name in os.listdir(tmp_path / "data") if name.endswith(".tmp")] == []
+
+
+def test_missing_or_corrupt_files_fall_back_to_the_default(tmp_path):
+    path = tmp_path / "jobs.json"
+    assert read_json(str(path), default=[]) == []
+    path.write_text('{"jobs": [1, ')
+    assert read_json(str(path), default=[]) == []
+
+
+def test_failed_write_keeps_the_previous_document(tmp_path):
+    path = str(tmp_path / "jobs.json")
+    atomic_write_json(path, {"jobs": [1]})
+    try:
+        atomic_write_json(path, {"jobs": {1, 2}})  # Sets aren't JSON
+    except TypeError:
+        pass
+    assert read_json(path) == {"jobs": [1]}
+    assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
@@ -0,0 +1,41 @@
+import threading
+import time
+
+from utils.atomic_io import atomic_write_json
+from utils.data_access import VersionedCache, load_json
+
+
+def test_eviction_does_not_let_a_second_load_start():
+    cache = VersionedCache(max_entries=1)
+    cache.get_or_load("a", 1, lambda: "a1")
+    release, loads = threading.Event(), []
+
+    def slow_load():
+        loads.append(1)
+        release.wait(5)
+        return "a2"
+
+    first = threading.Thread(target=cache.get_or_load, args=("a", 2, slow_load))
+    first.start()
+    while not loads:
+        time.sleep(0.01)
+    cache.get_or_load("b", 1, lambda: "b1")  # Evicts "a" while its reload is in flight
+
+    second = threading.Thread(target=cache.get_or_load, args=("a", 2, slow_load))
+    second.start()
+    time.sleep(0.05)
+    release.set()
+    first.join(5)
+    second.join(5)
+    assert len(loads) == 1
+    assert cache._key_locks == {}
+
+
+def test_load_json_rereads_only_after_a_change(tmp_path):
+    path = str(tmp_path / "analysis.json")
+    assert load_json(path, default={}) == {}
+    atomic_write_json(path, {"v": 1})
+    first = load_json(path)
+    assert load_json(path) is first
+    atomic_write_json(path, {"v": 2, "more": True})
+    assert load_json(path) == {"v": 2, "more": True}
@@ -0,0 +1,101 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from utils.dedup import FingerprintIndex
+from utils.job_store import SQLiteJobStore, job_key
+
+
+def scrape(index, store, postings):
+    """The scheduler's scrape pipeline without the near-duplicate stage"""
+    seen, staged = {}, {}
+    result = store.upsert_jobs(index.filter_new(postings, on_seen=seen.update, staged=staged))
+    index.commit(staged)
+    return result, store.refresh_jobs(seen)
+
+
+def age(index, store, days):
+    stamp = (datetime.now() - timedelta(days=days)).isoformat()
+    with store.transaction() as conn:
+        conn.execute("UPDATE jobs SET first_seen = ?, last_seen = ?", (stamp, stamp))
+    with index.transaction() as conn:
+        conn.execute("UPDATE job_fingerprints SET first_seen = ?, last_seen = ?", (stamp, stamp))
+
+
+def test_filter_new_drops_repeats_and_reports_resightings(db_path, job):
+    index = FingerprintIndex(db_path)
+    stats = {}
+    staged = {}
+    assert len(list(index.filter_new([job(), job(title="DATA engineer!")], stats=stats, staged=staged))) == 1
+    assert stats == {"checked": 2, "new": 1, "seen": 0}
+    index.commit(staged)
+
+    seen = {}
+    assert list(index.filter_new([job(title="Data  Engineer")], on_seen=seen.update)) == []
+    assert list(seen) == [job_key(job())]  # The first sighting's key, not the new spelling's
+
+
+def test_postings_still_listed_survive_expiry(db_path, job):
+    index = FingerprintIndex(db_path, max_age_days=30)
+    store = SQLiteJobStore(db_path, legacy_json=None)
+    postings = [job(), job(title="Analyst")]
+    scrape(index, store, postings)
+    age(index, store, 31)
+
+    # Sources still return the same postings, so nothing may expire
+    scrape(index, store, postings)
+    assert store.expire_jobs(30) == 0
+    assert index.expire() == 0
+    assert store.count() == 2
+
+
+def test_postings_gone_from_sources_expire(db_path, job):
+    index = FingerprintIndex(db_path, max_age_days=30)
+    store = SQLiteJobStore(db_path, legacy_json=None)
+    scrape(index, store, [job(), job(title="Analyst")])
+    age(index, store, 31)
+
+    scrape(index, store, [job()])
+    assert store.expire_jobs(30) == 1
+    assert index.expire() == 1
+    assert [j["title"] for j in store.iter_jobs()] == ["Data Engineer"]
+
+
+def test_resighted_posting_picks_up_edits_under_its_stored_key(db_path, job):
+    index = FingerprintIndex(db_path)
+    store = SQLiteJobStore(db_path, legacy_json=None)
+    scrape(index, store, [job()])
+
+    _, updated = scrape(index, store, [job(title="Data Engineer.", salary="$150K - $170K")])
+    assert len(updated) == 1
+    assert store.count() == 1
+    stored = next(store.iter_jobs())
+    assert stored["salary"] == "$150K - $170K"
+    assert stored["title"] == "Data Engineer"  # Still named by its original key
+
+
+def test_refresh_ignores_postings_the_store_never_kept(db_path, job):
+    store = SQLiteJobStore(db_path, legacy_json=None)
+    assert store.refresh_jobs({job_key(job(title="Analyst")): job(title="Analyst")}) == []
+    assert store.count() == 0
+
+
+def test_failed_store_write_leaves_postings_unseen(db_path, job, monkeypatch):
+    index = FingerprintIndex(db_path)
+    store = SQLiteJobStore(db_path, legacy_json=None)
+    upsert = store.upsert_jobs
+
+    def fail_once(jobs):
+        list(jobs)
+        monkeypatch.setattr(store, "upsert_jobs", upsert)
+        raise RuntimeError("disk full")
+
+    monkeypatch.setattr(store, "upsert_jobs", fail_once)
+    with pytest.raises(RuntimeError):
+        scrape(index, store, [job()])
+    assert len(index) == 0
+
+    result, _ = scrape(index, store, [job()])
+    assert len(result["inserted"]) == 1
+    assert store.count() == 1
+    assert len(index) == 1
@@ -0,0 +1,72 @@
+import threading
+import time
+
+import pytest
+
+from automation.executor import TaskExecutor, checkpoint
+
+
+@pytest.fixture
+def executor():
+    executor = TaskExecutor(max_workers=4)
+    yield executor
+    executor.shutdown(wait=True)
+
+
+def test_a_running_task_is_not_started_twice(executor):
+    release, calls = threading.Event(), []
+    executor.register("scrape", lambda: calls.append(1) or release.wait(5))
+    first = executor.submit("scrape")
+    assert executor.submit("scrape") is first
+    release.set()
+    first.result(5)
+    assert calls == [1]
+    executor.submit("scrape").result(5)
+    assert calls == [1, 1]
+
+
+def test_dependent_task_waits_for_its_dependency(executor):
+    order = []
+    executor.register("scrape", lambda: time.sleep(0.1) or order.append("scrape"))
+    executor.register("analyze", lambda: order.append("analyze"), after=["scrape"])
+    futures = executor.run("analyze", "scrape")
+    futures["analyze"].result(5)
+    assert order == ["scrape", "analyze"]
+
+
+def test_unknown_dependency_is_rejected(executor):
+    with pytest.raises(ValueError):
+        executor.register("analyze", lambda: None, after=["scrape"])
+
+
+def _spin():
+    while True:
+        checkpoint()
+        time.sleep(0.01)
+
+
+def test_deadline_stops_the_task_at_a_checkpoint(executor):
+    executor.register("slow", _spin, deadline=0.1)
+    executor.submit("slow").result(5)
+    assert executor.snapshot()["slow"]["last"]["status"] == "timeout"
+
+
+def test_cancel_stops_a_running_task(executor):
+    started = threading.Event()
+    executor.register("slow", lambda: started.set() or _spin())
+    future = executor.submit("slow")
+    assert started.wait(5)
+    assert executor.cancel("slow")
+    future.result(5)
+    assert executor.snapshot()["slow"]["last"]["status"] == "cancelled"
+    assert executor.running() == []
+
+
+def test_failures_are_recorded_and_raised(executor):
+    def boom():
+        raise RuntimeError("no network")
+    executor.register("scrape", boom)
+    with pytest.raises(RuntimeError):
+        executor.submit("scrape").result(5)
+    last = executor.snapshot()["scrape"]["last"]
+    assert (last["status"], last["error"]) == ("error", "no network")
@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import plotly.graph_objects as go
+
+from utils.figure_cache import FigureCache, downsample_frame, lttb_indices
+
+
+def test_figures_are_built_once_per_version():
+    cache = FigureCache()
+    builds = []
+
+    def build():
+        builds.append(1)
+        return go.Figure(go.Bar(x=["a"], y=[1]))
+
+    first = cache.get("chart", 1, {"n": 5}, build)
+    assert isinstance(first, go.Figure)
+    assert cache.get("chart", 1, {"n": 5}, build) is first
+    assert cache.get("chart", 2, {"n": 5}, build) is not first
+    cache.get("chart", None, {"n": 5}, build)  # Unknown version always rebuilds
+    assert len(builds) == 3
+
+
+def test_lttb_keeps_endpoints_and_peaks():
+    y = np.zeros(1000)
+    y[500] = 10
+    picked = lttb_indices(np.arange(1000), y, 50)
+    assert len(picked) == 50
+    assert picked[0] == 0 and picked[-1] == 999 and 500 in picked
+
+
+def test_downsample_frame_respects_the_point_budget():
+    index = pd.date_range("2026-01-01", periods=5000, freq="min")
+    frame = pd.DataFrame({"jobs": np.sin(np.arange(5000) / 50), "flat": 1.0}, index=index)
+    small = downsample_frame(frame, max_points=400)
+    assert len(small) <= 400
+    assert small.index[0] == index[0] and small.index[-1] == index[-1]
+    assert len(downsample_frame(frame.head(10), max_points=400)) == 10
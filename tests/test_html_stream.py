@@ -0,0 +1,56 @@
+from utils.html_stream import SELECTOR_SPECS, iter_jobs_from_chunks
+
+SPEC = SELECTOR_SPECS["remoteok"]
+
+PAGE = """
+<table>
+  <tr class="job" data-id="1">
+    <td><h2>Senior Python Engineer</h2><h3>Acme &amp; Co</h3>
+      <div class="location">🌏 Remote</div><div class="location">💰 $120k - $150k</div>
+      <a class="tag">python</a><a class="tag">aws</a><br><img src="logo.png"/>
+    </td>
+  </tr>
+  <tr class="job"><td><h3>No title, skipped</h3></td></tr>
+  <tr class="job">
+    <td><h2>Data   Analyst</h2><h3>Beta</h3><div class="location">Berlin
+  </tr>
+</table>
+"""
+
+
+def chunked(text, size):
+    return (text[i:i + size] for i in range(0, len(text), size))
+
+
+def test_extracts_fields_entities_and_many():
+    jobs = list(iter_jobs_from_chunks([PAGE], SPEC))
+    assert [job["title"] for job in jobs] == ["Senior Python Engineer", "Data Analyst"]
+    first = jobs[0]
+    assert first["company"] == "Acme & Co"
+    assert first["location"] == "🌏 Remote"
+    assert first["salary"] == "💰 $120k - $150k"
+    assert first["skills"] == ["python", "aws"]
+
+
+def test_unclosed_children_still_close_with_their_posting():
+    last = list(iter_jobs_from_chunks([PAGE], SPEC))[-1]
+    assert last == {"title": "Data Analyst", "company": "Beta", "location": "Berlin"}
+
+
+def test_chunk_boundaries_do_not_change_the_result():
+    expected = list(iter_jobs_from_chunks([PAGE], SPEC))
+    for size in (1, 7, 64):
+        assert list(iter_jobs_from_chunks(chunked(PAGE, size), SPEC)) == expected
+
+
+def test_postings_are_yielded_before_the_page_ends():
+    seen_chunks = []
+
+    def chunks():
+        for chunk in chunked(PAGE, 32):
+            seen_chunks.append(chunk)
+            yield chunk
+
+    jobs = iter_jobs_from_chunks(chunks(), SPEC)
+    next(jobs)
+    assert len("".join(seen_chunks)) < len(PAGE)
@@ -0,0 +1,31 @@
+def test_fetch_revalidates_with_etag_and_serves_cache_on_304(http, listing_server):
+    assert http.fetch(listing_server.url) == (listing_server.body.decode(), True)
+    assert http.fetch(listing_server.url) == (listing_server.body.decode(), False)
+    assert listing_server.requests == [None, '"v1"']
+
+
+def test_changed_page_replaces_the_cached_body(http, listing_server):
+    http.fetch(listing_server.url)
+    listing_server.etag, listing_server.body = '"v2"', b"<p>new</p>"
+    assert http.fetch(listing_server.url) == ("<p>new</p>", True)
+    assert http.fetch(listing_server.url) == ("<p>new</p>", False)
+
+
+def test_stream_tees_into_the_cache_and_replays_it(http, listing_server):
+    assert "".join(http.stream(listing_server.url, chunk_size=16)) == listing_server.body.decode()
+    assert "".join(http.stream(listing_server.url, chunk_size=16)) == listing_server.body.decode()
+    assert listing_server.requests == [None, '"v1"']
+
+
+def test_abandoned_stream_leaves_no_cache_entry(http, listing_server):
+    chunks = http.stream(listing_server.url, chunk_size=16)
+    next(chunks)
+    chunks.close()
+    http.fetch(listing_server.url)
+    assert listing_server.requests == [None, None]
+
+
+def test_server_errors_are_retried(http, listing_server):
+    listing_server.failures = 2
+    assert http.fetch(listing_server.url)[1] is True
+    assert len(listing_server.requests) == 3
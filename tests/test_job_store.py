@@ -0,0 +1,76 @@
+import json
+
+from utils.job_store import JSONJobStore, SQLiteJobStore
+
+
+def test_upsert_inserts_then_updates_changed_postings(db_path, job):
+    store = SQLiteJobStore(db_path, legacy_json=None)
+    first = store.upsert_jobs([job(salary="$100K - $120K")])
+    assert len(first["inserted"]) == 1 and first["updated"] == []
+
+    again = store.upsert_jobs([job(salary="$100K - $120K")])
+    assert again["inserted"] == [] and again["updated"] == []
+
+    edited = store.upsert_jobs([job(salary="$130K - $150K", skills=["sql"])])
+    assert len(edited["updated"]) == 1
+    stored = list(store.iter_jobs())
+    assert len(stored) == 1
+    assert stored[0]["salary"] == "$130K - $150K"
+    assert store.count(skill="sql") == 1 and store.count(skill="python") == 0
+
+
+def test_update_moves_trend_aggregates(db_path, job):
+    store = SQLiteJobStore(db_path, legacy_json=None)
+    store.upsert_jobs([job(skills=["python"])])
+    store.upsert_jobs([job(skills=["rust"])])
+    summary = store.trend_summary()
+    assert summary["total_jobs"] == 1
+    assert summary["top_skills"] == {"rust": 1}
+
+
+def test_legacy_import_retries_after_failed_attempt(tmp_path, db_path, job, monkeypatch):
+    legacy = tmp_path / "jobs_database.json"
+    legacy.write_text(json.dumps({"jobs": [job(), job(title="Analyst")]}))
+
+    def crash(*args, **kwargs):
+        raise RuntimeError("killed mid-import")
+
+    monkeypatch.setattr(SQLiteJobStore, "_upsert_batch", crash)
+    try:
+        SQLiteJobStore(db_path, legacy_json=str(legacy))
+    except RuntimeError:
+        pass
+    monkeypatch.undo()
+
+    store = SQLiteJobStore(db_path, legacy_json=str(legacy))
+    assert store.count() == 2
+    assert store.get_meta("legacy_json_imported")
+
+
+def test_json_store_updates_changed_postings(tmp_path, job):
+    store = JSONJobStore(str(tmp_path / "jobs.json"))
+    store.upsert_jobs([job()])
+    result = store.upsert_jobs([job(salary="$1M"), job(title="Analyst")])
+    assert len(result["inserted"]) == 1 and len(result["updated"]) == 1
+    assert {j["title"]: j["salary"] for j in store.iter_jobs()}["Data Engineer"] == "$1M"
+
+
+def test_data_version_moves_on_every_mutation(db_path, job):
+    store = SQLiteJobStore(db_path, legacy_json=None)
+    versions = [store.data_version()]
+
+    store.upsert_jobs([job()])
+    versions.append(store.data_version())
+    store.upsert_jobs([job()])  # Unchanged re-sighting - nothing to invalidate
+    assert store.data_version() == versions[-1]
+
+    store.upsert_jobs([job(salary="$1M")])
+    versions.append(store.data_version())
+    store.rewrite_skills(lambda posting: ["rust"])
+    versions.append(store.data_version())
+    with store.transaction() as conn:
+        conn.execute("UPDATE jobs SET last_seen = '2000-01-01'")
+    store.expire_jobs(30)
+    versions.append(store.data_version())
+
+    assert len(set(versions)) == len(versions)
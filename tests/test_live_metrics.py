@@ -0,0 +1,48 @@
+import json
+import os
+
+import pytest
+
+from utils.job_store import SQLiteJobStore
+from utils.live_metrics import LiveMetrics, empty_live_metrics
+
+
+@pytest.fixture
+def metrics(tmp_path, monkeypatch):
+    live = LiveMetrics(str(tmp_path / "live_metrics.json"))
+    # Pages must never compute metrics themselves
+    monkeypatch.setattr(live, "refresh", lambda *args, **kwargs: pytest.fail("snapshot() refreshed"))
+    return live
+
+
+def test_missing_snapshot_is_empty_not_recomputed(metrics):
+    assert metrics.snapshot() == empty_live_metrics()
+
+
+def test_persisted_snapshot_is_kept_as_last_good(metrics):
+    with open(metrics.path, "w") as f:
+        json.dump({**empty_live_metrics(), "jobs_today": 7, "updated_at": "2026-10-18T09:00:00"}, f)
+    assert metrics.snapshot()["jobs_today"] == 7
+
+    os.remove(metrics.path)
+    assert metrics.snapshot()["jobs_today"] == 7
+
+
+def test_corrupt_snapshot_falls_back_to_last_good(metrics):
+    with open(metrics.path, "w") as f:
+        json.dump({**empty_live_metrics(), "jobs_today": 3, "updated_at": "2026-10-18T09:00:00"}, f)
+    metrics.snapshot()
+    with open(metrics.path, "w") as f:
+        f.write("{not json")
+    assert metrics.snapshot()["jobs_today"] == 3
+
+
+def test_refresh_publishes_for_other_processes(tmp_path, db_path, job):
+    store = SQLiteJobStore(db_path, legacy_json=None)
+    store.upsert_jobs([job(), job(title="ML Engineer", skills=["pytorch"])])
+    worker = LiveMetrics(str(tmp_path / "live_metrics.json"))
+    published = worker.refresh(store, status={"job_scraping": {"new_jobs": 2, "last_run": "2026-10-18T08:00:00"}})
+    assert published["total_jobs"] == 2 and published["new_jobs_last_scrape"] == 2
+
+    page = LiveMetrics(worker.path)
+    assert page.snapshot()["total_jobs"] == 2
@@ -0,0 +1,111 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils.ai_processor import CareerCrystalAI
+from utils.llm_client import AsyncLLMClient, get_llm_client
+
+
+class StubCompletions(BaseHTTPRequestHandler):
+    """Minimal OpenAI-compatible chat completions endpoint"""
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, status, body, content_type="application/json", headers=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server = self.server
+        with server.lock:
+            server.requests += 1
+            throttled = server.failures > 0
+            server.failures -= 1
+        if throttled:
+            error = {"error": {"message": "slow down", "type": "rate_limit"}}
+            return self._send(429, json.dumps(error).encode(), headers={"retry-after": "0"})
+
+        prompt = request["messages"][0]["content"]
+        if request.get("stream"):
+            events = [{"id": "c", "object": "chat.completion.chunk", "created": 0, "model": "stub",
+                       "choices": [{"index": 0, "delta": {"content": word}, "finish_reason": None}]}
+                      for word in ("echo: ", prompt)]
+            body = "".join(f"data: {json.dumps(event)}\n\n" for event in events) + "data: [DONE]\n\n"
+            return self._send(200, body.encode(), content_type="text/event-stream")
+
+        reply = {"id": "c", "object": "chat.completion", "created": 0, "model": "stub",
+                 "choices": [{"index": 0, "finish_reason": "stop",
+                              "message": {"role": "assistant", "content": f"echo: {prompt}"}}]}
+        self._send(200, json.dumps(reply).encode())
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubCompletions)
+    server.lock = threading.Lock()
+    server.requests = 0
+    server.failures = 0
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(stub_server):
+    llm = AsyncLLMClient("test-key", base_url=f"http://127.0.0.1:{stub_server.server_port}/v1",
+                         requests_per_minute=6000, timeout=5, max_retries=3, backoff_base=0.01)
+    yield llm
+    llm.close()
+
+
+def test_complete_and_fan_out(client):
+    assert client.complete_sync("hi") == "echo: hi"
+    assert client.complete_many_sync(["a", "b", "c"]) == ["echo: a", "echo: b", "echo: c"]
+
+
+def test_stream_yields_deltas(client):
+    assert list(client.stream_sync("hi")) == ["echo: ", "hi"]
+
+
+def test_rate_limited_requests_are_retried(client, stub_server):
+    stub_server.failures = 2
+    assert client.complete_sync("again") == "echo: again"
+    assert stub_server.requests == 3
+
+
+def test_retries_give_up_after_max_retries(client, stub_server):
+    stub_server.failures = 10
+    with pytest.raises(Exception):
+        client.complete_sync("never")
+    assert stub_server.requests == client.max_retries + 1
+
+
+def test_close_stops_the_loop_thread_and_allows_reuse(client):
+    assert client.complete_sync("one") == "echo: one"
+    thread = client._thread
+    client.close()
+    assert not thread.is_alive()
+    assert client.complete_sync("two") == "echo: two"
+
+
+def test_get_llm_client_is_shared_per_configuration():
+    first = get_llm_client("key", model="m", base_url="http://127.0.0.1:9/v1")
+    assert get_llm_client("key", model="m", base_url="http://127.0.0.1:9/v1") is first
+    assert get_llm_client("other", model="m", base_url="http://127.0.0.1:9/v1") is not first
+
+
+def test_ai_instances_reuse_one_client(monkeypatch):
+    monkeypatch.setenv("OPENAI_API_KEY", "key")
+    monkeypatch.setenv("OPENAI_BASE_URL", "http://127.0.0.1:9/v1")
+    assert CareerCrystalAI().llm is CareerCrystalAI().llm
@@ -0,0 +1,103 @@
+from datetime import datetime, timedelta
+
+from utils.job_store import job_key
+from utils.near_dedup import MinHasher, NearDuplicateIndex, job_shingles
+
+DESCRIPTION = (
+    "Join our platform team to build reliable data pipelines in Python and SQL. You will own batch and "
+    "streaming jobs, work closely with analysts, review code, improve observability and help shape the "
+    "roadmap for our warehouse. We value curiosity, clear writing and pragmatic engineering decisions "
+    "across a friendly distributed team with generous learning budgets and flexible hours."
+)
+
+
+def jaccard(a, b):
+    return len(a & b) / len(a | b)
+
+
+def scrape(index, jobs):
+    """Filter, then commit as the scheduler does once the store write succeeded"""
+    staged = {}
+    unique = list(index.filter_unique(jobs, staged=staged))
+    index.commit(staged)
+    return unique
+
+
+def test_internship_does_not_merge_with_the_full_time_role(db_path, job):
+    full_time = job(title="Software Engineer", description=DESCRIPTION, source="board-a")
+    intern = job(title="Software Engineer Intern", description=DESCRIPTION, source="board-b")
+    assert jaccard(job_shingles(full_time), job_shingles(intern)) < 0.75
+
+    index = NearDuplicateIndex(db_path, threshold=0.8)
+    assert len(list(index.filter_unique([full_time, intern]))) == 2
+
+
+def test_reposts_across_boards_still_cluster(db_path, job):
+    original = job(title="Senior Data Engineer", location="Remote", description=DESCRIPTION, source="board-a")
+    repost = job(title="Sr. Data Engineer", location="Remote, US", description=DESCRIPTION, source="board-b")
+    stats = {}
+    index = NearDuplicateIndex(db_path, threshold=0.8)
+    assert list(index.filter_unique([original, repost], stats=stats)) == [original]
+    assert stats["near_duplicates"] == 1
+
+
+def test_location_separates_otherwise_identical_postings(job):
+    berlin = job_shingles(job(title="Barista", company="Beans", location="Berlin"))
+    lisbon = job_shingles(job(title="Barista", company="Beans", location="Lisbon"))
+    assert berlin != lisbon
+
+
+def test_long_descriptions_are_sampled_consistently(job):
+    long_description = " ".join(f"word{i}" for i in range(500))
+    shingles = job_shingles(job(description=long_description), max_description=32)
+    assert sum(1 for s in shingles if s.startswith("d:")) == 32
+    assert shingles == job_shingles(job(description=long_description), max_description=32)
+
+
+def _age(index, days):
+    stamp = (datetime.now() - timedelta(days=days)).isoformat()
+    with index.transaction() as conn:
+        conn.execute("UPDATE minhash_signatures SET seen_at = ?", (stamp,))
+        conn.execute("UPDATE near_duplicates SET seen_at = ?", (stamp,))
+
+
+def test_repost_keeps_its_cluster_alive(db_path, job):
+    index = NearDuplicateIndex(db_path)
+    original = job(description=DESCRIPTION, source="board-a")
+    scrape(index, [original])
+    _age(index, 31)
+
+    scrape(index, [job(location="Remote, US", description=DESCRIPTION, source="board-b")])
+    assert index.expire(30) == 0
+    assert index.cluster_stats()["indexed_jobs"] == 1
+
+
+def test_touch_refreshes_resighted_postings_and_their_clusters(db_path, job):
+    index = NearDuplicateIndex(db_path)
+    original = job(description=DESCRIPTION, source="board-a")
+    repost = job(location="Remote, US", description=DESCRIPTION, source="board-b")
+    scrape(index, [original, repost])
+    _age(index, 31)
+
+    # Only the repost is still listed - its cluster's signature must survive
+    index.touch([job_key(repost)])
+    assert index.expire(30) == 0
+    assert index.cluster_stats()["duplicates_suppressed"] == 1
+
+
+def test_aborted_scrape_leaves_no_phantom_signatures(db_path, job):
+    index = NearDuplicateIndex(db_path)
+    original = job(description=DESCRIPTION, source="board-a")
+    list(index.filter_unique([original]))  # The store write never happened
+    assert index.cluster_stats()["indexed_jobs"] == 0
+
+    repost = job(location="Remote, US", description=DESCRIPTION, source="board-b")
+    assert scrape(index, [repost]) == [repost]
+    assert index.cluster_stats()["duplicates_suppressed"] == 0
+
+
+def test_minhash_estimates_jaccard(job):
+    hasher = MinHasher(num_perm=256)
+    a = job_shingles(job(title="Software Engineer", description=DESCRIPTION))
+    b = job_shingles(job(title="Software Engineer Intern", description=DESCRIPTION))
+    assert abs(MinHasher.similarity(hasher.signature(a), hasher.signature(b)) - jaccard(a, b)) < 0.1
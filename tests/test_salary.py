@@ -0,0 +1,38 @@
+import math
+
+import pytest
+
+from utils.salary import CURRENCY_TO_USD, normalize_salaries, salary_percentiles
+
+
+@pytest.mark.parametrize("text, low, high", [
+    ("€50.000 - €60.000", 50_000, 60_000),
+    ("$120,000 - $150,000", 120_000, 150_000),
+    ("1.234.567 EUR", 1_234_567, 1_234_567),
+    ("€1.234,50", 1_234.5, 1_234.5),
+    ("$1,000.50", 1_000.5, 1_000.5),
+    ("$1.5M", 1_500_000, 1_500_000),
+    ("£45,5K", 45_500, 45_500),
+    ("$120 - 180K", 120_000, 180_000),
+    ("5+ years, $120K", 120_000, 120_000),
+    ("3 days onsite, 90k - 110k", 90_000, 110_000),
+    ("Level 4, USD 95000", 95_000, 95_000),
+])
+def test_separators_and_suffixes(text, low, high):
+    row = normalize_salaries([text]).iloc[0]
+    rate = CURRENCY_TO_USD[row["currency"]]
+    assert row["salary_min"] == pytest.approx(low * rate)
+    assert row["salary_max"] == pytest.approx(high * rate)
+
+
+def test_pay_periods_are_annualised():
+    frame = normalize_salaries(["$40 - $60 per hour", "€4.000/month", "competitive", None])
+    assert frame["period"].tolist() == ["hour", "month", "year", "year"]
+    assert frame["salary_mid"][0] == pytest.approx(50 * 2080)
+    assert frame["salary_mid"][1] == pytest.approx(4_000 * 12 * CURRENCY_TO_USD["EUR"])
+    assert math.isnan(frame["salary_mid"][2]) and math.isnan(frame["salary_mid"][3])
+
+
+def test_percentiles_skip_unparsed_rows():
+    frame = normalize_salaries(["$100K", "$200K", "n/a"])
+    assert salary_percentiles(frame)["p50"] == pytest.approx(150_000)
@@ -0,0 +1,34 @@
+from utils.job_store import SQLiteJobStore
+from utils.scraper import JOB_SOURCES, JobScraper, enabled_job_sources
+
+
+def test_listing_source_streams_canonical_jobs(db_path, http, listing_server):
+    scraper = JobScraper(store=SQLiteJobStore(db_path, legacy_json=None), sources="remoteok")
+    scraper.http = http
+    jobs = list(scraper.scrape_listing("remoteok", url=listing_server.url))
+    assert [(job["title"], job["company"], job["source"]) for job in jobs] == [
+        ("Go Developer", "Gopher Inc", "remoteok"), ("ML Engineer", "Tensor Ltd", "remoteok")
+    ]
+    assert [scraper.skill_extractor.skills_for(job) for job in jobs] == [["go"], ["machine_learning", "pytorch"]]
+
+
+def test_sources_are_selected_by_config(monkeypatch):
+    assert "remoteok" in JOB_SOURCES
+    assert enabled_job_sources("remoteok, nope") == ["remoteok"]
+    assert enabled_job_sources("all") == list(JOB_SOURCES)
+    monkeypatch.setenv("CAREERCRYSTAL_JOB_SOURCES", "github")
+    assert enabled_job_sources() == ["github"]
+
+
+def test_unchanged_listing_is_replayed_so_postings_stay_seen(db_path, http, listing_server):
+    scraper = JobScraper(store=SQLiteJobStore(db_path, legacy_json=None), sources="remoteok")
+    scraper.http = http
+    first = list(scraper.scrape_listing("remoteok", url=listing_server.url))
+    again = list(scraper.scrape_listing("remoteok", url=listing_server.url))
+    assert listing_server.requests == [None, '"v1"']
+    assert again == first
+
+
+def test_iter_jobs_fetches_only_enabled_sources(db_path):
+    scraper = JobScraper(store=SQLiteJobStore(db_path, legacy_json=None), sources="github", politeness_delay=0)
+    assert {job["source"] for job in scraper.iter_jobs()} == {"github"}
@@ -0,0 +1,33 @@
+from datetime import datetime, timedelta
+
+from utils.job_store import SQLiteJobStore
+from utils.search import JobSearchIndex
+
+
+def test_search_drops_exactly_the_postings_the_store_expired(db_path, job):
+    store = SQLiteJobStore(db_path, legacy_json=None)
+    index = JobSearchIndex(db_path)
+    postings = [job(title="Python Developer"), job(title="Python Analyst")]
+    store.upsert_jobs(postings)
+    index.add_jobs(postings)
+
+    # Indexed long ago, but only the analyst stopped being listed
+    old = (datetime.now() - timedelta(days=90)).isoformat()
+    with index.transaction() as conn:
+        conn.execute("UPDATE search_docs SET indexed_at = ?", (old,))
+    with store.transaction() as conn:
+        conn.execute("UPDATE jobs SET last_seen = ? WHERE title = 'Python Analyst'", (old,))
+
+    removed = []
+    assert store.expire_jobs(30, removed=removed) == 1
+    assert index.remove_jobs(removed) == 1
+    assert len(index) == 1
+    assert [hit["title"] for hit in index.search("python", store=store)] == ["Python Developer"]
+
+
+def test_reindexing_a_posting_keeps_one_document(db_path, job):
+    index = JobSearchIndex(db_path)
+    index.add_jobs([job(skills=["python"])])
+    index.add_jobs([job(skills=["rust"])])
+    assert len(index) == 1
+    assert index.remove_jobs(["not-a-key"]) == 0
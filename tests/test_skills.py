@@ -0,0 +1,34 @@
+from utils.skills import SkillExtractor
+
+
+def test_aliases_and_separators_normalize_to_one_id():
+    extractor = SkillExtractor()
+    assert extractor.canonicalize("Machine-Learning") == "machine_learning"
+    assert extractor.canonicalize("PostgreSQL") == "sql"
+    assert extractor.canonicalize("Some Niche Tool") == "some_niche_tool"
+    assert extractor.extract("Python3, k8s and scikit learn; CI/CD") == {
+        "python", "kubernetes", "scikit_learn", "ci_cd"
+    }
+
+
+def test_everyday_words_are_not_tagged_in_prose():
+    extractor = SkillExtractor()
+    text = "Go-to-market lead who can react fast, spark ideas and excel at storytelling"
+    assert extractor.extract(text) == set()
+    assert extractor.extract("Golang services, ReactJS front end and PySpark jobs") == {"go", "react", "spark"}
+
+
+def test_listed_skills_still_canonicalize_ambiguous_names():
+    extractor = SkillExtractor()
+    job = {"title": "Backend Engineer", "skills": ["Go", "React", "Spark"]}
+    assert extractor.skills_for(job) == ["go", "react", "spark"]
+
+
+def test_alias_needs_word_boundaries():
+    assert SkillExtractor().extract("javascripting gitlab sqlite") == set()
+
+
+def test_dotted_names_do_not_leak_their_suffix():
+    extractor = SkillExtractor()
+    assert extractor.extract("Node.js and React.js services") == {"nodejs", "react"}
+    assert extractor.extract("Strong JS. Some Python.") == {"javascript", "python"}
@@ -0,0 +1,97 @@
+import json
+
+import pytest
+
+from utils.status_journal import StatusJournal
+
+
+@pytest.fixture
+def paths(tmp_path):
+    return str(tmp_path / "scheduler_status.json"), str(tmp_path / "status_journal.jsonl")
+
+
+def journal_lines(path):
+    with open(path) as f:
+        return f.read().splitlines()
+
+
+def test_latest_status_and_history_per_task(paths):
+    journal = StatusJournal(*paths, keep=3)
+    for n in range(5):
+        journal.record("job_scraping", {"status": "success", "new_jobs": n})
+    journal.record("daily_report", {"status": "error", "error": "boom"})
+
+    status = journal.status()
+    assert status["job_scraping"]["new_jobs"] == 4
+    assert status["daily_report"]["status"] == "error"
+    assert status["last_updated"] == status["daily_report"]["recorded_at"]
+    assert [run["new_jobs"] for run in journal.tail("job_scraping", n=10)] == [4, 3, 2]
+    assert journal.tasks() == ["daily_report", "job_scraping"]
+
+
+def test_compaction_folds_the_journal_into_the_snapshot(paths):
+    journal = StatusJournal(*paths, compact_every=3)
+    for n in range(4):
+        journal.record("market_trends", {"run": n})
+    assert len(journal_lines(paths[1])) == 1
+    with open(paths[0]) as f:
+        assert json.load(f)["seq"] == 3
+    assert [run["run"] for run in StatusJournal(*paths).tail("market_trends")] == [3, 2, 1, 0]
+
+
+def test_crash_before_truncation_does_not_count_runs_twice(paths):
+    journal = StatusJournal(*paths)
+    journal.record("job_scraping", {"run": 1})
+    journal.record("job_scraping", {"run": 2})
+    stale = journal_lines(paths[1])
+    journal.compact()
+    # As if the process died after writing the snapshot but before truncating
+    with open(paths[1], "w") as f:
+        f.write("\n".join(stale) + "\n")
+    assert [run["run"] for run in StatusJournal(*paths).tail("job_scraping")] == [2, 1]
+
+
+def test_appends_from_another_process_are_picked_up(paths):
+    page, worker = StatusJournal(*paths), StatusJournal(*paths)
+    page.record("job_scraping", {"run": 1})
+    worker.record("job_scraping", {"run": 2})
+    assert page.status()["job_scraping"]["run"] == 2
+    page.record("job_scraping", {"run": 3})
+    seqs = [json.loads(line)["seq"] for line in journal_lines(paths[1])]
+    assert seqs == [1, 2, 3]
+
+
+def test_torn_tail_is_sealed_and_skipped(paths):
+    journal = StatusJournal(*paths)
+    journal.record("job_scraping", {"run": 1})
+    with open(paths[1], "a") as f:
+        f.write('{"task": "job_scraping", "seq": 2, "ru')
+    assert journal.status()["job_scraping"]["run"] == 1
+    journal.record("job_scraping", {"run": 2})
+    assert [run["run"] for run in journal.tail("job_scraping")] == [2, 1]
+
+
+def test_appends_only_read_the_new_bytes(paths, monkeypatch):
+    journal = StatusJournal(*paths, compact_every=1000)
+    journal.record("job_scraping", {"run": 0})
+    reloads = []
+    original = journal._fold_snapshot
+    monkeypatch.setattr(journal, "_fold_snapshot", lambda *a: reloads.append(1) or original(*a))
+
+    for n in range(1, 20):
+        journal.record("job_scraping", {"run": n})
+        assert journal.status()["job_scraping"]["run"] == n
+    assert reloads == []
+
+    with open(paths[1], "w"):
+        pass  # Truncated by someone else - the only reason to start over
+    journal.status()
+    assert reloads == [1]
+
+
+def test_returned_status_is_not_mutated_by_later_runs(paths):
+    journal = StatusJournal(*paths)
+    journal.record("job_scraping", {"run": 1})
+    before = journal.status()
+    journal.record("daily_report", {"run": 1})
+    assert "daily_report" not in before
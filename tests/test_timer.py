@@ -0,0 +1,64 @@
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from automation.timer import TimerScheduler
+
+
+@pytest.fixture
+def timers():
+    timers = TimerScheduler(max_sleep=1)
+    timers.start()
+    yield timers
+    timers.stop()
+
+
+def test_interval_timer_fires_repeatedly(timers):
+    fired = threading.Semaphore(0)
+    timers.every(0.02, fired.release, first_in=0)
+    assert all(fired.acquire(timeout=2) for _ in range(3))
+
+
+def test_adding_a_timer_wakes_the_idle_thread(timers):
+    fired = threading.Event()
+    timers.every(3600, lambda: None)
+    time.sleep(0.05)  # The loop is now asleep until the hourly timer
+    started = time.monotonic()
+    timers.every(3600, fired.set, first_in=0.05)
+    assert fired.wait(2)
+    assert time.monotonic() - started < 1
+
+
+def test_cancelled_timer_never_fires(timers):
+    fired = threading.Event()
+    timer_id = timers.every(0.05, fired.set)
+    assert timers.cancel(timer_id)
+    assert not fired.wait(0.2)
+
+
+def test_failing_callback_does_not_stop_the_loop(timers):
+    fired = threading.Event()
+    timers.every(0.02, lambda: 1 / 0, first_in=0)
+    timers.every(0.05, fired.set)
+    assert fired.wait(2)
+
+
+def test_next_runs_reports_wall_clock_times():
+    timers = TimerScheduler()
+    timers.every(60, lambda: None, name="scrape")
+    timers.daily_at("09:30", lambda: None, name="report")
+    runs = timers.next_runs()
+    now = datetime.now()
+    assert timedelta(seconds=55) < runs["scrape"] - now <= timedelta(seconds=60)
+    assert (runs["report"].hour, runs["report"].minute) == (9, 30)
+    assert now < runs["report"] <= now + timedelta(days=1)
+
+
+def test_stop_returns_immediately(timers):
+    timers.every(3600, lambda: None)
+    started = time.monotonic()
+    timers.stop()
+    assert time.monotonic() - started < 1
+    assert not timers._thread.is_alive()
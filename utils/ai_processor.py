@@ -1,33 +1,25 @@
-import openai
 import json
+import logging
 import streamlit as st
 from datetime import datetime
-import pandas as pd
 import os
+import sys
 from dotenv import load_dotenv
 
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.analytics import as_corpus
+from utils.salary import format_salary
+from utils.llm_cache import LLMResponseCache, prompt_cache_key
+from utils.llm_client import get_llm_client
+from utils.json_stream import IncrementalJSONObjectParser
+
 load_dotenv()
 
-class CareerCrystalAI:
-    """🤖 AI Brain of CareerCrystal - Smart job market analysis"""
-    
-    def __init__(self):
-        self.api_key = os.getenv('OPENAI_API_KEY') or st.secrets.get('OPENAI_API_KEY', '')
-        if self.api_key:
-            openai.api_key = self.api_key
-        self.model = "gpt-3.5-turbo"  # Free tier friendly
-        
-    def analyze_job_trends(self, jobs_data):
-        """📊 AI analysis of job market trends"""
-        
-        if not self.api_key:
-            return self._generate_mock_analysis(jobs_data)
-        
-        try:
-            # Prepare job data summary for AI
-            job_summary = self._prepare_job_summary(jobs_data)
-            
-            prompt = f"""
+logger = logging.getLogger(__name__)
+
+MARKET_ANALYSIS_PROMPT = """
             As a career market analyst, analyze this job market data and provide insights:
             
             {job_summary}
@@ -41,43 +33,283 @@ class CareerCrystalAI:
             
             Keep it concise and professional.
             """
+
+SHARD_SUMMARY_PROMPT = """
+            As a career market analyst, summarize this slice of job market data:
             
-            response = openai.ChatCompletion.create(
+            {job_summary}
+            
+            Provide a JSON response with:
+            1. "segment": The slice being summarized
+            2. "key_trends": 2-3 sentence summary of what stands out
+            3. "hot_skills": Top 5 skills in this slice
+            4. "salary_notes": One sentence on pay in this slice
+            
+            Keep it factual and brief.
+            """
+
+SHARD_MERGE_PROMPT = """
+            As a career market analyst, merge these summaries of neighbouring job market slices into one summary:
+            
+            {job_summary}
+            
+            Provide a JSON response with:
+            1. "segment": The combined slices being summarized
+            2. "key_trends": 2-3 sentence summary of what stands out
+            3. "hot_skills": Top 5 skills across these slices
+            4. "salary_notes": One sentence on pay across these slices
+            
+            Keep it factual and brief.
+            """
+
+MAP_REDUCE_PROMPT = """
+            As a career market analyst, merge these partial analyses of job market slices into one market view:
+            
+            {job_summary}
+            
+            Provide a JSON response with:
+            1. "trend_analysis": Overall market trend (1 sentence)
+            2. "hot_skills": Top 5 in-demand skills 
+            3. "salary_insights": Key salary observations
+            4. "growth_prediction": Market growth forecast
+            5. "recommendations": 3 actionable career tips
+            
+            Keep it concise and professional.
+            """
+
+def estimate_tokens(text):
+    """Rough token count - ~4 characters per token for English prose"""
+    return len(text) // 4 + 1
+
+class CareerCrystalAI:
+    """🤖 AI Brain of CareerCrystal - Smart job market analysis"""
+    
+    @staticmethod
+    def _secret(name):
+        """Streamlit secret, or '' outside a Streamlit app (e.g. the automation worker) or without secrets.toml"""
+        try:
+            return st.secrets.get(name, '')
+        except Exception:
+            return ''
+    
+    def __init__(self):
+        self.api_key = os.getenv('OPENAI_API_KEY') or self._secret('OPENAI_API_KEY')
+        self.model = "gpt-3.5-turbo"  # Free tier friendly
+        self.llm = None
+        if self.api_key:
+            # Shared per process - pages build a CareerCrystalAI per click, the loop thread and session outlive it
+            self.llm = get_llm_client(
+                api_key=self.api_key,
                 model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=500,
-                temperature=0.7
+                base_url=os.getenv('OPENAI_BASE_URL') or None,
+                max_concurrency=int(os.getenv('CAREERCRYSTAL_LLM_CONCURRENCY', '4')),
+                requests_per_minute=int(os.getenv('CAREERCRYSTAL_LLM_RPM', '60')),
+                timeout=float(os.getenv('CAREERCRYSTAL_LLM_TIMEOUT', '30'))
             )
+        self.analysis_mode = os.getenv('CAREERCRYSTAL_ANALYSIS_MODE', 'auto')  # summary | map_reduce | auto
+        self.map_reduce_min_jobs = int(os.getenv('CAREERCRYSTAL_MAP_REDUCE_MIN_JOBS', '500'))
+        self.shard_token_budget = int(os.getenv('CAREERCRYSTAL_SHARD_TOKEN_BUDGET', '1500'))
+        self.reduce_token_budget = int(os.getenv('CAREERCRYSTAL_REDUCE_TOKEN_BUDGET', '3000'))
+        self.cache = LLMResponseCache(
+            ttl_seconds=int(os.getenv("CAREERCRYSTAL_LLM_CACHE_TTL", str(24 * 3600))),
+            max_entries=int(os.getenv("CAREERCRYSTAL_LLM_CACHE_SIZE", "500"))
+        )
+        
+    def analyze_job_trends(self, jobs_data, mode=None):
+        """📊 AI analysis of job market trends"""
+        
+        if not self.api_key:
+            return self._generate_mock_analysis(jobs_data)
+        
+        try:
+            corpus = as_corpus(jobs_data)
+            mode = mode or self.analysis_mode
+            if mode == "map_reduce" or (mode == "auto" and len(corpus) >= self.map_reduce_min_jobs):
+                return self._map_reduce_analysis(corpus)
             
-            ai_insights = json.loads(response.choices[0].message.content)
-            ai_insights['generated_at'] = datetime.now().isoformat()
+            # Prepare job data summary for AI
+            job_summary = self._prepare_job_summary(corpus)
             
-            return ai_insights
+            return self._run_analyses([job_summary])[0]
             
         except Exception as e:
-            st.warning(f"AI analysis unavailable: {str(e)}")
+            # Also runs in the automation worker, which has no page to show a warning on
+            logger.warning(f"AI analysis unavailable: {str(e)}")
             return self._generate_mock_analysis(jobs_data)
     
+    def stream_job_trends(self, jobs_data):
+        """🌊 Streaming variant of analyze_job_trends
+
+        Yields ("partial" | "complete", section, value) events as the model writes
+        its JSON, then ("done", None, analysis) with the full result.
+        """
+        corpus = as_corpus(jobs_data)
+        analysis = None
+        
+        if self.api_key:
+            try:
+                job_summary = self._prepare_job_summary(corpus)
+                cache_key = prompt_cache_key(self.model, MARKET_ANALYSIS_PROMPT, job_summary)
+                analysis = self.cache.get(cache_key)
+                
+                if analysis is None:
+                    parser = IncrementalJSONObjectParser()
+                    analysis = {}
+                    prompt = MARKET_ANALYSIS_PROMPT.format(job_summary=job_summary)
+                    for delta in self.llm.stream_sync(prompt, max_tokens=500, temperature=0.7):
+                        for event, key, value in parser.feed(delta):
+                            if event == "complete":
+                                analysis[key] = value
+                            yield event, key, value
+                    if not analysis:
+                        raise ValueError("model returned no JSON object")
+                    analysis['generated_at'] = datetime.now().isoformat()
+                    self.cache.put(cache_key, self.model, analysis)
+                    yield "done", None, analysis
+                    return
+            except Exception as e:
+                st.warning(f"AI analysis unavailable: {str(e)}")
+                analysis = None
+        
+        # Cached or mock analyses are already complete - replay them section by section
+        analysis = analysis or self._generate_mock_analysis(corpus)
+        for key, value in analysis.items():
+            yield "complete", key, value
+        yield "done", None, analysis
+    
+    def _map_reduce_analysis(self, corpus):
+        """🗺️ Summarize token-budgeted shards in parallel, then merge them level by level into one reduce prompt"""
+        shards = self._build_shards(corpus)
+        # Map: shard prompts are cached, so only shards whose data changed cost tokens
+        partials = self._run_analyses([summary for _, summary in shards], template=SHARD_SUMMARY_PROMPT,
+                                      raise_single=False)
+        merged = [
+            {"shard": name, **partial}
+            for (name, _), partial in zip(shards, partials)
+            if not isinstance(partial, Exception)
+        ]
+        if not merged:
+            raise RuntimeError("every shard summary failed")
+        
+        # Reduce: merge budget-sized groups of partials until one prompt holds them all
+        header = f"Total Jobs: {len(corpus)}\n"
+        partials, levels = merged, 0
+        while True:
+            groups = self._reduce_groups(partials, header)
+            if len(groups) == 1:
+                break
+            results = self._run_analyses([self._reduce_input(header, group) for group in groups],
+                                         template=SHARD_MERGE_PROMPT, raise_single=False)
+            partials = [
+                {"shard": f"{group[0]['shard']} … {group[-1]['shard']}", **result}
+                for group, result in zip(groups, results)
+                if not isinstance(result, Exception)
+            ]
+            if not partials:
+                raise RuntimeError("every shard merge failed")
+            levels += 1
+        
+        analysis = self._run_analyses([self._reduce_input(header, partials)], template=MAP_REDUCE_PROMPT)[0]
+        analysis['shards_analyzed'] = len(merged)
+        analysis['reduce_levels'] = levels
+        return analysis
+    
+    @staticmethod
+    def _reduce_input(header, partials):
+        return header + json.dumps(partials, indent=1)
+    
+    def _reduce_groups(self, partials, header):
+        """Pack consecutive partials into groups whose reduce prompt fits the reduce token budget"""
+        budget = self.reduce_token_budget - estimate_tokens(MAP_REDUCE_PROMPT) - estimate_tokens(header)
+        groups, group, used = [], [], 0
+        for partial in partials:
+            cost = estimate_tokens(json.dumps([partial], indent=1))
+            if group and used + cost > budget:
+                groups.append(group)
+                group, used = [], 0
+            group.append(partial)
+            used += cost
+        groups.append(group)
+        # Oversized partials can't share a group - pair them so every level still halves the count
+        if len(groups) == len(partials) > 1:
+            groups = [partials[i:i + 2] for i in range(0, len(partials), 2)]
+        return groups
+    
+    def _build_shards(self, corpus):
+        """Split the corpus by category, then by week when a category's summary would blow the token budget"""
+        shards = []
+        for category, category_corpus in sorted(corpus.split("category").items()):
+            summary, omitted = self._shard_summary(category, category_corpus)
+            windows = category_corpus.time_windows("W") if omitted else {}
+            if len(windows) <= 1:
+                shards.append((category, summary))
+                continue
+            for window, window_corpus in sorted(windows.items()):
+                name = f"{category} / {window}"
+                shards.append((name, self._shard_summary(name, window_corpus)[0]))
+        return shards
+    
+    def _shard_summary(self, name, corpus):
+        """Detailed shard summary within the token budget - returns (summary, titles left out)"""
+        titles = corpus.jobs["title"].value_counts()
+        header = f"""
+        Segment: {name}
+        Jobs: {len(corpus)}
+        Top Companies: {list(corpus.top_companies(10))}
+        Most Demanded Skills: {corpus.top_skills(10, display_names=True)}
+        Salary Percentiles (USD/yr): {corpus.salary_percentiles()}
+        Remote Share: {corpus.jobs["is_remote"].mean():.0%}
+        """
+        lines = [header, "        Titles:"]
+        budget = self.shard_token_budget - estimate_tokens(header)
+        omitted = 0
+        for included, (title, count) in enumerate(titles.items()):
+            line = f"        - {title} ({count})"
+            budget -= estimate_tokens(line)
+            if budget < 0:
+                omitted = len(titles) - included
+                lines.append(f"        - ... {omitted} more titles")
+                break
+            lines.append(line)
+        return "\n".join(lines), omitted
+    
+    def _run_analyses(self, summaries, template=MARKET_ANALYSIS_PROMPT, raise_single=True):
+        """Answer each summary from the cache or one concurrent batch of completions"""
+        # Unchanged summary -> reuse the previous analysis, no tokens spent
+        keys = [prompt_cache_key(self.model, template, summary) for summary in summaries]
+        results = [self.cache.get(key) for key in keys]
+        missing = [i for i, result in enumerate(results) if result is None]
+        
+        if missing:
+            prompts = [template.format(job_summary=summaries[i]) for i in missing]
+            replies = self.llm.complete_many_sync(prompts, max_tokens=500, temperature=0.7)
+            for i, reply in zip(missing, replies):
+                if isinstance(reply, Exception):
+                    results[i] = reply
+                    continue
+                try:
+                    ai_insights = json.loads(reply)
+                except ValueError as e:
+                    results[i] = e
+                    continue
+                ai_insights['generated_at'] = datetime.now().isoformat()
+                self.cache.put(keys[i], self.model, ai_insights)
+                results[i] = ai_insights
+        
+        if raise_single and len(results) == 1 and isinstance(results[0], Exception):
+            raise results[0]
+        return results
+    
     def _prepare_job_summary(self, jobs_data):
         """Prepare concise job data summary for AI"""
-        if not jobs_data:
+        corpus = as_corpus(jobs_data)
+        if not len(corpus):
             return "No job data available"
-            
-        # Extract key metrics
-        total_jobs = len(jobs_data)
-        companies = list(set([job.get('company', 'Unknown') for job in jobs_data]))
-        skills = []
-        
-        for job in jobs_data:
-            if 'skills' in job:
-                skills.extend(job['skills'])
-        
-        skill_counts = pd.Series(skills).value_counts().head(10)
         
         summary = f"""
-        Total Jobs: {total_jobs}
-        Top Companies: {companies[:10]}
-        Most Demanded Skills: {skill_counts.to_dict()}
+        Total Jobs: {len(corpus)}
+        Top Companies: {list(corpus.top_companies(10))}
+        Most Demanded Skills: {corpus.top_skills(10, display_names=True)}
         Date Range: Recent postings
         """
         
@@ -102,19 +334,20 @@ class CareerCrystalAI:
     def generate_daily_report(self, jobs_data, market_trends):
         """📰 Generate daily market intelligence report"""
         
-        insights = self.analyze_job_trends(jobs_data)
+        corpus = as_corpus(jobs_data)
+        insights = self.analyze_job_trends(corpus)
         
         report = {
             "date": datetime.now().strftime("%Y-%m-%d"),
             "title": f"📊 CareerCrystal Daily Market Report - {datetime.now().strftime('%B %d, %Y')}",
             "summary": {
-                "total_jobs_scanned": len(jobs_data) if jobs_data else 0,
-                "new_opportunities": len([j for j in jobs_data if j.get('posted_date', '') == datetime.now().strftime("%Y-%m-%d")]) if jobs_data else 0,
-                "market_status": "🔥 Hot" if len(jobs_data) > 100 else "📈 Growing"
+                "total_jobs_scanned": len(corpus),
+                "new_opportunities": corpus.count_posted_on(datetime.now().strftime("%Y-%m-%d")),
+                "market_status": "🔥 Hot" if len(corpus) > 100 else "📈 Growing"
             },
             "ai_insights": insights,
-            "featured_companies": self._get_top_companies(jobs_data),
-            "salary_highlights": self._get_salary_highlights(jobs_data),
+            "featured_companies": self._get_top_companies(corpus),
+            "salary_highlights": self._get_salary_highlights(corpus),
             "generated_at": datetime.now().isoformat()
         }
         
@@ -122,20 +355,44 @@ class CareerCrystalAI:
     
     def _get_top_companies(self, jobs_data):
         """Get top hiring companies"""
-        if not jobs_data:
+        corpus = as_corpus(jobs_data)
+        if not len(corpus):
             return ["Google", "Microsoft", "Amazon", "Meta", "Apple"]
             
-        companies = [job.get('company', 'Unknown') for job in jobs_data]
-        return pd.Series(companies).value_counts().head(5).index.tolist()
+        return list(corpus.top_companies(5))
     
     def _get_salary_highlights(self, jobs_data):
-        """Extract salary insights"""
+        """Extract salary insights from parsed salary percentiles"""
+        corpus = as_corpus(jobs_data)
+        by_category = corpus.salary_percentiles(by="category")
+        by_remote = corpus.salary_percentiles(by="is_remote")
+        overall = corpus.salary_percentiles()
+        
+        def band(category):
+            stats = by_category.get(category)
+            if not stats:
+                return "n/a"
+            return f"{format_salary(stats['p25'])} - {format_salary(stats['p75'])}"
+        
+        trending_up = "n/a"
+        if by_category and overall:
+            top = max(by_category, key=lambda category: by_category[category]["p50"])
+            premium = (by_category[top]["p50"] / overall["p50"] - 1) * 100
+            trending_up = f"{top} ({premium:+.0f}% vs market median)"
+        
+        remote_premium = "n/a"
+        if True in by_remote and False in by_remote:
+            premium = (by_remote[True]["p50"] / by_remote[False]["p50"] - 1) * 100
+            remote_premium = f"{premium:+.0f}% for remote positions"
+        
         return {
-            "ai_ml_avg": "$145K - $220K",
-            "data_science_avg": "$120K - $180K", 
-            "full_stack_avg": "$95K - $150K",
-            "trending_up": "AI/ML Engineering (+27%)",
-            "remote_premium": "+15% for remote positions"
+            "ai_ml_avg": band("AI/ML"),
+            "data_science_avg": band("Data Science"),
+            "full_stack_avg": band("Software Engineering"),
+            "trending_up": trending_up,
+            "remote_premium": remote_premium,
+            "median_salary": format_salary(overall.get("p50")),
+            "percentiles_by_category": by_category
         }
 
 # 🧪 Test the AI processor
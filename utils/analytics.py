@@ -0,0 +1,124 @@
+import threading
+
+import numpy as np
+import pandas as pd
+
+from utils.salary import normalize_salaries, salary_percentiles
+from utils.skills import skill_name
+
+# 🗂️ Title keyword rules for job categories - first match wins
+CATEGORY_PATTERNS = [
+    ("AI/ML", r"\b(?:ai|ml|machine learning|deep learning|llm|nlp|computer vision)\b"),
+    ("Data Science", r"\bdata\b|\banalytics?\b|\bscientist\b"),
+    ("Product Management", r"\bproduct (?:manager|management|owner)\b"),
+    ("Software Engineering", r"\b(?:engineer|developer|programmer|swe|full stack|backend|frontend)\b"),
+]
+OTHER_CATEGORY = "Other"
+
+
+def categorize_titles(titles):
+    """Vectorized title -> category mapping"""
+    lowered = pd.Series(titles, dtype="object").fillna("").str.lower()
+    conditions = [lowered.str.contains(pattern, regex=True) for _, pattern in CATEGORY_PATTERNS]
+    choices = [name for name, _ in CATEGORY_PATTERNS]
+    return pd.Series(np.select(conditions, choices, default=OTHER_CATEGORY), index=lowered.index)
+
+
+class JobCorpus:
+    """📊 Columnar view of the job corpus - categorical columns, exploded skills, numeric salary bounds"""
+
+    CATEGORICAL_COLUMNS = ("company", "source", "location", "category")
+
+    def __init__(self, jobs, skills):
+        self.jobs = jobs
+        self.skills = skills
+
+    @classmethod
+    def from_jobs(cls, jobs_data):
+        columns = {"title": [], "company": [], "source": [], "location": [], "salary": [], "posted_date": []}
+        skill_rows, skill_names = [], []
+
+        for row, job in enumerate(jobs_data or []):
+            for name, values in columns.items():
+                values.append(job.get(name))
+            for skill in job.get("skills", []):
+                skill_rows.append(row)
+                skill_names.append(skill)
+
+        jobs = pd.DataFrame({name: pd.Series(values, dtype="object") for name, values in columns.items()})
+        jobs["category"] = categorize_titles(jobs["title"])
+        jobs = jobs.join(normalize_salaries(jobs["salary"]))
+        jobs["is_remote"] = jobs["location"].fillna("").astype(str).str.lower().str.contains("remote")
+        for name in cls.CATEGORICAL_COLUMNS:
+            jobs[name] = jobs[name].astype("category")
+
+        skills = pd.DataFrame({"job": np.asarray(skill_rows, dtype=np.int64),
+                               "skill": pd.Categorical(skill_names)})
+        return cls(jobs, skills)
+
+    def __len__(self):
+        return len(self.jobs)
+
+    def subset(self, mask):
+        """New corpus holding only the rows selected by a boolean mask"""
+        mask = pd.Series(mask, index=self.jobs.index).fillna(False).astype(bool)
+        positions = np.flatnonzero(mask.to_numpy())
+        remap = pd.Series(np.arange(len(positions)), index=positions)
+        skills = self.skills[self.skills["job"].isin(positions)]
+        skills = skills.assign(job=remap.reindex(skills["job"]).to_numpy())
+        return JobCorpus(self.jobs[mask].reset_index(drop=True), skills.reset_index(drop=True))
+
+    def time_windows(self, freq="W"):
+        """Period label -> sub-corpus, bucketing postings by posted_date"""
+        periods = pd.to_datetime(self.jobs["posted_date"], errors="coerce").dt.to_period(freq).astype(str)
+        return {period: self.subset(periods == period) for period in pd.unique(periods)}
+
+    def split(self, by):
+        """Group -> sub-corpus for every observed value of column `by`"""
+        values = self.jobs[by]
+        return {group: self.subset(values == group) for group in pd.unique(values.dropna())}
+
+    def top_skills(self, n=10, display_names=False):
+        """Skill ID (or display name) -> number of postings, most demanded first"""
+        counts = self.skills.drop_duplicates()["skill"].value_counts()
+        counts = counts[counts > 0].head(n).to_dict()
+        return {skill_name(skill): count for skill, count in counts.items()} if display_names else counts
+
+    def top_companies(self, n=5):
+        """Company -> number of postings, biggest hirers first"""
+        counts = self.jobs["company"].value_counts()
+        return counts[counts > 0].head(n).to_dict()
+
+    def count_by(self, column):
+        counts = self.jobs[column].value_counts()
+        return counts[counts > 0].to_dict()
+
+    def count_posted_on(self, day):
+        return int((self.jobs["posted_date"] == day).sum())
+
+    def salary_percentiles(self, by=None, percentiles=(0.25, 0.5, 0.75), column="salary_mid"):
+        """Yearly USD salary percentiles overall or per group (e.g. "category", "is_remote")"""
+        return salary_percentiles(self.jobs, by=by, column=column, percentiles=percentiles)
+
+
+def as_corpus(jobs_data):
+    """Accept either a JobCorpus or an iterable of job dicts"""
+    return jobs_data if isinstance(jobs_data, JobCorpus) else JobCorpus.from_jobs(jobs_data)
+
+
+_corpus_cache = {}
+_corpus_lock = threading.Lock()
+
+
+def get_corpus(store):
+    """🧠 Process-wide corpus for `store`, rebuilt only when the store's data version changes"""
+    version = store.data_version()
+    with _corpus_lock:
+        cached = _corpus_cache.get(id(store))
+        if cached and version is not None and cached[0] == version:
+            return cached[1]
+
+    corpus = JobCorpus.from_jobs(store.iter_jobs())
+    with _corpus_lock:
+        _corpus_cache[id(store)] = (version, corpus)
+    return corpus
@@ -0,0 +1,105 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows - writers are still atomic, only cross-process locking is skipped
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+_thread_locks = {}
+_thread_locks_guard = threading.Lock()
+
+
+def _thread_lock(path):
+    with _thread_locks_guard:
+        return _thread_locks.setdefault(path, threading.RLock())
+
+
+@contextmanager
+def file_lock(path):
+    """🔒 Exclusive writer lock for `path` - across threads, and across processes where flock exists
+
+    Only writers take it (on a `<path>.lock` sidecar); readers never do, since
+    every write replaces the file in one rename.
+    """
+    path = os.path.abspath(path)
+    with _thread_lock(path):
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(f"{path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _fsync_directory(directory):
+    # Makes the rename itself durable; not supported (or needed) on every platform
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _write(path, data, indent):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    # Unique temp name in the same directory, so concurrent writers never share it and the rename stays atomic
+    fd, temp_path = tempfile.mkstemp(prefix=f".{os.path.basename(path)}.", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'w') as f:
+            if indent is None:
+                json.dump(data, f, separators=(",", ":"))
+            else:
+                json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_directory(directory)
+
+
+def atomic_write_json(path, data, lock=False, indent=None):
+    """💾 Crash-safe JSON write - temp file, fsync, then rename over `path`
+
+    Readers see either the old or the new document, never a partial one.
+    Output is compact unless `indent` is given. Pass `lock=True` when several
+    writers may race on the same file.
+    """
+    if lock:
+        with file_lock(path):
+            _write(path, data, indent)
+    else:
+        _write(path, data, indent)
+
+
+def read_json(path, default=None):
+    """📖 Parsed JSON at `path`, or `default` if it is missing or unreadable - never raises, never blocks"""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+    except (OSError, ValueError) as e:
+        logger.warning(f"Ignoring unreadable {path}: {e}")
+        return default
@@ -0,0 +1,107 @@
+import os
+import threading
+from collections import OrderedDict
+
+from utils.atomic_io import read_json
+from utils.job_store import get_job_store
+
+_MISSING = object()
+
+
+def file_version(path):
+    """Cheap change token for a file - (mtime, size, inode), or None when it doesn't exist"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class VersionedCache:
+    """🗃️ Thread-safe LRU of deserialized objects, each valid for one version of its source
+
+    Every Streamlit session shares one instance, so a file or query is parsed
+    once per change rather than once per rerun per tab. Loads of the same key
+    are serialized, so concurrent sessions don't parse the same data twice.
+    Cached objects are shared between sessions - treat them as read-only.
+    """
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _lookup(self, key, version):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == version:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1]
+        return _MISSING
+
+    def get_or_load(self, key, version, loader):
+        """Cached value for `key` at `version`, calling `loader()` when missing or stale"""
+        value = self._lookup(key, version)
+        if value is not _MISSING:
+            return value
+
+        # One lock per key while any load of it is in flight - dropped by its last user, never by eviction
+        with self._lock:
+            slot = self._key_locks.setdefault(key, [threading.Lock(), 0])
+            slot[1] += 1
+        try:
+            with slot[0]:
+                # Another session may have loaded it while we waited
+                value = self._lookup(key, version)
+                if value is not _MISSING:
+                    return value
+                value = loader()
+                with self._lock:
+                    self.misses += 1
+                    self._entries[key] = (version, value)
+                    self._entries.move_to_end(key)
+                    while len(self._entries) > self.max_entries:
+                        self._entries.popitem(last=False)
+        finally:
+            with self._lock:
+                slot[1] -= 1
+                if not slot[1]:
+                    del self._key_locks[key]
+        return value
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._entries), "max_entries": self.max_entries,
+                    "hits": self.hits, "misses": self.misses}
+
+
+# Process-wide - shared by every page and session
+_cache = VersionedCache(max_entries=int(os.getenv("CAREERCRYSTAL_DATA_CACHE_ENTRIES", "64")))
+
+
+def load_json(path, default=None):
+    """📄 Parsed JSON file, re-read only when it changes on disk
+
+    Missing or unreadable files return `default` - writers replace files
+    atomically, so a malformed one is corrupt rather than half-written.
+    """
+    version = file_version(path)
+    if version is None:
+        return default
+
+    value = _cache.get_or_load(("json", os.path.abspath(path)), version, lambda: read_json(path, default=_MISSING))
+    return default if value is _MISSING else value
+
+
+def load_jobs(store=None, **filters):
+    """🗄️ Stored postings for `filters`, re-queried only when the store's data version changes"""
+    store = store or get_job_store()
+    version = store.data_version()
+    if version is None:
+        return list(store.iter_jobs(**filters))
+    key = ("jobs", id(store), tuple(sorted(filters.items())))
+    return _cache.get_or_load(key, version, lambda: list(store.iter_jobs(**filters)))
@@ -0,0 +1,127 @@
+import hashlib
+import re
+import unicodedata
+from datetime import datetime, timedelta
+
+from utils.job_store import DEFAULT_DB_PATH, SQLiteBacked, job_key
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_text(value):
+    """Lowercase, strip accents and punctuation, collapse whitespace"""
+    value = unicodedata.normalize("NFKD", value or "").encode("ascii", "ignore").decode("ascii")
+    return _NON_ALNUM.sub(" ", value.lower()).strip()
+
+
+def job_fingerprint(job):
+    """Hashed, normalized title/company/location key - robust to case, punctuation and spacing"""
+    parts = [normalize_text(job.get(field)) for field in ("title", "company", "location")]
+    return hashlib.sha1("|".join(parts).encode("utf-8")).hexdigest()
+
+
+class FingerprintIndex(SQLiteBacked):
+    """🧬 Persistent fingerprint index - new postings are checked against hashed keys, not the full history"""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS job_fingerprints (
+        fingerprint TEXT PRIMARY KEY,
+        job_key TEXT NOT NULL,
+        first_seen TEXT NOT NULL,
+        last_seen TEXT NOT NULL
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_job_fingerprints_last_seen ON job_fingerprints(last_seen);
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH, max_age_days=30, batch_size=500):
+        self.max_age_days = max_age_days
+        self.batch_size = batch_size
+        super().__init__(path)
+
+    def _filter_batch(self, batch, now, staged):
+        """(fresh jobs, {stored job_key: job} for re-sighted ones); fresh fingerprints are added to `staged`"""
+        fingerprints = [job_fingerprint(job) for job in batch]
+        placeholders = ",".join("?" * len(fingerprints))
+
+        with self.transaction() as conn:
+            known = dict(conn.execute(
+                f"SELECT fingerprint, job_key FROM job_fingerprints WHERE fingerprint IN ({placeholders})",
+                fingerprints
+            ).fetchall())
+            conn.executemany("UPDATE job_fingerprints SET last_seen = ? WHERE fingerprint = ?",
+                             [(now, fp) for fp in known])
+
+        fresh = []
+        seen = {}
+        for job, fp in zip(batch, fingerprints):
+            if fp in known:
+                # Keyed by the first sighting's job_key - the row the store actually holds
+                seen[known[fp]] = job
+                continue
+            if fp in staged:
+                continue  # Repeat within this scrape
+            staged[fp] = job_key(job)
+            fresh.append(job)
+        return fresh, seen
+
+    def filter_new(self, jobs, stats=None, on_seen=None, staged=None):
+        """Yield only postings whose fingerprint has not been seen - O(new batch) index lookups
+
+        Re-sighted postings are handed to `on_seen({job_key: job})` once per
+        batch, so their stored rows can be kept alive and up to date. Fresh
+        fingerprints are only staged in `staged` ({fingerprint: job_key});
+        `commit` writes them once the store holds the postings, so a failed
+        or aborted write never leaves a posting marked as seen.
+        """
+        now = datetime.now().isoformat()
+        stats = stats if stats is not None else {}
+        stats.update(checked=0, new=0, seen=0)
+        staged = staged if staged is not None else {}
+        batch = []
+
+        def flush():
+            fresh, seen = self._filter_batch(batch, now, staged)
+            stats["new"] += len(fresh)
+            stats["seen"] += len(seen)
+            if seen and on_seen is not None:
+                on_seen(seen)
+            return fresh
+
+        for job in jobs:
+            batch.append(job)
+            stats["checked"] += 1
+            if len(batch) >= self.batch_size:
+                yield from flush()
+                batch = []
+
+        if batch:
+            yield from flush()
+
+    def commit(self, staged):
+        """Record fingerprints staged by `filter_new` - call once the store has committed their postings"""
+        now = datetime.now().isoformat()
+        with self.transaction() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO job_fingerprints (fingerprint, job_key, first_seen, last_seen) VALUES (?, ?, ?, ?)",
+                [(fp, key, now, now) for fp, key in staged.items()]
+            )
+
+    def expire(self, max_age_days=None):
+        """Drop fingerprints not seen within the retention window; returns how many were removed"""
+        max_age_days = self.max_age_days if max_age_days is None else max_age_days
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+        with self.transaction() as conn:
+            return conn.execute("DELETE FROM job_fingerprints WHERE last_seen < ?", (cutoff,)).rowcount
+
+    def rebuild(self, store):
+        """Recreate the index from every posting in `store`"""
+        now = datetime.now().isoformat()
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM job_fingerprints")
+            conn.executemany(
+                "INSERT OR IGNORE INTO job_fingerprints (fingerprint, job_key, first_seen, last_seen) VALUES (?, ?, ?, ?)",
+                ((job_fingerprint(job), job_key(job), now, now) for job in store.iter_jobs())
+            )
+
+    def __len__(self):
+        return self.connect().execute("SELECT COUNT(*) FROM job_fingerprints").fetchone()[0]
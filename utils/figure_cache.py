@@ -0,0 +1,81 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from utils.data_access import VersionedCache
+
+# 📉 Most points a single chart ships to the browser
+MAX_CHART_POINTS = int(os.getenv("CAREERCRYSTAL_MAX_CHART_POINTS", "400"))
+
+
+def lttb_indices(x, y, threshold):
+    """Largest-Triangle-Three-Buckets - indices of `threshold` points that keep the series' visual shape"""
+    n = len(y)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.linspace(1, n - 1, threshold - 1).astype(np.int64)
+    selected = [0]
+    previous = 0
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        # Average of the next bucket is the third triangle vertex (the last point for the final bucket)
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        next_x = x[end:next_end].mean() if next_end > end else x[-1]
+        next_y = y[end:next_end].mean() if next_end > end else y[-1]
+        areas = np.abs((x[previous] - next_x) * (y[start:end] - y[previous])
+                       - (x[previous] - x[start:end]) * (next_y - y[previous]))
+        previous = start + int(np.argmax(areas))
+        selected.append(previous)
+    selected.append(n - 1)
+    return np.asarray(selected)
+
+
+def downsample_frame(frame, max_points=MAX_CHART_POINTS):
+    """Keep at most `max_points` rows - the union of each column's LTTB picks over the shared index"""
+    if len(frame) <= max_points:
+        return frame
+    # Flat series look the same at any sampling, so the point budget goes to the ones that vary
+    columns = [c for c in frame.select_dtypes("number").columns if frame[c].nunique() > 1]
+    per_column = max(3, max_points // max(1, len(columns)))
+    x = frame.index.asi8 if isinstance(frame.index, pd.DatetimeIndex) else np.arange(len(frame))
+    keep = set()
+    for column in columns:
+        keep.update(lttb_indices(x, frame[column].to_numpy(), per_column).tolist())
+    return frame.iloc[sorted(keep)] if keep else frame.iloc[lttb_indices(x, np.zeros(len(frame)), max_points)]
+
+
+class FigureCache:
+    """🖼️ Built Plotly figures keyed by chart, parameters and data version
+
+    Reruns with unchanged data skip building the figure entirely. The cached
+    go.Figure is handed to st.plotly_chart as is - a Figure is already
+    validated, so Streamlit only copies and serializes it, whereas a dict spec
+    would be rebuilt and re-validated on every rerun. Cached figures are
+    shared across sessions: treat them as read-only. Bounded by the same LRU
+    as the data cache.
+    """
+
+    def __init__(self, max_entries=32):
+        self._cache = VersionedCache(max_entries=max_entries)
+
+    def get(self, chart, version, params, build):
+        """Figure for `chart` at `version`, calling `build()` (returning a go.Figure) on a miss"""
+        if version is None:
+            return build()  # Unknown version - never serve a possibly stale figure
+        key = (chart, tuple(sorted((params or {}).items())))
+        return self._cache.get_or_load(key, version, build)
+
+    def stats(self):
+        return self._cache.stats()
+
+
+_figure_cache = FigureCache(max_entries=int(os.getenv("CAREERCRYSTAL_FIGURE_CACHE_ENTRIES", "32")))
+
+
+def get_figure_cache():
+    """Process-wide figure cache shared by every page and session"""
+    return _figure_cache
@@ -0,0 +1,117 @@
+from collections import deque
+from html.parser import HTMLParser
+
+# 🧭 Selector specs per listing source - `job` marks one posting, `fields` are matched inside it
+SELECTOR_SPECS = {
+    "remoteok": {
+        "url": "https://remoteok.com/remote-dev-jobs",
+        "job": {"tag": "tr", "class": "job"},
+        "fields": {
+            "title": {"tag": "h2"},
+            "company": {"tag": "h3"},
+            "location": {"tag": "div", "class": "location"},
+            "salary": {"tag": "div", "class": "location", "contains": "$"},
+            "skills": {"tag": "a", "class": "tag", "many": True}
+        }
+    }
+}
+
+# Elements that never get an end tag and must not be pushed on the open-element stack
+VOID_ELEMENTS = {
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr"
+}
+
+
+def _matches(selector, tag, attrs):
+    """Check a start tag against a {"tag", "class"} selector"""
+    if selector.get("tag") and selector["tag"] != tag:
+        return False
+    wanted_class = selector.get("class")
+    if wanted_class:
+        classes = (dict(attrs).get("class") or "").split()
+        return wanted_class in classes
+    return True
+
+
+class StreamingJobParser(HTMLParser):
+    """🌊 Incremental job extractor - keeps only the open-element stack and the current posting in memory"""
+
+    def __init__(self, spec):
+        super().__init__(convert_charrefs=True)
+        self.spec = spec
+        self.ready = deque()
+        self._stack = []
+        self._job = None
+        self._job_depth = 0
+        self._captures = []  # (field_name, depth, text_parts)
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_ELEMENTS:
+            return
+        self._stack.append(tag)
+
+        if self._job is None:
+            if _matches(self.spec["job"], tag, attrs):
+                self._job = {}
+                self._job_depth = len(self._stack)
+            return
+
+        for name, selector in self.spec["fields"].items():
+            if _matches(selector, tag, attrs):
+                self._captures.append((name, len(self._stack), []))
+
+    def handle_startendtag(self, tag, attrs):
+        # Self-closing tags carry no text and never open a scope
+        pass
+
+    def handle_data(self, data):
+        for _, _, parts in self._captures:
+            parts.append(data)
+
+    def handle_endtag(self, tag):
+        if tag in VOID_ELEMENTS or tag not in self._stack:
+            return
+
+        # Pop up to and including the matching element, tolerating unclosed children
+        while self._stack:
+            if self._stack.pop() == tag:
+                break
+
+        depth = len(self._stack)
+        still_open = []
+        for name, capture_depth, parts in self._captures:
+            if capture_depth > depth:
+                self._store_field(name, " ".join("".join(parts).split()))
+            else:
+                still_open.append((name, capture_depth, parts))
+        self._captures = still_open
+
+        if self._job is not None and depth < self._job_depth:
+            if self._job.get("title"):
+                self.ready.append(self._job)
+            self._job = None
+            self._captures = []
+
+    def _store_field(self, name, text):
+        if not text or self._job is None:
+            return
+        selector = self.spec["fields"][name]
+        if selector.get("contains") and selector["contains"] not in text:
+            return
+        if selector.get("many"):
+            self._job.setdefault(name, []).append(text)
+        else:
+            self._job.setdefault(name, text)
+
+
+def iter_jobs_from_chunks(chunks, spec):
+    """Yield job dicts from an iterable of HTML text chunks as soon as each posting closes"""
+    parser = StreamingJobParser(spec)
+    for chunk in chunks:
+        parser.feed(chunk)
+        while parser.ready:
+            yield parser.ready.popleft()
+    parser.close()
+    while parser.ready:
+        yield parser.ready.popleft()
@@ -0,0 +1,156 @@
+import codecs
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+class PooledHttpClient:
+    """🌐 Shared HTTP layer - keep-alive pooling, retries and an on-disk conditional GET cache"""
+
+    def __init__(self, headers=None, cache_dir="data/http_cache", max_per_host=4,
+                 retries=3, backoff_factor=0.5, timeout=15):
+        self.cache_dir = cache_dir
+        self.timeout = timeout
+        self._lock = threading.Lock()
+
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET", "HEAD"]),
+            respect_retry_after_header=True
+        )
+        # pool_block bounds the number of open connections per host
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=max_per_host,
+                              pool_block=True, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.headers.update(headers or {})
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _cache_paths(self, url):
+        key = hashlib.sha1(url.encode("utf-8")).hexdigest()
+        base = os.path.join(self.cache_dir, key)
+        return base + ".json", base + ".body"
+
+    def _load_cache_entry(self, url):
+        meta_path, body_path = self._cache_paths(url)
+        try:
+            with open(meta_path, 'r') as f:
+                meta = json.load(f)
+            if meta.get("url") != url or not os.path.exists(body_path):
+                return None
+            return meta
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _read_cached_body(self, url, encoding):
+        _, body_path = self._cache_paths(url)
+        with open(body_path, 'rb') as f:
+            return f.read().decode(encoding or "utf-8", errors="replace")
+
+    def _store_cache_entry(self, url, response, body=None, spool_path=None):
+        """Persist validators plus either an in-memory `body` or an already spooled body file"""
+        meta_path, body_path = self._cache_paths(url)
+        meta = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "encoding": response.encoding,
+            "fetched_at": datetime.now().isoformat()
+        }
+        if not (meta["etag"] or meta["last_modified"]):
+            return
+
+        with self._lock:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            if spool_path is None:
+                spool_path = f"{body_path}.tmp"
+                with open(spool_path, 'wb') as f:
+                    f.write(body)
+            os.replace(spool_path, body_path)
+
+            tmp_meta_path = f"{meta_path}.tmp"
+            with open(tmp_meta_path, 'w') as f:
+                json.dump(meta, f)
+            os.replace(tmp_meta_path, meta_path)
+
+    def _conditional_headers(self, meta):
+        headers = {}
+        if meta and meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta and meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        return headers
+
+    def fetch(self, url):
+        """Fetch `url`, returning (text, changed) - unchanged pages are served from the disk cache"""
+        meta = self._load_cache_entry(url)
+        response = self.session.get(url, headers=self._conditional_headers(meta), timeout=self.timeout)
+
+        if response.status_code == 304 and meta:
+            return self._read_cached_body(url, meta.get("encoding")), False
+
+        response.raise_for_status()
+        self._store_cache_entry(url, response, body=response.content)
+        return response.text, True
+
+    def stream(self, url, chunk_size=16384):
+        """Yield decoded text chunks of `url` while the body arrives, teeing fresh bodies into the cache"""
+        meta = self._load_cache_entry(url)
+        response = self.session.get(url, headers=self._conditional_headers(meta),
+                                    timeout=self.timeout, stream=True)
+        with response:
+            if response.status_code == 304 and meta:
+                yield from self._stream_cached_body(url, meta.get("encoding"), chunk_size)
+                return
+
+            response.raise_for_status()
+            decoder = codecs.getincrementaldecoder(response.encoding or "utf-8")(errors="replace")
+            cacheable = bool(response.headers.get("ETag") or response.headers.get("Last-Modified"))
+            _, body_path = self._cache_paths(url)
+            spool_path = f"{body_path}.{threading.get_ident()}.part"
+
+            if cacheable:
+                os.makedirs(self.cache_dir, exist_ok=True)
+            spool = open(spool_path, 'wb') if cacheable else None
+            completed = False
+            try:
+                for raw in response.iter_content(chunk_size=chunk_size):
+                    if spool:
+                        spool.write(raw)
+                    text = decoder.decode(raw)
+                    if text:
+                        yield text
+                tail = decoder.decode(b"", final=True)
+                if tail:
+                    yield tail
+                completed = True
+            finally:
+                if spool:
+                    spool.close()
+                    if not completed:
+                        os.remove(spool_path)
+
+            if spool:
+                self._store_cache_entry(url, response, spool_path=spool_path)
+
+    def _stream_cached_body(self, url, encoding, chunk_size):
+        _, body_path = self._cache_paths(url)
+        with open(body_path, 'r', encoding=encoding or "utf-8", errors="replace") as f:
+            while True:
+                text = f.read(chunk_size)
+                if not text:
+                    break
+                yield text
+
+    def close(self):
+        """Release pooled connections"""
+        self.session.close()
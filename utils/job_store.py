@@ -0,0 +1,486 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+from utils.atomic_io import atomic_write_json
+from utils.trend_aggregates import TrendAggregates
+
+DEFAULT_DB_PATH = "data/careercrystal.db"
+LEGACY_JSON_PATH = "data/jobs_database.json"
+
+
+def job_key(job):
+    """Stable key for a posting - the title/company/location triple, hashed"""
+    raw = f"{job.get('title', '')}-{job.get('company', '')}-{job.get('location', '')}"
+    return hashlib.sha1(raw.strip().lower().encode("utf-8")).hexdigest()
+
+
+class JobStore:
+    """🗄️ Job store interface - backends persist postings keyed by job_key"""
+
+    def upsert_jobs(self, jobs):
+        """Insert new postings and refresh known ones; returns {"processed": n, "inserted": [...], "updated": [...]}"""
+        raise NotImplementedError
+
+    def iter_jobs(self, company=None, source=None, skill=None, since=None, limit=None):
+        """Yield stored postings, optionally filtered"""
+        raise NotImplementedError
+
+    def get_jobs(self, keys):
+        """job_key -> posting for the requested keys that are still stored"""
+        wanted = set(keys)
+        return {job_key(job): job for job in self.iter_jobs() if job_key(job) in wanted}
+
+    def count(self, company=None, source=None, skill=None, since=None):
+        """Count stored postings, optionally filtered"""
+        return sum(1 for _ in self.iter_jobs(company=company, source=source, skill=skill, since=since))
+
+    def refresh_jobs(self, jobs_by_key):
+        """Mark already-stored postings as seen now, applying any edits; returns the postings that changed
+
+        Keys that aren't stored (e.g. reposts the near-duplicate filter suppressed) are ignored.
+        """
+        return []
+
+    def expire_jobs(self, max_age_days, removed=None):
+        """Drop postings not seen within the retention window; returns how many were removed
+
+        The removed postings' keys are appended to `removed` when a list is given,
+        so derived indexes can drop exactly the same rows.
+        """
+        return 0
+
+    def rewrite_skills(self, skills_for):
+        """Recompute every stored posting's skills with `skills_for(job)` (e.g. after a taxonomy change)"""
+        raise NotImplementedError
+
+    def get_meta(self, key, default=None):
+        """Store-level bookkeeping value (e.g. the skill taxonomy version postings were tagged with)"""
+        return default
+
+    def set_meta(self, key, value):
+        pass
+
+    def data_version(self):
+        """Cheap token that changes whenever postings are added, edited, re-tagged or removed (None = unknown, don't cache)"""
+        return None
+
+    def trend_summary(self, days=None, top_n=10):
+        """Skill/company/remote trend snapshot - backends without aggregates fall back to one streaming pass"""
+        from collections import Counter
+        since = (datetime.now() - timedelta(days=days - 1)).strftime("%Y-%m-%d") if days else None
+        skill_counts = Counter()
+        daily = Counter()
+        companies = set()
+        total_jobs = 0
+        remote_jobs = 0
+
+        for job in self.iter_jobs(since=since):
+            total_jobs += 1
+            skill_counts.update(set(job.get('skills', [])))
+            daily[TrendAggregates.bucket_day(job)] += 1
+            if job.get('company'):
+                companies.add(job['company'])
+            if 'remote' in (job.get('location') or '').lower():
+                remote_jobs += 1
+
+        if not total_jobs:
+            return {"status": "no_data", "updated_at": datetime.now().isoformat()}
+
+        return {
+            "total_jobs": total_jobs,
+            "top_skills": dict(skill_counts.most_common(top_n)),
+            "companies_hiring": len(companies),
+            "remote_jobs": remote_jobs,
+            "daily_jobs": dict(sorted(daily.items())),
+            "updated_at": datetime.now().isoformat()
+        }
+
+
+class SQLiteBacked:
+    """🔗 Shared plumbing for components persisted in the embedded SQLite database"""
+
+    SCHEMA = ""
+
+    def __init__(self, path=DEFAULT_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        with self.transaction() as conn:
+            conn.executescript(self.SCHEMA)
+
+    def connect(self):
+        """Per-thread connection - sqlite3 connections must not be shared across threads"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self):
+        """Run a block of statements atomically"""
+        conn = self.connect()
+        with conn:
+            yield conn
+
+
+class SQLiteJobStore(SQLiteBacked, JobStore):
+    """🗄️ Embedded SQLite job store - indexed, upsert-by-key, append-friendly"""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS jobs (
+        job_key TEXT PRIMARY KEY,
+        title TEXT,
+        company TEXT,
+        location TEXT,
+        salary TEXT,
+        source TEXT,
+        posted_date TEXT,
+        payload TEXT NOT NULL,
+        first_seen TEXT NOT NULL,
+        last_seen TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS job_skills (
+        job_key TEXT NOT NULL,
+        skill TEXT NOT NULL,
+        PRIMARY KEY (job_key, skill)
+    ) WITHOUT ROWID;
+    CREATE TABLE IF NOT EXISTS store_meta (
+        key TEXT PRIMARY KEY,
+        value TEXT
+    );
+    CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
+    CREATE INDEX IF NOT EXISTS idx_jobs_source ON jobs(source);
+    CREATE INDEX IF NOT EXISTS idx_jobs_posted_date ON jobs(posted_date);
+    CREATE INDEX IF NOT EXISTS idx_job_skills_skill ON job_skills(skill);
+    CREATE INDEX IF NOT EXISTS idx_jobs_last_seen ON jobs(last_seen);
+    """ + TrendAggregates.SCHEMA
+
+    def __init__(self, path=DEFAULT_DB_PATH, legacy_json=LEGACY_JSON_PATH, batch_size=500):
+        self.batch_size = batch_size
+        self.aggregates = TrendAggregates()
+        super().__init__(path)
+        self._ensure_aggregates()
+        if legacy_json:
+            self._import_legacy_json(legacy_json)
+
+    def _ensure_aggregates(self):
+        """Backfill trend buckets for databases created before aggregates existed"""
+        with self.transaction() as conn:
+            if conn.execute("SELECT 1 FROM store_meta WHERE key = 'trend_aggregates'").fetchone():
+                return
+            self.aggregates.rebuild(conn, (json.loads(row[0]) for row in
+                                           conn.execute("SELECT payload FROM jobs").fetchall()))
+            conn.execute("INSERT INTO store_meta (key, value) VALUES ('trend_aggregates', ?)",
+                         (datetime.now().isoformat(),))
+
+    def _import_legacy_json(self, legacy_json):
+        """One-off import of the old whole-file JSON database"""
+        if self.get_meta("legacy_json_imported"):
+            return
+
+        try:
+            with open(legacy_json, 'r') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            data = []
+        jobs = data.get("jobs", []) if isinstance(data, dict) else data
+
+        # Rows and the "imported" flag commit together - a crash mid-import retries it next start
+        now = datetime.now().isoformat()
+        with self.transaction() as conn:
+            if conn.execute("SELECT 1 FROM store_meta WHERE key = 'legacy_json_imported'").fetchone():
+                return
+            self._upsert_batch(conn, [(job_key(job), job) for job in jobs], now, [], [])
+            conn.execute("INSERT INTO store_meta (key, value) VALUES ('legacy_json_imported', ?)", (now,))
+
+    def _bump_version(self, conn):
+        """Advance the data version - called inside every transaction that changes postings"""
+        conn.execute("""INSERT INTO store_meta (key, value) VALUES ('data_version', 1)
+                        ON CONFLICT(key) DO UPDATE SET value = CAST(value AS INTEGER) + 1""")
+
+    def _upsert_batch(self, conn, rows, now, inserted, updated):
+        """Write (job_key, job) pairs - new keys are inserted, changed postings replace the stored row"""
+        keys = list({key for key, _ in rows})
+        stored = {}
+        changed = False
+        for start in range(0, len(keys), 900):
+            chunk = keys[start:start + 900]
+            stored.update(conn.execute(
+                f"SELECT job_key, payload FROM jobs WHERE job_key IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall())
+
+        for key, job in rows:
+            payload = json.dumps(job, separators=(",", ":"))
+            previous = stored.get(key)
+            conn.execute(
+                """INSERT INTO jobs
+                   (job_key, title, company, location, salary, source, posted_date, payload, first_seen, last_seen)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                   ON CONFLICT(job_key) DO UPDATE SET
+                       title = excluded.title, company = excluded.company, location = excluded.location,
+                       salary = excluded.salary, source = excluded.source, posted_date = excluded.posted_date,
+                       payload = excluded.payload, last_seen = excluded.last_seen""",
+                (key, job.get("title"), job.get("company"), job.get("location"), job.get("salary"),
+                 job.get("source"), job.get("posted_date"), payload, now, now)
+            )
+            if previous == payload:
+                continue  # Re-sighted unchanged - only last_seen moved
+            if previous is not None:
+                # Edited posting - swap its old contribution for the new one
+                self.aggregates.apply(conn, json.loads(previous), -1)
+                conn.execute("DELETE FROM job_skills WHERE job_key = ?", (key,))
+                updated.append(job)
+            else:
+                inserted.append(job)
+            conn.executemany("INSERT OR IGNORE INTO job_skills (job_key, skill) VALUES (?, ?)",
+                             [(key, skill) for skill in job.get("skills", [])])
+            self.aggregates.apply(conn, job, 1)
+            stored[key] = payload  # Repeats later in the batch compare against this version
+            changed = True
+        if changed:
+            self._bump_version(conn)
+
+    def upsert_jobs(self, jobs):
+        """Stream postings into the store in batches - new keys are inserted, changed postings updated"""
+        now = datetime.now().isoformat()
+        processed = 0
+        inserted = []
+        updated = []
+        batch = []
+
+        for job in jobs:
+            batch.append((job_key(job), job))
+            processed += 1
+            if len(batch) >= self.batch_size:
+                with self.transaction() as conn:
+                    self._upsert_batch(conn, batch, now, inserted, updated)
+                batch = []
+
+        if batch:
+            with self.transaction() as conn:
+                self._upsert_batch(conn, batch, now, inserted, updated)
+
+        return {"processed": processed, "inserted": inserted, "updated": updated}
+
+    def refresh_jobs(self, jobs_by_key):
+        keys = list(jobs_by_key)
+        stored = {}
+        for start in range(0, len(keys), 900):
+            chunk = keys[start:start + 900]
+            stored.update((row["job_key"], row) for row in self.connect().execute(
+                f"SELECT job_key, title, company, location FROM jobs WHERE job_key IN ({','.join('?' * len(chunk))})",
+                chunk
+            ))
+        # Keep the stored title/company/location so job_key(posting) still names its row
+        rows = [(key, {**job, "title": stored[key]["title"], "company": stored[key]["company"],
+                       "location": stored[key]["location"]})
+                for key, job in jobs_by_key.items() if key in stored]
+        updated = []
+        with self.transaction() as conn:
+            self._upsert_batch(conn, rows, datetime.now().isoformat(), [], updated)
+        return updated
+
+    def _where(self, company=None, source=None, skill=None, since=None):
+        clauses, params = [], []
+        if company:
+            clauses.append("company = ?")
+            params.append(company)
+        if source:
+            clauses.append("source = ?")
+            params.append(source)
+        if since:
+            clauses.append("posted_date >= ?")
+            params.append(since)
+        if skill:
+            clauses.append("job_key IN (SELECT job_key FROM job_skills WHERE skill = ?)")
+            params.append(skill)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def iter_jobs(self, company=None, source=None, skill=None, since=None, limit=None):
+        where, params = self._where(company, source, skill, since)
+        sql = f"SELECT payload FROM jobs{where} ORDER BY posted_date DESC, rowid DESC"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        for row in self.connect().execute(sql, params):
+            yield json.loads(row["payload"])
+
+    def count(self, company=None, source=None, skill=None, since=None):
+        where, params = self._where(company, source, skill, since)
+        return self.connect().execute(f"SELECT COUNT(*) FROM jobs{where}", params).fetchone()[0]
+
+    def get_jobs(self, keys):
+        keys = list(keys)
+        found = {}
+        for start in range(0, len(keys), 900):
+            chunk = keys[start:start + 900]
+            placeholders = ",".join("?" * len(chunk))
+            for row in self.connect().execute(
+                f"SELECT job_key, payload FROM jobs WHERE job_key IN ({placeholders})", chunk
+            ):
+                found[row["job_key"]] = json.loads(row["payload"])
+        return found
+
+    def get_meta(self, key, default=None):
+        row = self.connect().execute("SELECT value FROM store_meta WHERE key = ?", (key,)).fetchone()
+        return row[0] if row else default
+
+    def set_meta(self, key, value):
+        with self.transaction() as conn:
+            conn.execute("INSERT OR REPLACE INTO store_meta (key, value) VALUES (?, ?)", (key, value))
+
+    def rewrite_skills(self, skills_for):
+        with self.transaction() as conn:
+            rows = conn.execute("SELECT job_key, payload FROM jobs").fetchall()
+            conn.execute("DELETE FROM job_skills")
+            jobs = []
+            for row in rows:
+                job = json.loads(row["payload"])
+                job["skills"] = skills_for(job)
+                jobs.append(job)
+                conn.execute("UPDATE jobs SET payload = ? WHERE job_key = ?",
+                             (json.dumps(job, separators=(",", ":")), row["job_key"]))
+                conn.executemany("INSERT OR IGNORE INTO job_skills (job_key, skill) VALUES (?, ?)",
+                                 [(row["job_key"], skill) for skill in job["skills"]])
+            self.aggregates.rebuild(conn, jobs)
+            self._bump_version(conn)
+        return len(rows)
+
+    def data_version(self):
+        # An explicit counter - row count and max rowid miss in-place edits such as rewrite_skills
+        return int(self.get_meta("data_version", 0))
+
+    def expire_jobs(self, max_age_days, removed=None):
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+        with self.transaction() as conn:
+            expired = conn.execute("SELECT job_key, payload FROM jobs WHERE last_seen < ?", (cutoff,)).fetchall()
+            for row in expired:
+                self.aggregates.apply(conn, json.loads(row["payload"]), -1)
+            conn.executemany("DELETE FROM job_skills WHERE job_key = ?", [(row["job_key"],) for row in expired])
+            conn.executemany("DELETE FROM jobs WHERE job_key = ?", [(row["job_key"],) for row in expired])
+            if expired:
+                self._bump_version(conn)
+        if removed is not None:
+            removed.extend(row["job_key"] for row in expired)
+        return len(expired)
+
+    def trend_summary(self, days=None, top_n=10):
+        return self.aggregates.summary(self.connect(), days=days, top_n=top_n)
+
+
+class JSONJobStore(JobStore):
+    """📄 Whole-file JSON store - kept for small deployments and debugging"""
+
+    def __init__(self, path=LEGACY_JSON_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _load(self):
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (FileNotFoundError, ValueError):
+            return []
+        return data.get("jobs", []) if isinstance(data, dict) else data
+
+    def upsert_jobs(self, jobs):
+        with self._lock:
+            existing = self._load()
+            positions = {job_key(job): i for i, job in enumerate(existing)}
+            processed = 0
+            inserted = []
+            updated = []
+            for job in jobs:
+                processed += 1
+                key = job_key(job)
+                if key not in positions:
+                    positions[key] = len(existing)
+                    existing.append(job)
+                    inserted.append(job)
+                elif existing[positions[key]] != job:
+                    existing[positions[key]] = job
+                    updated.append(job)
+
+            atomic_write_json(self.path, {"last_updated": datetime.now().isoformat(),
+                                          "total_jobs": len(existing),
+                                          "jobs": existing}, lock=True)
+        return {"processed": processed, "inserted": inserted, "updated": updated}
+
+    def refresh_jobs(self, jobs_by_key):
+        with self._lock:
+            existing = self._load()
+            positions = {job_key(job): i for i, job in enumerate(existing)}
+            updated = []
+            for key, job in jobs_by_key.items():
+                if key not in positions:
+                    continue
+                current = existing[positions[key]]
+                job = {**job, "title": current.get("title"), "company": current.get("company"),
+                       "location": current.get("location")}
+                if current != job:
+                    existing[positions[key]] = job
+                    updated.append(job)
+            if updated:
+                atomic_write_json(self.path, {"last_updated": datetime.now().isoformat(),
+                                              "total_jobs": len(existing),
+                                              "jobs": existing}, lock=True)
+        return updated
+
+    def rewrite_skills(self, skills_for):
+        with self._lock:
+            data = self._load()
+            for job in data:
+                job["skills"] = skills_for(job)
+            atomic_write_json(self.path, {"last_updated": datetime.now().isoformat(),
+                                          "total_jobs": len(data), "jobs": data}, lock=True)
+        return len(data)
+
+    def iter_jobs(self, company=None, source=None, skill=None, since=None, limit=None):
+        yielded = 0
+        for job in self._load():
+            if company and job.get("company") != company:
+                continue
+            if source and job.get("source") != source:
+                continue
+            if skill and skill not in job.get("skills", []):
+                continue
+            if since and job.get("posted_date", "") < since:
+                continue
+            if limit and yielded >= limit:
+                return
+            yielded += 1
+            yield job
+
+
+JOB_STORE_BACKENDS = {
+    "sqlite": SQLiteJobStore,
+    "json": JSONJobStore
+}
+
+_stores = {}
+_stores_lock = threading.Lock()
+
+
+def get_job_store(backend=None, **kwargs):
+    """🔌 Shared job store for this process - backend from CAREERCRYSTAL_JOB_STORE, SQLite by default"""
+    backend = backend or os.getenv("CAREERCRYSTAL_JOB_STORE", "sqlite")
+    if backend not in JOB_STORE_BACKENDS:
+        raise ValueError(f"Unknown job store backend: {backend}")
+
+    cache_key = (backend, tuple(sorted(kwargs.items())))
+    with _stores_lock:
+        if cache_key not in _stores:
+            _stores[cache_key] = JOB_STORE_BACKENDS[backend](**kwargs)
+        return _stores[cache_key]
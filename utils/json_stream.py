@@ -0,0 +1,121 @@
+import json
+
+
+class IncrementalJSONObjectParser:
+    """🌊 Incremental parser for a streamed JSON object
+
+    Feed text chunks as tokens arrive; `feed` returns events for the top-level
+    members it can already see:
+
+    - ("partial", key, value) - a string still being written (text so far) or an
+      array whose finished items are known
+    - ("complete", key, value) - the member's value is fully parsed
+
+    Anything before the opening brace (e.g. a ```json fence) is ignored.
+    """
+
+    def __init__(self):
+        self._buffer = ""
+        self._pos = 0
+        self._started = False
+        self._finished = False
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._key = None
+        self._value_start = None
+        self._item_start = None
+        self._items = []
+
+    def feed(self, chunk):
+        events = []
+        if self._finished:
+            return events
+        self._buffer += chunk
+
+        while self._pos < len(self._buffer):
+            char = self._buffer[self._pos]
+
+            if not self._started:
+                if char == "{":
+                    self._started = True
+                    self._depth = 1
+                    self._trim(self._pos + 1)
+                    continue
+                self._pos += 1
+                continue
+
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._in_string = False
+                self._pos += 1
+                continue
+
+            if char == '"':
+                self._in_string = True
+            elif char in "{[":
+                self._depth += 1
+                if self._depth == 2 and char == "[" and self._value_start is not None:
+                    self._item_start = self._pos + 1
+                    self._items = []
+            elif char in "}]":
+                if self._depth == 2 and char == "]" and self._item_start is not None:
+                    self._close_item(events)
+                self._depth -= 1
+                if self._depth == 0:
+                    self._close_member(events)
+                    self._finished = True
+                    return events
+            elif char == "," and self._depth == 2 and self._item_start is not None:
+                self._close_item(events)
+                self._item_start = self._pos + 1
+            elif char == "," and self._depth == 1:
+                self._close_member(events)
+                self._trim(self._pos + 1)
+                continue
+            elif char == ":" and self._depth == 1 and self._value_start is None:
+                self._key = json.loads(self._buffer[:self._pos].strip().lstrip(","))
+                self._value_start = self._pos + 1
+            self._pos += 1
+
+        self._emit_partial_string(events)
+        return events
+
+    def _trim(self, index):
+        """Drop consumed text so memory stays bounded by the member being parsed"""
+        self._buffer = self._buffer[index:]
+        self._pos = 0
+        self._value_start = None
+        self._item_start = None
+        self._key = None
+
+    def _close_item(self, events):
+        raw = self._buffer[self._item_start:self._pos].strip()
+        if raw:
+            self._items.append(json.loads(raw))
+            events.append(("partial", self._key, list(self._items)))
+
+    def _close_member(self, events):
+        if self._value_start is None:
+            return
+        raw = self._buffer[self._value_start:self._pos].strip()
+        if raw:
+            events.append(("complete", self._key, json.loads(raw)))
+
+    def _emit_partial_string(self, events):
+        if not self._in_string or self._depth != 1 or self._value_start is None:
+            return
+        raw = self._buffer[self._value_start:self._pos].lstrip()
+        if not raw.startswith('"'):
+            return
+        text = raw[1:]
+        if text.endswith("\\"):
+            text = text[:-1]
+        try:
+            events.append(("partial", self._key, json.loads(f'"{text}"')))
+        except ValueError:
+            pass  # Cut inside an escape sequence - the next chunk completes it
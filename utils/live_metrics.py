@@ -0,0 +1,166 @@
+import os
+import threading
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from utils.analytics import get_corpus
+from utils.atomic_io import atomic_write_json
+from utils.data_access import load_json
+from utils.job_store import get_job_store
+from utils.skills import skill_name
+from utils.status_journal import get_status_journal
+
+LIVE_METRICS_PATH = "data/live_metrics.json"
+
+
+def _pct_change(current, previous):
+    if not previous:
+        return 0
+    return int(round((current - previous) / previous * 100))
+
+
+def time_ago(timestamp):
+    """ISO timestamp -> "5m ago" style label"""
+    try:
+        seconds = (datetime.now() - datetime.fromisoformat(timestamp)).total_seconds()
+    except (TypeError, ValueError):
+        return "recently"
+    if seconds < 60:
+        return "just now"
+    if seconds < 3600:
+        return f"{int(seconds // 60)}m ago"
+    if seconds < 86400:
+        return f"{int(seconds // 3600)}h ago"
+    return f"{int(seconds // 86400)}d ago"
+
+
+def activity_feed(status, metrics, limit=5):
+    """⚡ Activity items from real scheduler runs and the current counters - newest first"""
+    items = []
+    scraping = status.get("job_scraping", {})
+    if scraping.get("last_run"):
+        if scraping.get("status") == "error":
+            text = f"⚠️ Scrape failed: {scraping.get('error', 'unknown error')}"
+        else:
+            text = f"🔍 Scraped {scraping.get('new_jobs', 0)} new jobs from {scraping.get('jobs_found', 0)} postings"
+        items.append({"text": text, "at": scraping["last_run"]})
+        if scraping.get("near_duplicates"):
+            items.append({"text": f"🪞 {scraping['near_duplicates']} cross-board reposts merged",
+                          "at": scraping["last_run"]})
+
+    analysis = status.get("market_analysis", {})
+    if analysis.get("last_run"):
+        items.append({"text": f"🤖 AI analyzed {analysis.get('jobs_analyzed', 0)} jobs",
+                      "at": analysis["last_run"]})
+
+    report = status.get("daily_report", {})
+    if report.get("last_run") and report.get("status") != "error":
+        items.append({"text": "📊 Daily market report generated", "at": report["last_run"]})
+
+    updated_at = metrics["updated_at"]
+    if metrics.get("top_skill"):
+        items.append({"text": f"🎯 HOT: {metrics['top_skill']} is the most requested skill", "at": updated_at})
+    if metrics.get("companies_hiring"):
+        items.append({"text": f"🏢 HIRING: {metrics['companies_hiring']} companies hiring in the last 2 weeks",
+                      "at": updated_at})
+    if metrics.get("remote_share") is not None:
+        items.append({"text": f"🌍 Remote roles: {metrics['remote_share']}% of open postings", "at": updated_at})
+
+    items.sort(key=lambda item: item["at"], reverse=True)
+    return items[:limit]
+
+
+def compute_live_metrics(store, status=None):
+    """📈 Counters for the live dashboard, computed from the store's aggregates and columnar corpus"""
+    now = datetime.now()
+    today = now.strftime("%Y-%m-%d")
+    yesterday = (now - timedelta(days=1)).strftime("%Y-%m-%d")
+
+    trends = store.trend_summary(days=14, top_n=1)
+    daily = trends.get("daily_jobs", {})
+    week_start = (now - timedelta(days=6)).strftime("%Y-%m-%d")
+    this_week = sum(count for day, count in daily.items() if day >= week_start)
+    last_week = sum(count for day, count in daily.items() if day < week_start)
+
+    corpus = get_corpus(store)
+    jobs = corpus.jobs
+    salaries = jobs["salary_mid"]
+    recent = pd.Series(jobs["posted_date"].fillna("").astype(str) >= week_start, index=jobs.index)
+    avg_salary = salaries.mean()
+    recent_salary = salaries[recent].mean()
+    earlier_salary = salaries[~recent].mean()
+    top_skills = corpus.top_skills(1)
+
+    scraping = (status or {}).get("job_scraping", {})
+    metrics = {
+        "jobs_today": int(daily.get(today, 0)),
+        "jobs_change": int(daily.get(today, 0) - daily.get(yesterday, 0)),
+        "avg_salary": None if pd.isna(avg_salary) else int(round(avg_salary)),
+        "salary_change_pct": (0 if pd.isna(recent_salary) or pd.isna(earlier_salary)
+                              else _pct_change(recent_salary, earlier_salary)),
+        "growth_rate": _pct_change(this_week, last_week),
+        "ai_jobs": int((jobs["category"] == "AI/ML").sum()) if len(jobs) else 0,
+        "total_jobs": len(corpus),
+        "new_jobs_last_scrape": int(scraping.get("new_jobs", 0)),
+        "companies_hiring": trends.get("companies_hiring", 0),
+        "remote_share": int(round(jobs["is_remote"].mean() * 100)) if len(jobs) else None,
+        "top_skill": skill_name(next(iter(top_skills))) if top_skills else None,
+        "updated_at": now.isoformat()
+    }
+    metrics["activity"] = activity_feed(status or {}, metrics)
+    return metrics
+
+
+def empty_live_metrics():
+    """Snapshot shown before the worker has published one"""
+    return {
+        "jobs_today": 0, "jobs_change": 0, "avg_salary": None, "salary_change_pct": 0, "growth_rate": 0,
+        "ai_jobs": 0, "total_jobs": 0, "new_jobs_last_scrape": 0, "companies_hiring": 0,
+        "remote_share": None, "top_skill": None, "updated_at": "", "activity": []
+    }
+
+
+class LiveMetrics:
+    """📡 Precomputed live-dashboard snapshot
+
+    The scheduler calls `refresh` after each run; the new snapshot replaces the
+    old one in a single reference swap and is persisted for other processes.
+    Page renders call `snapshot`, which only returns a ready-made dict - it
+    never computes metrics itself, so a page never queries the store.
+    """
+
+    def __init__(self, path=LIVE_METRICS_PATH):
+        self.path = path
+        self._snapshot = None
+        self._refresh_lock = threading.Lock()
+
+    def refresh(self, store=None, status=None):
+        with self._refresh_lock:
+            store = store or get_job_store()
+            if status is None:
+                status = get_status_journal().status()
+            snapshot = compute_live_metrics(store, status)
+            self._persist(snapshot)
+            self._snapshot = snapshot
+        return snapshot
+
+    def _persist(self, snapshot):
+        atomic_write_json(self.path, snapshot)
+
+    def snapshot(self):
+        """Latest snapshot - this process's, a newer one persisted by the worker, or an empty one"""
+        current = self._snapshot
+        persisted = load_json(self.path)
+        if isinstance(persisted, dict) and persisted.get("updated_at", "") > (current or {}).get("updated_at", ""):
+            # Kept as the last good snapshot should the file later go missing or turn unreadable
+            self._snapshot = current = persisted
+        return current if current is not None else empty_live_metrics()
+
+
+_live_metrics = LiveMetrics()
+
+
+def get_live_metrics():
+    """Process-wide live metrics holder"""
+    return _live_metrics
@@ -0,0 +1,70 @@
+import hashlib
+import json
+import time
+
+from utils.job_store import DEFAULT_DB_PATH, SQLiteBacked
+
+
+def prompt_cache_key(model, template, payload):
+    """Hash of everything that determines a completion: model, prompt template and the data filled into it"""
+    digest = hashlib.sha256()
+    for part in (model, template, payload):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class LLMResponseCache(SQLiteBacked):
+    """🧠 Persistent prompt/response cache - identical analyses are answered without spending tokens"""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS llm_responses (
+        cache_key TEXT PRIMARY KEY,
+        model TEXT NOT NULL,
+        response TEXT NOT NULL,
+        created_at REAL NOT NULL,
+        last_used REAL NOT NULL,
+        hits INTEGER NOT NULL DEFAULT 0
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_llm_responses_last_used ON llm_responses(last_used);
+    CREATE INDEX IF NOT EXISTS idx_llm_responses_created_at ON llm_responses(created_at);
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH, ttl_seconds=24 * 3600, max_entries=500):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        super().__init__(path)
+
+    def get(self, key):
+        """Cached response for `key`, or None when missing or older than the TTL"""
+        now = time.time()
+        with self.transaction() as conn:
+            row = conn.execute("SELECT response, created_at FROM llm_responses WHERE cache_key = ?",
+                               (key,)).fetchone()
+            if row is None:
+                return None
+            if now - row["created_at"] > self.ttl_seconds:
+                conn.execute("DELETE FROM llm_responses WHERE cache_key = ?", (key,))
+                return None
+            conn.execute("UPDATE llm_responses SET last_used = ?, hits = hits + 1 WHERE cache_key = ?", (now, key))
+        return json.loads(row["response"])
+
+    def put(self, key, model, response):
+        """Store a response, then evict expired and least-recently-used entries beyond max_entries"""
+        now = time.time()
+        with self.transaction() as conn:
+            conn.execute(
+                """INSERT OR REPLACE INTO llm_responses (cache_key, model, response, created_at, last_used, hits)
+                   VALUES (?, ?, ?, ?, ?, 0)""",
+                (key, model, json.dumps(response, separators=(",", ":")), now, now)
+            )
+            conn.execute("DELETE FROM llm_responses WHERE created_at < ?", (now - self.ttl_seconds,))
+            conn.execute(
+                """DELETE FROM llm_responses WHERE cache_key IN
+                   (SELECT cache_key FROM llm_responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)""",
+                (self.max_entries,)
+            )
+
+    def stats(self):
+        row = self.connect().execute("SELECT COUNT(*), COALESCE(SUM(hits), 0) FROM llm_responses").fetchone()
+        return {"entries": row[0], "hits": row[1], "max_entries": self.max_entries, "ttl_seconds": self.ttl_seconds}
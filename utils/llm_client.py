@@ -0,0 +1,220 @@
+import asyncio
+import queue
+import random
+import threading
+import time
+
+import openai
+
+# Errors worth another attempt - everything else is surfaced immediately
+RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+    asyncio.TimeoutError,
+)
+
+
+class TokenBucket:
+    """🪣 Token bucket rate limiter - `rate` requests per second, bursting up to `capacity`"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self):
+        """Take a token, returning how long the caller must wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    async def acquire(self):
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+
+class AsyncLLMClient:
+    """⚡ Async chat-completion client - bounded concurrency, rate limiting, jittered retries and timeouts
+
+    All requests run on one private event loop thread, so Streamlit scripts and
+    scheduler threads can submit work (or fan out many prompts) without blocking
+    each other on a slow completion.
+    """
+
+    def __init__(self, api_key, model="gpt-3.5-turbo", base_url=None, max_concurrency=4,
+                 requests_per_minute=60, timeout=30, max_retries=4, backoff_base=1.0, backoff_cap=30.0):
+        self.api_key = api_key
+        self.model = model
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.max_concurrency = max_concurrency
+        self.bucket = TokenBucket(requests_per_minute / 60.0, capacity=max_concurrency)
+
+        self._loop = None
+        self._thread = None
+        self._client = None
+        self._semaphore = None
+        self._start_lock = threading.Lock()
+
+    def _ensure_loop(self):
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=loop.run_forever, name="llm-client", daemon=True)
+                self._thread.start()
+                self._loop = loop
+        return self._loop
+
+    def close(self, timeout=5):
+        """Close the HTTP session and stop the loop thread - the next request starts fresh ones"""
+        with self._start_lock:
+            loop, thread, client = self._loop, self._thread, self._client
+            self._loop = self._thread = self._client = self._semaphore = None
+        if loop is None:
+            return
+        if client is not None:
+            try:
+                asyncio.run_coroutine_threadsafe(client.close(), loop).result(timeout=timeout)
+            except Exception:
+                pass
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+
+    def _ensure_session(self):
+        # Created lazily on the client loop so they bind to it
+        if self._client is None:
+            self._client = openai.AsyncOpenAI(api_key=self.api_key, base_url=self.base_url,
+                                              timeout=self.timeout, max_retries=0)
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    def _backoff(self, attempt, error):
+        retry_after = getattr(getattr(error, "response", None), "headers", {}).get("retry-after")
+        if retry_after:
+            try:
+                return min(float(retry_after), self.backoff_cap)
+            except ValueError:
+                pass
+        # Full jitter keeps concurrent retries from synchronizing
+        return random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+
+    async def complete(self, prompt, max_tokens=500, temperature=0.7):
+        """One chat completion, returning the message text"""
+        self._ensure_session()
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self.bucket.acquire()
+                try:
+                    response = await asyncio.wait_for(
+                        self._client.chat.completions.create(
+                            model=self.model,
+                            messages=[{"role": "user", "content": prompt}],
+                            max_tokens=max_tokens,
+                            temperature=temperature
+                        ),
+                        timeout=self.timeout
+                    )
+                    return response.choices[0].message.content
+                except RETRYABLE_ERRORS as e:
+                    if attempt == self.max_retries:
+                        raise
+                    await asyncio.sleep(self._backoff(attempt, e))
+
+    async def stream(self, prompt, max_tokens=500, temperature=0.7):
+        """Yield completion text deltas as they arrive - retries only happen before the first token"""
+        self._ensure_session()
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self.bucket.acquire()
+                try:
+                    response = await asyncio.wait_for(
+                        self._client.chat.completions.create(
+                            model=self.model,
+                            messages=[{"role": "user", "content": prompt}],
+                            max_tokens=max_tokens,
+                            temperature=temperature,
+                            stream=True
+                        ),
+                        timeout=self.timeout
+                    )
+                    break
+                except RETRYABLE_ERRORS as e:
+                    if attempt == self.max_retries:
+                        raise
+                    await asyncio.sleep(self._backoff(attempt, e))
+
+            async for chunk in response:
+                delta = chunk.choices[0].delta.content if chunk.choices else None
+                if delta:
+                    yield delta
+
+    async def complete_many(self, prompts, **kwargs):
+        """Fan out several prompts at once; failed prompts come back as exception objects"""
+        return await asyncio.gather(*(self.complete(p, **kwargs) for p in prompts), return_exceptions=True)
+
+    def submit(self, coro):
+        """Schedule a coroutine on the client loop, returning a concurrent.futures.Future"""
+        return asyncio.run_coroutine_threadsafe(coro, self._ensure_loop())
+
+    def complete_sync(self, prompt, **kwargs):
+        """Blocking wrapper for callers outside the event loop"""
+        deadline = self.timeout * (self.max_retries + 1) + self.backoff_cap * self.max_retries
+        return self.submit(self.complete(prompt, **kwargs)).result(timeout=deadline)
+
+    def stream_sync(self, prompt, **kwargs):
+        """Blocking generator over streamed deltas, for Streamlit scripts and worker threads"""
+        done = object()
+        deltas = queue.Queue()
+
+        async def pump():
+            try:
+                async for delta in self.stream(prompt, **kwargs):
+                    deltas.put(delta)
+            except Exception as e:
+                deltas.put(e)
+            finally:
+                deltas.put(done)
+
+        future = self.submit(pump())
+        # The first token may sit behind retries; after that a stall longer than the timeout is an error
+        wait = self.timeout * (self.max_retries + 1) + self.backoff_cap * self.max_retries
+        try:
+            while True:
+                item = deltas.get(timeout=wait)
+                wait = self.timeout
+                if item is done:
+                    return
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            future.cancel()
+
+    def complete_many_sync(self, prompts, **kwargs):
+        deadline = self.timeout * (self.max_retries + 1) + self.backoff_cap * self.max_retries
+        return self.submit(self.complete_many(prompts, **kwargs)).result(timeout=deadline * max(1, len(prompts)))
+
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def get_llm_client(api_key, model="gpt-3.5-turbo", base_url=None, **kwargs):
+    """⚡ Shared client for this process - one loop thread and HTTP session per API key/model/endpoint"""
+    cache_key = (api_key, model, base_url, tuple(sorted(kwargs.items())))
+    with _clients_lock:
+        if cache_key not in _clients:
+            _clients[cache_key] = AsyncLLMClient(api_key, model=model, base_url=base_url, **kwargs)
+        return _clients[cache_key]
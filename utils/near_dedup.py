@@ -0,0 +1,233 @@
+import hashlib
+import random
+from array import array
+from datetime import datetime, timedelta
+
+from utils.dedup import normalize_text
+from utils.job_store import DEFAULT_DB_PATH, SQLiteBacked, job_key
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+# Bump whenever job_shingles changes - stored signatures are rebuilt to match
+SHINGLE_VERSION = "2"
+_TITLE_ABBREVIATIONS = {"sr": "senior", "jr": "junior", "eng": "engineer", "dev": "developer", "mgr": "manager"}
+
+
+def job_shingles(job, description_k=3, title_weight=6, max_description=32):
+    """Field-tagged shingles - weighted title, company and location words plus sampled k-word description shingles
+
+    The title counts `title_weight` times (words, word pairs and the whole title)
+    and the description contributes at most `max_description` shingles - its
+    bottom-k by hash, a consistent sample - so a long shared description can't
+    merge an internship into the full-time role it was copied from.
+    """
+    title = [_TITLE_ABBREVIATIONS.get(word, word) for word in normalize_text(job.get("title")).split()]
+    title_shingles = set(title) | {" ".join(pair) for pair in zip(title, title[1:])} | {"=" + " ".join(title)}
+    shingles = {f"t{copy}:{token}" for copy in range(title_weight) for token in title_shingles}
+    for field, tag in (("company", "c"), ("location", "l")):
+        shingles.update(f"{tag}:{token}" for token in normalize_text(job.get(field)).split())
+
+    words = normalize_text(job.get("description")).split()
+    description = {"d:" + " ".join(words[i:i + description_k])
+                   for i in range(max(len(words) - description_k + 1, 0))}
+    shingles.update(sorted(description, key=_hash_shingle)[:max_description])
+    return shingles
+
+
+def _hash_shingle(shingle):
+    return int.from_bytes(hashlib.blake2b(shingle.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+class MinHasher:
+    """🔢 MinHash signatures via universal hashing - the fraction of equal slots estimates Jaccard similarity"""
+
+    def __init__(self, num_perm=64, seed=1):
+        rng = random.Random(seed)
+        self.num_perm = num_perm
+        self._params = [(rng.randrange(1, _MERSENNE_PRIME), rng.randrange(0, _MERSENNE_PRIME))
+                        for _ in range(num_perm)]
+
+    def signature(self, shingles):
+        hashes = [_hash_shingle(s) for s in shingles] or [0]
+        return array("Q", (
+            min(((a * h + b) % _MERSENNE_PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._params
+        ))
+
+    @staticmethod
+    def similarity(sig_a, sig_b):
+        return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+
+def lsh_bands(num_perm, threshold):
+    """Pick (bands, rows) with bands * rows == num_perm whose S-curve knee sits closest to threshold"""
+    options = [(b, num_perm // b) for b in range(1, num_perm + 1) if num_perm % b == 0]
+    return min(options, key=lambda br: abs((1 / br[0]) ** (1 / br[1]) - threshold))
+
+
+class NearDuplicateIndex(SQLiteBacked):
+    """🪞 MinHash/LSH near-duplicate index - clusters reposts across boards in sub-linear time per job"""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS minhash_signatures (
+        job_key TEXT PRIMARY KEY,
+        signature BLOB NOT NULL,
+        seen_at TEXT NOT NULL
+    ) WITHOUT ROWID;
+    CREATE TABLE IF NOT EXISTS lsh_buckets (
+        band INTEGER NOT NULL,
+        bucket TEXT NOT NULL,
+        job_key TEXT NOT NULL,
+        PRIMARY KEY (band, bucket, job_key)
+    ) WITHOUT ROWID;
+    CREATE TABLE IF NOT EXISTS near_duplicates (
+        job_key TEXT PRIMARY KEY,
+        cluster_id TEXT NOT NULL,
+        similarity REAL NOT NULL,
+        source TEXT,
+        seen_at TEXT NOT NULL
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_lsh_buckets_job_key ON lsh_buckets(job_key);
+    CREATE INDEX IF NOT EXISTS idx_near_duplicates_cluster ON near_duplicates(cluster_id);
+    CREATE INDEX IF NOT EXISTS idx_minhash_signatures_seen_at ON minhash_signatures(seen_at);
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH, threshold=0.8, num_perm=64):
+        self.threshold = threshold
+        self.hasher = MinHasher(num_perm)
+        self.bands, self.rows = lsh_bands(num_perm, threshold)
+        super().__init__(path)
+
+    def _buckets(self, signature):
+        for band in range(self.bands):
+            chunk = signature[band * self.rows:(band + 1) * self.rows]
+            yield band, hashlib.blake2b(chunk.tobytes(), digest_size=8).hexdigest()
+
+    def _best_match(self, conn, signature, buckets, staged):
+        candidates = set()
+        for band, bucket in buckets:
+            candidates.update(row[0] for row in conn.execute(
+                "SELECT job_key FROM lsh_buckets WHERE band = ? AND bucket = ?", (band, bucket)
+            ))
+            candidates.update(staged["buckets"].get((band, bucket), ()))
+
+        best = None
+        for key in candidates:
+            if key in staged["signatures"]:
+                other = staged["signatures"][key][0]
+            else:
+                row = conn.execute("SELECT signature FROM minhash_signatures WHERE job_key = ?", (key,)).fetchone()
+                if row is None:
+                    continue
+                other = array("Q", row[0])
+            similarity = MinHasher.similarity(signature, other)
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (key, similarity)
+        return best
+
+    def _index(self, conn, key, signature, buckets, now):
+        conn.execute("INSERT OR REPLACE INTO minhash_signatures (job_key, signature, seen_at) VALUES (?, ?, ?)",
+                     (key, signature.tobytes(), now))
+        conn.executemany("INSERT OR IGNORE INTO lsh_buckets (band, bucket, job_key) VALUES (?, ?, ?)",
+                         [(band, bucket, key) for band, bucket in buckets])
+
+    def filter_unique(self, jobs, stats=None, staged=None):
+        """Yield postings that are not near-duplicates of an indexed or earlier job in this scrape
+
+        Nothing is written yet: signatures of yielded jobs and the reposts'
+        cluster records are staged in `staged`, and `commit` persists them once
+        the store holds the postings - an aborted scrape leaves no phantom
+        signatures for later postings to be suppressed against.
+        """
+        stats = stats if stats is not None else {}
+        stats.update(checked=0, near_duplicates=0)
+        staged = staged if staged is not None else {}
+        for part in ("signatures", "buckets", "duplicates"):
+            staged.setdefault(part, {})
+        conn = self.connect()
+
+        for job in jobs:
+            stats["checked"] += 1
+            key = job_key(job)
+            signature = self.hasher.signature(job_shingles(job))
+            buckets = list(self._buckets(signature))
+
+            match = self._best_match(conn, signature, buckets, staged)
+            if match and match[0] != key:
+                staged["duplicates"][key] = (match[0], match[1], job.get("source"))
+                stats["near_duplicates"] += 1
+                continue
+            staged["signatures"][key] = (signature, buckets)
+            for bucket in buckets:
+                staged["buckets"].setdefault(bucket, []).append(key)
+            yield job
+
+    def commit(self, staged):
+        """Persist what `filter_unique` staged - call once the store has committed the yielded postings"""
+        now = datetime.now().isoformat()
+        with self.transaction() as conn:
+            for key, (signature, buckets) in staged.get("signatures", {}).items():
+                self._index(conn, key, signature, buckets, now)
+            for key, (cluster_id, similarity, source) in staged.get("duplicates", {}).items():
+                # A repost keeps its cluster's original alive
+                conn.execute("UPDATE minhash_signatures SET seen_at = ? WHERE job_key = ?", (now, cluster_id))
+                conn.execute(
+                    """INSERT OR REPLACE INTO near_duplicates (job_key, cluster_id, similarity, source, seen_at)
+                       VALUES (?, ?, ?, ?, ?)""",
+                    (key, cluster_id, similarity, source, now)
+                )
+
+    def touch(self, keys):
+        """Mark re-sighted postings (and the clusters their reposts belong to) as seen now"""
+        keys = list(keys)
+        now = datetime.now().isoformat()
+        with self.transaction() as conn:
+            for start in range(0, len(keys), 900):
+                chunk = keys[start:start + 900]
+                placeholders = ",".join("?" * len(chunk))
+                conn.execute(f"UPDATE near_duplicates SET seen_at = ? WHERE job_key IN ({placeholders})",
+                             [now] + chunk)
+                conn.execute(
+                    f"""UPDATE minhash_signatures SET seen_at = ? WHERE job_key IN ({placeholders})
+                        OR job_key IN (SELECT cluster_id FROM near_duplicates WHERE job_key IN ({placeholders}))""",
+                    [now] + chunk + chunk
+                )
+
+    def cluster_stats(self):
+        """Summary of repost clusters found so far"""
+        conn = self.connect()
+        clusters, duplicates, largest = conn.execute(
+            """SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(MAX(size), 0) FROM
+               (SELECT cluster_id, COUNT(*) AS size FROM near_duplicates GROUP BY cluster_id)"""
+        ).fetchone()
+        indexed = conn.execute("SELECT COUNT(*) FROM minhash_signatures").fetchone()[0]
+        return {
+            "indexed_jobs": indexed,
+            "clusters_with_reposts": clusters,
+            "duplicates_suppressed": duplicates,
+            "largest_cluster": largest + 1 if largest else 0,
+            "threshold": self.threshold,
+            "bands": self.bands,
+            "rows_per_band": self.rows
+        }
+
+    def expire(self, max_age_days):
+        """Forget signatures and repost records older than the retention window"""
+        cutoff = (datetime.now() - timedelta(days=max_age_days)).isoformat()
+        with self.transaction() as conn:
+            conn.execute("""DELETE FROM lsh_buckets WHERE job_key IN
+                            (SELECT job_key FROM minhash_signatures WHERE seen_at < ?)""", (cutoff,))
+            removed = conn.execute("DELETE FROM minhash_signatures WHERE seen_at < ?", (cutoff,)).rowcount
+            conn.execute("DELETE FROM near_duplicates WHERE seen_at < ?", (cutoff,))
+        return removed
+
+    def rebuild(self, store):
+        """Re-index every posting in `store` from scratch"""
+        now = datetime.now().isoformat()
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM lsh_buckets")
+            conn.execute("DELETE FROM minhash_signatures")
+            conn.execute("DELETE FROM near_duplicates")
+            for job in store.iter_jobs():
+                signature = self.hasher.signature(job_shingles(job))
+                self._index(conn, job_key(job), signature, list(self._buckets(signature)), now)
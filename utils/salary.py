@@ -0,0 +1,102 @@
+import numpy as np
+import pandas as pd
+
+# 💱 Rough conversion to USD so percentiles compare like with like
+CURRENCY_TO_USD = {
+    "USD": 1.0, "EUR": 1.08, "GBP": 1.27, "CAD": 0.74, "AUD": 0.66, "INR": 0.012, "CHF": 1.12, "JPY": 0.0067
+}
+CURRENCY_SYMBOLS = {"$": "USD", "€": "EUR", "£": "GBP", "₹": "INR", "¥": "JPY"}
+
+# Multipliers that turn a pay period into a yearly figure
+PERIOD_TO_YEARLY = {"hour": 2080, "day": 260, "week": 52, "month": 12, "year": 1}
+
+SUFFIX_MULTIPLIERS = {"k": 1_000, "m": 1_000_000}
+
+_RANGE_PATTERN = (
+    r"(?P<cur1>[$€£₹¥])?\s*(?P<low>\d+(?:[.,]\d+)*)\s*(?P<low_suffix>[kKmM])?(?![a-zA-Z])"
+    r"(?:\s*(?:-|–|—|to)\s*(?P<cur2>[$€£₹¥])?\s*(?P<high>\d+(?:[.,]\d+)*)\s*(?P<high_suffix>[kKmM])?(?![a-zA-Z]))?"
+)
+# Thousands groups: 1-3 leading digits, then "."- or ","-separated 3-digit groups, then an optional decimal part
+_GROUPED_PATTERN = r"^\d{1,3}(?P<sep>[.,])\d{3}(?:(?P=sep)\d{3})*(?:(?!(?P=sep))[.,]\d+)?$"
+_CODE_PATTERN = r"\b(" + "|".join(CURRENCY_TO_USD) + r")\b"
+# Everything before the first amount that is marked as money - a currency symbol or code, or a K/M suffix -
+# including the low bound of a range ending in one ("120 - 180K"), so "5+ years, $120K" parses as $120K
+_ANCHOR_PATTERN = (
+    r"(?s)^.*?(?=(?:\d+(?:[.,]\d+)*\s*[kKmM]?\s*(?:-|–|—|to)\s*)?"
+    r"(?:[$€£₹¥]|\d+(?:[.,]\d+)*\s*[kKmM](?![a-zA-Z])|\b(?i:" + "|".join(CURRENCY_TO_USD) + r")\s*\d))"
+)
+_PERIOD_PATTERNS = [
+    ("hour", r"(?:/\s*h(?:ou)?r\b|per hour|hourly|an hour)"),
+    ("day", r"(?:/\s*day\b|per day|daily)"),
+    ("week", r"(?:/\s*w(?:ee)?k\b|per week|weekly)"),
+    ("month", r"(?:/\s*mo(?:nth)?\b|per month|monthly)"),
+]
+
+
+def _to_number(digits, suffix):
+    # Decided per token: "€50.000" and "$50,000" group thousands, "1.5" and "1,5" are decimals
+    thousands = digits.str.extract(_GROUPED_PATTERN)["sep"]
+    for separator in (".", ","):
+        digits = digits.where(thousands != separator, digits.str.replace(separator, "", regex=False))
+    value = pd.to_numeric(digits.str.replace(",", ".", regex=False), errors="coerce")
+    multiplier = suffix.str.lower().map(SUFFIX_MULTIPLIERS).fillna(1)
+    return value * multiplier
+
+
+def normalize_salaries(salaries):
+    """💰 Parse a batch of free-text salaries in one vectorized pass
+
+    Handles ranges ("$120K - $180K"), single values, K/M suffixes, "." or ","
+    thousands separators ("€50.000", "1,234.50", "1.234,50"), currency
+    symbols or ISO codes and hourly/daily/weekly/monthly pay periods.
+    Returns a DataFrame with salary_min / salary_max / salary_mid in yearly USD,
+    plus the detected currency and period; unparseable rows are NaN.
+    """
+    text = pd.Series(salaries, dtype="object").fillna("").astype(str)
+    lowered = text.str.lower()
+    # Strings without a marked amount fall back to their first number
+    parts = text.str.replace(_ANCHOR_PATTERN, "", n=1, regex=True).str.extract(_RANGE_PATTERN)
+
+    low = _to_number(parts["low"], parts["low_suffix"].fillna(""))
+    high = _to_number(parts["high"], parts["high_suffix"].fillna(parts["low_suffix"]).fillna(""))
+    # "$120 - 180K" shares the suffix; a bare low bound inherits the high bound's suffix
+    low = low.where(parts["low_suffix"].notna() | parts["high_suffix"].isna(),
+                    low * parts["high_suffix"].fillna("").str.lower().map(SUFFIX_MULTIPLIERS).fillna(1))
+    high = high.fillna(low)
+
+    currency = parts["cur1"].fillna(parts["cur2"]).map(CURRENCY_SYMBOLS)
+    currency = currency.fillna(text.str.upper().str.extract(_CODE_PATTERN)[0]).fillna("USD")
+    rate = currency.map(CURRENCY_TO_USD).fillna(1.0)
+
+    period = pd.Series(np.select([lowered.str.contains(p, regex=True) for _, p in _PERIOD_PATTERNS],
+                                 [name for name, _ in _PERIOD_PATTERNS], default="year"),
+                       index=text.index)
+    yearly = period.map(PERIOD_TO_YEARLY) * rate
+
+    result = pd.DataFrame({
+        "salary_min": low * yearly,
+        "salary_max": high * yearly,
+        "currency": currency.astype("category"),
+        "period": period.astype("category")
+    })
+    result["salary_mid"] = (result["salary_min"] + result["salary_max"]) / 2
+    return result
+
+
+def salary_percentiles(frame, by=None, column="salary_mid", percentiles=(0.25, 0.5, 0.75)):
+    """Percentiles of `column` overall or per group, ignoring rows without a salary"""
+    salaries = frame.dropna(subset=[column])
+    if salaries.empty:
+        return {}
+    if by is None:
+        return {f"p{int(q * 100)}": value for q, value in salaries[column].quantile(list(percentiles)).items()}
+    grouped = salaries.groupby(by, observed=True)[column].quantile(list(percentiles)).unstack()
+    grouped.columns = [f"p{int(q * 100)}" for q in grouped.columns]
+    return {group: row.to_dict() for group, row in grouped.iterrows()}
+
+
+def format_salary(value):
+    """120000 -> "$120K" """
+    if value is None or pd.isna(value):
+        return "n/a"
+    return f"${value / 1000:,.0f}K"
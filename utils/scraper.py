@@ -1,21 +1,86 @@
 import requests
-from bs4 import BeautifulSoup
 import pandas as pd
 import json
 import time
 import random
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import logging
+import os
+import sys
 import streamlit as st
 
+# Add project root to path
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from utils.http_client import PooledHttpClient
+from utils.html_stream import SELECTOR_SPECS, iter_jobs_from_chunks
+from utils.job_store import get_job_store
+from utils.data_access import load_jobs
+from utils.skills import get_skill_extractor
+
+logger = logging.getLogger(__name__)
+
+# 🧩 Source registry - every scraper method decorated with @job_source can be fetched by iter_jobs
+JOB_SOURCES = {}
+# Sources a scraper fetches unless CAREERCRYSTAL_JOB_SOURCES (comma-separated, "all" for every one) says otherwise
+DEFAULT_JOB_SOURCES = "github,remote"
+
+def job_source(name, host):
+    """Register a JobScraper method as a job source served from `host`"""
+    def decorator(func):
+        JOB_SOURCES[name] = {"method": func.__name__, "host": host}
+        return func
+    return decorator
+
+def enabled_job_sources(setting=None):
+    """Registered source names selected by `setting` or CAREERCRYSTAL_JOB_SOURCES"""
+    setting = setting or os.getenv("CAREERCRYSTAL_JOB_SOURCES", DEFAULT_JOB_SOURCES)
+    wanted = {name.strip() for name in setting.split(",") if name.strip()}
+    unknown = wanted - set(JOB_SOURCES) - {"all"}
+    if unknown:
+        logger.warning(f"⚠️ Unknown job sources ignored: {', '.join(sorted(unknown))}")
+    return [name for name in JOB_SOURCES if "all" in wanted or name in wanted]
+
+class HostThrottle:
+    """⏱️ Per-host politeness delay - requests to the same host are spaced out, different hosts run freely"""
+    
+    def __init__(self, min_interval=1.0):
+        self.min_interval = min_interval
+        self._last_request = {}
+        self._host_locks = {}
+        self._lock = threading.Lock()
+    
+    def _host_lock(self, host):
+        with self._lock:
+            return self._host_locks.setdefault(host, threading.Lock())
+    
+    def wait(self, host):
+        """Block until `host` may be contacted again"""
+        with self._host_lock(host):
+            elapsed = time.monotonic() - self._last_request.get(host, float('-inf'))
+            if elapsed < self.min_interval:
+                time.sleep(self.min_interval - elapsed)
+            self._last_request[host] = time.monotonic()
+
 class JobScraper:
     """🔍 Smart Job Scraper - Ethical web scraping for job data"""
     
-    def __init__(self):
+    def __init__(self, politeness_delay=1.0, max_workers=8, store=None, sources=None):
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         self.job_data = []
+        self.throttle = HostThrottle(politeness_delay)
+        self.max_workers = max_workers
+        self.http = PooledHttpClient(headers=self.headers)
+        self.store = store or get_job_store()
+        self.skill_extractor = get_skill_extractor()
+        self.sources = enabled_job_sources(sources)
     
+    @job_source("github", host="github.com")
     def scrape_github_jobs(self):
         """Scrape GitHub Jobs (example - replace with real implementation)"""
         # This is a placeholder - you would implement real scraping here
@@ -41,6 +106,7 @@ class JobScraper:
         ]
         return sample_jobs
     
+    @job_source("remote", host="remoteok.com")
     def scrape_remote_jobs(self):
         """Scrape remote job boards"""
         # Placeholder for remote job scraping
@@ -57,39 +123,94 @@ class JobScraper:
         ]
         return sample_remote_jobs
     
-    def get_all_jobs(self):
-        """🚀 Fetch all jobs from multiple sources"""
-        all_jobs = []
+    @job_source("remoteok", host="remoteok.com")
+    def scrape_remoteok_jobs(self):
+        """Live RemoteOK listing - streamed through the pooled, ETag-cached session"""
+        return self.scrape_listing("remoteok")
+    
+    def scrape_listing(self, name, url=None):
+        """🌊 Stream a listing page through its selector spec, yielding jobs as each posting is parsed
+
+        Unchanged pages (304) are replayed from the disk cache, so their postings
+        still count as seen. Politeness is applied by _fetch_source.
+        """
+        spec = SELECTOR_SPECS[name]
+        today = datetime.now().strftime("%Y-%m-%d")
+        
+        for job in iter_jobs_from_chunks(self.http.stream(url or spec["url"]), spec):
+            job.setdefault("skills", [])
+            job.setdefault("posted_date", today)
+            job["source"] = name
+            yield job
+    
+    def _fetch_source(self, name, put):
+        """Drain a single registered source through `put`, honouring its host's politeness delay"""
+        source = JOB_SOURCES[name]
+        self.throttle.wait(source["host"])  # Be respectful to servers
+        for job in getattr(self, source["method"])():
+            if not put(job):
+                return
+    
+    def iter_jobs(self, buffer_size=256):
+        """🚀 Lazily yield jobs from every registered source, fetched concurrently, with canonical skills"""
+        done = object()
+        out = queue.Queue(maxsize=buffer_size)  # Bounded so slow consumers apply back-pressure
+        abandoned = threading.Event()
         
-        with st.spinner("🔍 Scanning GitHub for jobs..."):
-            github_jobs = self.scrape_github_jobs()
-            all_jobs.extend(github_jobs)
-            time.sleep(1)  # Be respectful to servers
+        def put(item):
+            # Give up once the consumer has stopped iterating so workers never block forever
+            while not abandoned.is_set():
+                try:
+                    out.put(item, timeout=0.5)
+                    return True
+                except queue.Full:
+                    continue
+            return False
         
-        with st.spinner("🌍 Finding remote opportunities..."):
-            remote_jobs = self.scrape_remote_jobs()
-            all_jobs.extend(remote_jobs)
-            time.sleep(1)
+        def run(name):
+            try:
+                self._fetch_source(name, put)
+            except Exception as e:
+                put(e)
+            finally:
+                put(done)
         
-        return all_jobs
+        workers = max(1, min(self.max_workers, len(self.sources)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="job-source") as pool:
+            for name in self.sources:
+                pool.submit(run, name)
+            
+            remaining = len(self.sources)
+            try:
+                while remaining:
+                    item = out.get()
+                    if item is done:
+                        remaining -= 1
+                    elif isinstance(item, Exception):
+                        logger.warning(f"⚠️ Job source failed: {str(item)}")
+                    else:
+                        item["skills"] = self.skill_extractor.skills_for(item)
+                        yield item
+            finally:
+                abandoned.set()
+    
+    def get_all_jobs(self):
+        """🚀 Fetch all jobs from every registered source concurrently"""
+        with st.spinner(f"🔍 Scanning {len(self.sources)} job sources..."):
+            return list(self.iter_jobs())
     
-    def save_jobs_data(self, jobs, filename="data/jobs_database.json"):
-        """💾 Save scraped job data"""
+    def save_jobs_data(self, jobs):
+        """💾 Upsert scraped jobs into the job store - returns {"processed", "inserted", "updated"} or None on error"""
         try:
-            with open(filename, 'w') as f:
-                json.dump(jobs, f, indent=2)
-            return True
+            return self.store.upsert_jobs(jobs)
         except Exception as e:
             st.error(f"Error saving data: {str(e)}")
-            return False
+            return None
     
-    def load_jobs_data(self, filename="data/jobs_database.json"):
-        """📖 Load existing job data"""
+    def load_jobs_data(self, **filters):
+        """📖 Load stored jobs, optionally filtered by company/source/skill/since/limit (cached per store version)"""
         try:
-            with open(filename, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            return []
+            return load_jobs(self.store, **filters)
         except Exception as e:
             st.error(f"Error loading data: {str(e)}")
             return []
@@ -0,0 +1,337 @@
+import hashlib
+import math
+import re
+import threading
+from collections import Counter
+from datetime import datetime
+
+import numpy as np
+
+from utils.job_store import DEFAULT_DB_PATH, SQLiteBacked, get_job_store, job_key
+from utils.skills import get_skill_extractor, normalize_skill_text
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#]*")
+STOPWORDS = {
+    "a", "an", "and", "are", "as", "at", "be", "by", "for", "from", "in", "is", "it", "of", "on", "or",
+    "our", "the", "to", "we", "will", "with", "you", "your", "job", "jobs"
+}
+
+# Which fields feed the index and how much a mention there counts
+FIELD_WEIGHTS = {"title": 3, "skills": 3, "company": 2, "location": 2, "description": 1}
+
+
+def tokenize(text):
+    return [token for token in _TOKEN.findall(normalize_skill_text(text)) if token not in STOPWORDS]
+
+
+def job_terms(job):
+    """Weighted term counts for a posting - field-boosted words plus canonical skill IDs"""
+    terms = Counter()
+    for field, weight in FIELD_WEIGHTS.items():
+        value = job.get(field)
+        if field == "skills":
+            for skill in value or []:
+                terms[skill] += weight
+            continue
+        for token in tokenize(value):
+            terms[token] += weight
+    return terms
+
+
+def query_terms(query):
+    """Query words plus the canonical skills they name ("ML" also searches machine_learning)"""
+    terms = set(tokenize(query))
+    terms |= get_skill_extractor().extract(query)
+    return sorted(terms)
+
+
+def _hash_feature(term, dim):
+    digest = int.from_bytes(hashlib.blake2b(term.encode("utf-8"), digest_size=8).digest(), "little")
+    return digest % dim, 1.0 if (digest >> 63) else -1.0
+
+
+class HashingEmbedder:
+    """🧮 Local text embeddings - signed feature hashing of weighted terms, L2-normalized
+
+    No model download or API call: vectors are computed in-process, and shared
+    canonical skill IDs pull postings that describe the same stack together.
+    """
+
+    def __init__(self, dim=256):
+        self.dim = dim
+
+    def embed_terms(self, terms):
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for term, weight in terms.items():
+            index, sign = _hash_feature(term, self.dim)
+            vector[index] += sign * (1.0 + math.log(weight))
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def embed_query(self, query):
+        return self.embed_terms(Counter(query_terms(query)))
+
+
+class HyperplaneLSH:
+    """🎯 Random-hyperplane LSH for cosine similarity - each table hashes a vector to `bits` sign bits"""
+
+    def __init__(self, dim, tables=10, bits=14, seed=7):
+        self.tables = tables
+        self.bits = bits
+        planes = np.random.default_rng(seed).standard_normal((tables * bits, dim)).astype(np.float32)
+        self._planes = planes
+        self._weights = (1 << np.arange(bits, dtype=np.int64))
+
+    def buckets(self, vector):
+        signs = (self._planes @ vector > 0).reshape(self.tables, self.bits)
+        return [(table, int(code)) for table, code in enumerate(signs @ self._weights)]
+
+
+class JobSearchIndex(SQLiteBacked):
+    """🔎 Hybrid job search - BM25 over an impact-ordered inverted index plus ANN over local embeddings
+
+    Postings store each term's BM25 impact, indexed by (term, impact), so a query
+    reads only the strongest `postings_per_term` entries per term instead of every
+    match, and only the best `rerank_depth` lexical hits are re-scored by
+    embedding similarity. Embeddings are bucketed by random-hyperplane LSH for
+    approximate nearest-neighbour lookup. The two rankings are merged with
+    reciprocal rank fusion. Jobs are added incrementally as they are scraped.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS search_docs (
+        doc_id INTEGER PRIMARY KEY,
+        job_key TEXT NOT NULL UNIQUE,
+        length REAL NOT NULL,
+        vector BLOB NOT NULL,
+        indexed_at TEXT NOT NULL
+    );
+    CREATE TABLE IF NOT EXISTS search_postings (
+        term TEXT NOT NULL,
+        doc_id INTEGER NOT NULL,
+        impact REAL NOT NULL,
+        PRIMARY KEY (term, doc_id)
+    ) WITHOUT ROWID;
+    CREATE TABLE IF NOT EXISTS search_terms (
+        term TEXT PRIMARY KEY,
+        df INTEGER NOT NULL
+    ) WITHOUT ROWID;
+    CREATE TABLE IF NOT EXISTS search_lsh (
+        lsh_table INTEGER NOT NULL,
+        bucket INTEGER NOT NULL,
+        doc_id INTEGER NOT NULL,
+        PRIMARY KEY (lsh_table, bucket, doc_id)
+    ) WITHOUT ROWID;
+    CREATE TABLE IF NOT EXISTS search_meta (
+        key TEXT PRIMARY KEY,
+        value REAL NOT NULL
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_search_postings_impact ON search_postings(term, impact DESC, doc_id);
+    CREATE INDEX IF NOT EXISTS idx_search_postings_doc ON search_postings(doc_id);
+    CREATE INDEX IF NOT EXISTS idx_search_lsh_doc ON search_lsh(doc_id);
+    CREATE INDEX IF NOT EXISTS idx_search_docs_indexed_at ON search_docs(indexed_at);
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH, dim=256, lsh_tables=10, lsh_bits=14,
+                 k1=1.2, b=0.75, postings_per_term=1000, rerank_depth=200, max_candidates=1000):
+        self.k1 = k1
+        self.b = b
+        self.postings_per_term = postings_per_term
+        self.rerank_depth = rerank_depth
+        self.max_candidates = max_candidates
+        self.embedder = HashingEmbedder(dim)
+        self.lsh = HyperplaneLSH(dim, tables=lsh_tables, bits=lsh_bits)
+        super().__init__(path)
+
+    def _meta(self, conn):
+        rows = dict(conn.execute("SELECT key, value FROM search_meta").fetchall())
+        return rows.get("doc_count", 0.0), rows.get("total_length", 0.0)
+
+    def _set_meta(self, conn, doc_count, total_length):
+        conn.executemany("INSERT OR REPLACE INTO search_meta (key, value) VALUES (?, ?)",
+                         [("doc_count", doc_count), ("total_length", total_length)])
+
+    def _impact(self, tf, length, avg_length):
+        return tf * (self.k1 + 1) / (tf + self.k1 * (1 - self.b + self.b * length / avg_length))
+
+    def _remove_docs(self, conn, doc_ids):
+        removed_length = 0.0
+        for doc_id in doc_ids:
+            terms = [row[0] for row in conn.execute("SELECT term FROM search_postings WHERE doc_id = ?", (doc_id,))]
+            conn.executemany("UPDATE search_terms SET df = df - 1 WHERE term = ?", [(t,) for t in terms])
+            conn.execute("DELETE FROM search_postings WHERE doc_id = ?", (doc_id,))
+            conn.execute("DELETE FROM search_lsh WHERE doc_id = ?", (doc_id,))
+            removed_length += conn.execute("SELECT length FROM search_docs WHERE doc_id = ?",
+                                           (doc_id,)).fetchone()[0]
+            conn.execute("DELETE FROM search_docs WHERE doc_id = ?", (doc_id,))
+            conn.executemany("DELETE FROM search_terms WHERE term = ? AND df <= 0", [(t,) for t in terms])
+        return removed_length
+
+    def _add(self, conn, jobs, now):
+        doc_count, total_length = self._meta(conn)
+        added = 0
+        for job in jobs:
+            key = job_key(job)
+            existing = conn.execute("SELECT doc_id FROM search_docs WHERE job_key = ?", (key,)).fetchone()
+            if existing:
+                total_length -= self._remove_docs(conn, [existing[0]])
+                doc_count -= 1
+
+            terms = job_terms(job)
+            length = float(sum(terms.values()))
+            doc_count += 1
+            total_length += length
+            avg_length = total_length / doc_count
+
+            vector = self.embedder.embed_terms(terms)
+            doc_id = conn.execute(
+                "INSERT INTO search_docs (job_key, length, vector, indexed_at) VALUES (?, ?, ?, ?)",
+                (key, length, vector.tobytes(), now)
+            ).lastrowid
+            conn.executemany("INSERT INTO search_postings (term, doc_id, impact) VALUES (?, ?, ?)",
+                             [(term, doc_id, self._impact(tf, length, avg_length)) for term, tf in terms.items()])
+            conn.executemany(
+                "INSERT INTO search_terms (term, df) VALUES (?, 1) ON CONFLICT(term) DO UPDATE SET df = df + 1",
+                [(term,) for term in terms]
+            )
+            conn.executemany("INSERT OR IGNORE INTO search_lsh (lsh_table, bucket, doc_id) VALUES (?, ?, ?)",
+                             [(table, bucket, doc_id) for table, bucket in self.lsh.buckets(vector)])
+            added += 1
+        self._set_meta(conn, doc_count, total_length)
+        return added
+
+    def add_jobs(self, jobs, batch_size=500):
+        """Index postings incrementally (re-indexing any already present); returns how many were indexed"""
+        now = datetime.now().isoformat()
+        added = 0
+        batch = []
+        for job in jobs:
+            batch.append(job)
+            if len(batch) >= batch_size:
+                with self.transaction() as conn:
+                    added += self._add(conn, batch, now)
+                batch = []
+        if batch:
+            with self.transaction() as conn:
+                added += self._add(conn, batch, now)
+        return added
+
+    def remove_jobs(self, keys):
+        """Drop the documents of the given job keys (e.g. the postings the store just expired)"""
+        keys = list(keys)
+        doc_ids = []
+        with self.transaction() as conn:
+            for start in range(0, len(keys), 900):
+                chunk = keys[start:start + 900]
+                doc_ids.extend(row[0] for row in conn.execute(
+                    f"SELECT doc_id FROM search_docs WHERE job_key IN ({','.join('?' * len(chunk))})", chunk
+                ))
+            if doc_ids:
+                doc_count, total_length = self._meta(conn)
+                removed_length = self._remove_docs(conn, doc_ids)
+                self._set_meta(conn, doc_count - len(doc_ids), total_length - removed_length)
+        return len(doc_ids)
+
+    def rebuild(self, store):
+        """Re-index every posting in `store` from scratch"""
+        with self.transaction() as conn:
+            for table in ("search_postings", "search_terms", "search_lsh", "search_docs", "search_meta"):
+                conn.execute(f"DELETE FROM {table}")
+        return self.add_jobs(store.iter_jobs())
+
+    def __len__(self):
+        return int(self._meta(self.connect())[0])
+
+    def _bm25(self, conn, terms, doc_count):
+        scores = Counter()
+        for term in terms:
+            row = conn.execute("SELECT df FROM search_terms WHERE term = ?", (term,)).fetchone()
+            if row is None:
+                continue
+            idf = math.log(1 + (doc_count - row[0] + 0.5) / (row[0] + 0.5))
+            for doc_id, impact in conn.execute(
+                "SELECT doc_id, impact FROM search_postings WHERE term = ? ORDER BY impact DESC LIMIT ?",
+                (term, self.postings_per_term)
+            ):
+                scores[doc_id] += idf * impact
+        return scores
+
+    def _ann_candidates(self, conn, vector):
+        candidates = set()
+        for table, bucket in self.lsh.buckets(vector):
+            candidates.update(row[0] for row in conn.execute(
+                "SELECT doc_id FROM search_lsh WHERE lsh_table = ? AND bucket = ? LIMIT ?",
+                (table, bucket, self.max_candidates)
+            ))
+            if len(candidates) >= self.max_candidates:
+                break
+        return candidates
+
+    def _vectors(self, conn, doc_ids):
+        doc_ids = list(doc_ids)
+        found_ids, keys, vectors = [], [], []
+        for start in range(0, len(doc_ids), 900):
+            chunk = doc_ids[start:start + 900]
+            placeholders = ",".join("?" * len(chunk))
+            for doc_id, key, blob in conn.execute(
+                f"SELECT doc_id, job_key, vector FROM search_docs WHERE doc_id IN ({placeholders})", chunk
+            ):
+                found_ids.append(doc_id)
+                keys.append(key)
+                vectors.append(np.frombuffer(blob, dtype=np.float32))
+        matrix = np.vstack(vectors) if vectors else np.zeros((0, self.embedder.dim), dtype=np.float32)
+        return found_ids, keys, matrix
+
+    def search(self, query, limit=20, store=None, rrf_k=60):
+        """Top postings for `query` - each result is the job plus its bm25, similarity and fused score"""
+        terms = query_terms(query)
+        if not terms:
+            return []
+        conn = self.connect()
+        doc_count, _ = self._meta(conn)
+        if not doc_count:
+            return []
+
+        bm25 = self._bm25(conn, terms, doc_count)
+        query_vector = self.embedder.embed_query(query)
+        lexical_top = [doc_id for doc_id, _ in bm25.most_common(self.rerank_depth)]
+        candidates = self._ann_candidates(conn, query_vector) | set(lexical_top)
+
+        doc_ids, keys, matrix = self._vectors(conn, candidates)
+        similarity = matrix @ query_vector
+        fused = Counter()
+        for rank, index in enumerate(np.argsort(-similarity)):
+            if similarity[index] > 0:
+                fused[doc_ids[index]] += 1.0 / (rrf_k + rank + 1)
+        for rank, doc_id in enumerate(lexical_top):
+            fused[doc_id] += 1.0 / (rrf_k + rank + 1)
+
+        key_of = dict(zip(doc_ids, keys))
+        similarity_of = dict(zip(doc_ids, similarity.tolist()))
+        # Over-fetch a little: postings expired from the store since indexing are skipped
+        ranked = [doc_id for doc_id, _ in fused.most_common(limit * 2)]
+        jobs = (store or get_job_store()).get_jobs([key_of[doc_id] for doc_id in ranked])
+
+        results = []
+        for doc_id in ranked:
+            job = jobs.get(key_of[doc_id])
+            if job is None:
+                continue
+            results.append({**job, "search_score": fused[doc_id], "bm25": bm25.get(doc_id, 0.0),
+                            "similarity": similarity_of[doc_id]})
+            if len(results) >= limit:
+                break
+        return results
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_search_index():
+    """Shared search index for this process"""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = JobSearchIndex()
+        return _index
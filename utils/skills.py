@@ -0,0 +1,167 @@
+import re
+from collections import deque
+
+# 🧠 Skill taxonomy - canonical ID -> display name and every alias we accept in postings
+SKILL_TAXONOMY = {
+    "python": {"name": "Python", "aliases": ["python", "python3"]},
+    "java": {"name": "Java", "aliases": ["java"]},
+    "javascript": {"name": "JavaScript", "aliases": ["javascript", "js", "ecmascript"]},
+    "typescript": {"name": "TypeScript", "aliases": ["typescript"]},
+    "go": {"name": "Go", "aliases": ["golang"]},
+    "rust": {"name": "Rust", "aliases": ["rust"]},
+    "cpp": {"name": "C++", "aliases": ["c++", "cpp"]},
+    "csharp": {"name": "C#", "aliases": ["c#", "csharp", ".net", "dotnet"]},
+    "sql": {"name": "SQL", "aliases": ["sql", "postgresql", "postgres", "mysql"]},
+    "nosql": {"name": "NoSQL", "aliases": ["nosql"]},
+    "mongodb": {"name": "MongoDB", "aliases": ["mongodb", "mongo"]},
+    "react": {"name": "React", "aliases": ["react", "reactjs", "react.js"]},
+    "nodejs": {"name": "Node.js", "aliases": ["node.js", "nodejs"]},
+    "django": {"name": "Django", "aliases": ["django"]},
+    "flask": {"name": "Flask", "aliases": ["flask"]},
+    "fastapi": {"name": "FastAPI", "aliases": ["fastapi"]},
+    "aws": {"name": "AWS", "aliases": ["aws", "amazon web services"]},
+    "azure": {"name": "Azure", "aliases": ["azure"]},
+    "gcp": {"name": "GCP", "aliases": ["gcp", "google cloud"]},
+    "docker": {"name": "Docker", "aliases": ["docker"]},
+    "kubernetes": {"name": "Kubernetes", "aliases": ["kubernetes", "k8s"]},
+    "terraform": {"name": "Terraform", "aliases": ["terraform"]},
+    "machine_learning": {"name": "Machine Learning", "aliases": ["machine learning", "ml"]},
+    "deep_learning": {"name": "Deep Learning", "aliases": ["deep learning"]},
+    "nlp": {"name": "NLP", "aliases": ["nlp", "natural language processing"]},
+    "computer_vision": {"name": "Computer Vision", "aliases": ["computer vision"]},
+    "llm": {"name": "LLMs", "aliases": ["llm", "llms", "large language models", "generative ai", "genai"]},
+    "data_science": {"name": "Data Science", "aliases": ["data science"]},
+    "data_engineering": {"name": "Data Engineering", "aliases": ["data engineering", "etl"]},
+    "tensorflow": {"name": "TensorFlow", "aliases": ["tensorflow"]},
+    "pytorch": {"name": "PyTorch", "aliases": ["pytorch", "torch"]},
+    "scikit_learn": {"name": "Scikit-learn", "aliases": ["scikit-learn", "scikit learn", "sklearn"]},
+    "pandas": {"name": "Pandas", "aliases": ["pandas"]},
+    "spark": {"name": "Spark", "aliases": ["spark", "pyspark", "apache spark"]},
+    "airflow": {"name": "Airflow", "aliases": ["airflow"]},
+    "tableau": {"name": "Tableau", "aliases": ["tableau"]},
+    "excel": {"name": "Excel", "aliases": ["excel"]},
+    "git": {"name": "Git", "aliases": ["git"]},
+    "ci_cd": {"name": "CI/CD", "aliases": ["ci/cd", "ci cd", "continuous integration"]},
+    "graphql": {"name": "GraphQL", "aliases": ["graphql"]},
+    "rest_api": {"name": "REST APIs", "aliases": ["rest api", "rest apis", "restful"]},
+    "product_management": {"name": "Product Management", "aliases": ["product management", "roadmapping"]},
+    "agile": {"name": "Agile", "aliases": ["agile", "scrum", "kanban"]},
+}
+TAXONOMY_VERSION = "2026-10-3"
+# Everyday words that only count as a skill in a posting's own skill list, never in free text
+AMBIGUOUS_ALIASES = {"go", "react", "spark", "excel"}
+
+_SEPARATORS = re.compile(r"[-_/|,;:()\[\]{}]+")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_skill_text(text):
+    """Lowercase and unify separators so "machine-learning" and "Machine  Learning" read the same"""
+    return _WHITESPACE.sub(" ", _SEPARATORS.sub(" ", (text or "").lower())).strip()
+
+
+def _is_boundary(text, index, outward):
+    """Whether text[index] lies outside a word - `outward` (-1 or 1) points away from the match
+
+    A "." with more word characters beyond it ("node.js", "react.js") is part of the word.
+    """
+    if index < 0 or index >= len(text):
+        return True
+    if text[index] == ".":
+        beyond = index + outward
+        return beyond < 0 or beyond >= len(text) or not text[beyond].isalnum()
+    return not text[index].isalnum()
+
+
+class AhoCorasick:
+    """🔎 Compiled multi-pattern matcher - one pass over the text finds every alias"""
+
+    def __init__(self, patterns):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for pattern, value in patterns:
+            node = 0
+            for char in pattern:
+                if char not in self._goto[node]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                    self._goto[node][char] = len(self._goto) - 1
+                node = self._goto[node][char]
+            self._output[node].append((len(pattern), value))
+
+        # Breadth-first failure links; outputs of the fallback state are inherited
+        pending = deque(self._goto[0].values())
+        while pending:
+            node = pending.popleft()
+            for char, child in self._goto[node].items():
+                pending.append(child)
+                fallback = self._fail[node]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def iter_matches(self, text):
+        """Yield (start, end, value) for every pattern occurrence"""
+        node = 0
+        goto, fail, output = self._goto, self._fail, self._output
+        for index, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for length, value in output[node]:
+                yield index - length + 1, index + 1, value
+
+
+class SkillExtractor:
+    """🧠 Alias-normalized skill extraction over titles and descriptions"""
+
+    def __init__(self, taxonomy=SKILL_TAXONOMY, ambiguous=AMBIGUOUS_ALIASES):
+        self.taxonomy = taxonomy
+        self._aliases = {}
+        for skill_id, entry in taxonomy.items():
+            for alias in [entry["name"], *entry["aliases"]]:
+                self._aliases[normalize_skill_text(alias)] = skill_id
+        # "Go"/"React"/"Spark" canonicalize listed skills, but in prose they're usually just words
+        self._matcher = AhoCorasick((alias, skill_id) for alias, skill_id in self._aliases.items()
+                                    if alias not in ambiguous)
+
+    def canonicalize(self, skill):
+        """Map a hand-written skill to its canonical ID (unknown skills get a slug ID)"""
+        normalized = normalize_skill_text(skill)
+        return self._aliases.get(normalized) or re.sub(r"[^a-z0-9+#]+", "_", normalized).strip("_")
+
+    def extract(self, text):
+        """Canonical IDs of every taxonomy skill mentioned in `text`"""
+        text = normalize_skill_text(text)
+        return {
+            skill_id for start, end, skill_id in self._matcher.iter_matches(text)
+            if _is_boundary(text, start - 1, -1) and _is_boundary(text, end, 1)
+        }
+
+    def skills_for(self, job):
+        """Canonical skills for a posting - its hand-written list plus anything found in title/description"""
+        skills = {self.canonicalize(skill) for skill in job.get("skills", []) if skill}
+        skills |= self.extract(f"{job.get('title') or ''} . {job.get('description') or ''}")
+        skills.discard("")
+        return sorted(skills)
+
+
+_extractor = None
+
+
+def get_skill_extractor():
+    """Shared extractor - the automaton is compiled once per process"""
+    global _extractor
+    if _extractor is None:
+        _extractor = SkillExtractor()
+    return _extractor
+
+
+def skill_name(skill_id):
+    """Display name for a canonical skill ID"""
+    entry = SKILL_TAXONOMY.get(skill_id)
+    return entry["name"] if entry else skill_id.replace("_", " ").title()
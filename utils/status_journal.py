@@ -0,0 +1,159 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+from utils.atomic_io import atomic_write_json, file_lock, read_json
+from utils.data_access import file_version
+
+STATUS_PATH = "data/scheduler_status.json"
+JOURNAL_PATH = "data/status_journal.jsonl"
+
+
+class StatusJournal:
+    """📜 Append-only log of task runs folded into a periodically compacted snapshot
+
+    Each finished run appends one compact JSON line - no read-modify-write of
+    the whole status. After `compact_every` records the journal is folded into
+    the snapshot (latest entry per task, plus the last `keep` runs per task)
+    and truncated. Records carry a sequence number and the snapshot remembers
+    the last one it folded, so a crash between the two steps never counts a
+    run twice. The folded state lives in memory: appends - ours or another
+    process's - are applied by reading only the bytes past the last offset, and
+    everything is re-read only when the snapshot or the journal file is replaced
+    or truncated.
+    """
+
+    def __init__(self, snapshot_path=STATUS_PATH, journal_path=JOURNAL_PATH, compact_every=100, keep=50):
+        self.snapshot_path = snapshot_path
+        self.journal_path = journal_path
+        self.compact_every = compact_every
+        self.keep = keep
+        self._fold = None
+        self._fold_lock = threading.Lock()
+
+    def _fold_snapshot(self, snapshot_version, inode):
+        snapshot = read_json(self.snapshot_path, default={})
+        if not isinstance(snapshot, dict):
+            snapshot = {}
+        return {
+            "snapshot": snapshot_version,
+            "inode": inode,
+            "offset": 0,
+            "folded_seq": snapshot.get("seq", 0),
+            "seq": snapshot.get("seq", 0),
+            "pending": 0,  # Journal records not yet compacted into the snapshot
+            "status": {key: value for key, value in snapshot.items() if key not in ("history", "seq")},
+            "history": {task: list(runs)[-self.keep:] for task, runs in snapshot.get("history", {}).items()}
+        }
+
+    def _apply(self, fold, record):
+        seq = record.get("seq", 0)
+        if seq <= fold["folded_seq"] or "task" not in record:
+            return  # Already in the snapshot (crash between compaction steps) or not a run
+        task = record["task"]
+        entry = {key: value for key, value in record.items() if key not in ("task", "seq")}
+        # Copy-on-write: dicts handed to readers are never mutated afterwards
+        fold["status"] = {**fold["status"], task: entry,
+                          "last_updated": record.get("recorded_at", fold["status"].get("last_updated"))}
+        fold["history"] = {**fold["history"], task: (fold["history"].get(task, []) + [entry])[-self.keep:]}
+        fold["seq"] = max(fold["seq"], seq)
+        fold["pending"] += 1
+
+    def _refresh(self):
+        """Bring the in-memory fold up to date - caller holds _fold_lock"""
+        snapshot_version = file_version(self.snapshot_path)
+        try:
+            stat = os.stat(self.journal_path)
+            inode, size = stat.st_ino, stat.st_size
+        except OSError:
+            inode, size = None, 0
+
+        fold = self._fold
+        if (fold is None or fold["snapshot"] != snapshot_version or fold["inode"] != inode
+                or size < fold["offset"]):
+            fold = self._fold_snapshot(snapshot_version, inode)
+
+        if size > fold["offset"]:
+            with open(self.journal_path, 'rb') as f:
+                f.seek(fold["offset"])
+                appended = f.read(size - fold["offset"])
+            # Stop at the last complete line - the rest is a write in progress or a torn tail
+            complete = appended.rfind(b"\n") + 1
+            for line in appended[:complete].splitlines():
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue  # Torn line from a crash mid-append, sealed off by the next write
+                if isinstance(record, dict):
+                    self._apply(fold, record)
+            fold["offset"] += complete
+
+        self._fold = fold
+        return fold
+
+    def _state(self):
+        with self._fold_lock:
+            return self._refresh()
+
+    # ✍️ Writer side
+    def record(self, task, data):
+        """Append one run of `task`; returns the task's status entry"""
+        with file_lock(self.journal_path), self._fold_lock:
+            seq = self._refresh()["seq"] + 1
+            entry = {**data, "recorded_at": datetime.now().isoformat()}
+            line = json.dumps({"task": task, "seq": seq, **entry}, separators=(",", ":")) + "\n"
+            os.makedirs(os.path.dirname(os.path.abspath(self.journal_path)), exist_ok=True)
+            # One write() on an O_APPEND file - concurrent readers see whole lines or a skippable torn tail
+            fd = os.open(self.journal_path, os.O_RDWR | os.O_APPEND | os.O_CREAT, 0o644)
+            try:
+                size = os.fstat(fd).st_size
+                # O_APPEND writes go to the end whatever the read position is
+                if size and os.lseek(fd, size - 1, os.SEEK_SET) >= 0 and os.read(fd, 1) != b"\n":
+                    line = "\n" + line  # Seal off a torn line left by a crash
+                os.write(fd, line.encode("utf-8"))
+            finally:
+                os.close(fd)
+            # Reads back just the line we wrote
+            if self._refresh()["pending"] >= self.compact_every:
+                self._compact()
+        return entry
+
+    def compact(self):
+        with file_lock(self.journal_path), self._fold_lock:
+            self._refresh()
+            self._compact()
+
+    def _compact(self):
+        fold = self._fold
+        if not fold["pending"]:
+            return
+        snapshot = {**fold["status"], "history": fold["history"], "seq": fold["seq"]}
+        # Snapshot first: if we crash before truncating, its seq makes the old lines no-ops
+        atomic_write_json(self.snapshot_path, snapshot)
+        with open(self.journal_path, 'w'):
+            pass
+        self._fold = None  # Next access folds from the new snapshot
+
+    # 📖 Reader side
+    def status(self):
+        """Latest entry per task plus `last_updated` - the classic scheduler_status.json shape"""
+        return self._state()["status"]
+
+    def tail(self, task, n=10):
+        """Last `n` runs of `task`, newest first"""
+        return list(reversed(self._state()["history"].get(task, [])[-n:]))
+
+    def tasks(self):
+        return sorted(self._state()["history"])
+
+
+_journal = None
+
+
+def get_status_journal():
+    """Shared status journal for this process"""
+    global _journal
+    if _journal is None:
+        _journal = StatusJournal()
+    return _journal
@@ -0,0 +1,142 @@
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+from utils.analytics import CATEGORY_PATTERNS, OTHER_CATEGORY, categorize_titles
+from utils.job_store import DEFAULT_DB_PATH, SQLiteBacked
+
+CATEGORIES = [name for name, _ in CATEGORY_PATTERNS] + [OTHER_CATEGORY]
+
+# ⏱️ Bucket width and how long each resolution is kept
+RESOLUTIONS = {
+    "minute": {"seconds": 60, "retention": timedelta(days=2), "freq": "min"},
+    "hour": {"seconds": 3600, "retention": timedelta(days=90), "freq": "h"},
+    "day": {"seconds": 86400, "retention": timedelta(days=3 * 365), "freq": "D"},
+}
+
+
+def pick_resolution(span):
+    """Finest resolution that keeps a chart of `span` under a few hundred points"""
+    if span <= timedelta(hours=6):
+        return "minute"
+    if span <= timedelta(days=14):
+        return "hour"
+    return "day"
+
+
+class PostingTimeSeries(SQLiteBacked):
+    """📈 Per-category posting counts rolled up into minute, hour and day buckets
+
+    Every recorded posting increments its bucket at all three resolutions in the
+    same transaction, so coarse charts never re-aggregate fine data and range
+    queries read precomputed rows only. Old buckets are pruned per resolution.
+    Bucket starts are local-time epoch seconds, so day buckets line up with
+    calendar days on the charts.
+    """
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS posting_rollups (
+        resolution TEXT NOT NULL,
+        bucket INTEGER NOT NULL,
+        category TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (resolution, bucket, category)
+    ) WITHOUT ROWID;
+    """
+
+    @staticmethod
+    def bucket_start(moment, resolution):
+        width = RESOLUTIONS[resolution]["seconds"]
+        epoch = int((moment - datetime(1970, 1, 1)).total_seconds())
+        return epoch - epoch % width
+
+    def _increment(self, conn, moment, counts):
+        rows = []
+        for resolution in RESOLUTIONS:
+            bucket = self.bucket_start(moment, resolution)
+            rows.extend((resolution, bucket, category, count) for category, count in counts.items())
+        conn.executemany(
+            """INSERT INTO posting_rollups (resolution, bucket, category, count) VALUES (?, ?, ?, ?)
+               ON CONFLICT(resolution, bucket, category) DO UPDATE SET count = count + excluded.count""",
+            rows
+        )
+
+    def record(self, jobs, at=None):
+        """Count freshly stored postings at time `at` (now by default); returns how many were recorded"""
+        titles = [job.get("title") for job in jobs]
+        if not titles:
+            return 0
+        counts = categorize_titles(titles).value_counts().to_dict()
+        with self.transaction() as conn:
+            self._increment(conn, at or datetime.now(), counts)
+        self.prune()
+        return len(titles)
+
+    def prune(self, now=None):
+        """Drop buckets older than their resolution's retention"""
+        now = now or datetime.now()
+        with self.transaction() as conn:
+            for resolution, spec in RESOLUTIONS.items():
+                conn.execute("DELETE FROM posting_rollups WHERE resolution = ? AND bucket < ?",
+                             (resolution, self.bucket_start(now - spec["retention"], resolution)))
+
+    def rebuild(self, store):
+        """Backfill from stored postings, bucketed by posted_date (day precision at best)"""
+        with self.transaction() as conn:
+            conn.execute("DELETE FROM posting_rollups")
+            by_day = {}
+            for job in store.iter_jobs():
+                try:
+                    day = datetime.strptime(job.get("posted_date") or "", "%Y-%m-%d")
+                except ValueError:
+                    continue
+                by_day.setdefault(day, []).append(job.get("title"))
+            for day, titles in by_day.items():
+                self._increment(conn, day, categorize_titles(titles).value_counts().to_dict())
+        self.prune()
+
+    def version(self):
+        """Cheap token that changes whenever a posting is recorded or buckets are pruned"""
+        return tuple(self.connect().execute(
+            "SELECT COUNT(*), COALESCE(SUM(count), 0), COALESCE(MAX(bucket), 0) FROM posting_rollups WHERE resolution = 'day'"
+        ).fetchone())
+
+    def is_empty(self):
+        return self.connect().execute("SELECT 1 FROM posting_rollups LIMIT 1").fetchone() is None
+
+    def query(self, start, end=None, resolution=None, categories=None):
+        """Zero-filled counts between `start` and `end` - a DataFrame indexed by bucket time, one column per category"""
+        end = end or datetime.now()
+        resolution = resolution or pick_resolution(end - start)
+        categories = list(categories or CATEGORIES)
+        first = self.bucket_start(start, resolution)
+        last = self.bucket_start(end, resolution)
+
+        placeholders = ",".join("?" * len(categories))
+        rows = self.connect().execute(
+            f"""SELECT bucket, category, count FROM posting_rollups
+                WHERE resolution = ? AND bucket BETWEEN ? AND ? AND category IN ({placeholders})""",
+            [resolution, first, last] + categories
+        ).fetchall()
+
+        index = pd.date_range(pd.Timestamp(first, unit="s"), pd.Timestamp(last, unit="s"),
+                              freq=RESOLUTIONS[resolution]["freq"])
+        frame = pd.DataFrame(0, index=index, columns=categories, dtype="int64")
+        if rows:
+            data = pd.DataFrame([tuple(row) for row in rows], columns=["bucket", "category", "count"])
+            data["bucket"] = pd.to_datetime(data["bucket"], unit="s")
+            pivot = data.pivot_table(index="bucket", columns="category", values="count", aggfunc="sum")
+            frame = frame.add(pivot.reindex(index=index, columns=categories), fill_value=0).astype("int64")
+        frame.index.name = "Time"
+        return frame
+
+
+_series = None
+
+
+def get_posting_timeseries():
+    """Shared rollup store for this process"""
+    global _series
+    if _series is None:
+        _series = PostingTimeSeries()
+    return _series
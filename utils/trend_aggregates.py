@@ -0,0 +1,83 @@
+from datetime import datetime, timedelta
+
+
+class TrendAggregates:
+    """📈 Day-bucketed trend counters - maintained on every insert/expiry so reads are O(buckets)"""
+
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS trend_buckets (
+        day TEXT NOT NULL,
+        kind TEXT NOT NULL,
+        key TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        PRIMARY KEY (day, kind, key)
+    ) WITHOUT ROWID;
+    """
+
+    @staticmethod
+    def bucket_day(job):
+        return job.get("posted_date") or datetime.now().strftime("%Y-%m-%d")
+
+    @staticmethod
+    def _counters(job):
+        yield "total", ""
+        if "remote" in (job.get("location") or "").lower():
+            yield "remote", ""
+        if job.get("company"):
+            yield "company", job["company"]
+        for skill in set(job.get("skills", [])):
+            yield "skill", skill
+
+    def apply(self, conn, job, delta):
+        """Add (delta=1) or remove (delta=-1) one job's contribution inside the caller's transaction"""
+        day = self.bucket_day(job)
+        conn.executemany(
+            """INSERT INTO trend_buckets (day, kind, key, count) VALUES (?, ?, ?, ?)
+               ON CONFLICT(day, kind, key) DO UPDATE SET count = count + excluded.count""",
+            [(day, kind, key, delta) for kind, key in self._counters(job)]
+        )
+        if delta < 0:
+            conn.execute("DELETE FROM trend_buckets WHERE day = ? AND count <= 0", (day,))
+
+    def rebuild(self, conn, jobs):
+        """Recompute every bucket from scratch"""
+        conn.execute("DELETE FROM trend_buckets")
+        for job in jobs:
+            self.apply(conn, job, 1)
+
+    def summary(self, conn, days=None, top_n=10):
+        """Trend snapshot over the last `days` days (all history when None)"""
+        where, params = "", []
+        if days:
+            where = " AND day >= ?"
+            params.append((datetime.now() - timedelta(days=days - 1)).strftime("%Y-%m-%d"))
+
+        def scalar(kind):
+            return conn.execute(
+                f"SELECT COALESCE(SUM(count), 0) FROM trend_buckets WHERE kind = ?{where}", [kind] + params
+            ).fetchone()[0]
+
+        total_jobs = scalar("total")
+        if not total_jobs:
+            return {"status": "no_data", "updated_at": datetime.now().isoformat()}
+
+        top_skills = conn.execute(
+            f"""SELECT key, SUM(count) AS n FROM trend_buckets WHERE kind = 'skill'{where}
+                GROUP BY key HAVING n > 0 ORDER BY n DESC, key LIMIT ?""", params + [top_n]
+        ).fetchall()
+        companies_hiring = conn.execute(
+            f"""SELECT COUNT(*) FROM (SELECT key FROM trend_buckets WHERE kind = 'company'{where}
+                GROUP BY key HAVING SUM(count) > 0)""", params
+        ).fetchone()[0]
+        daily = conn.execute(
+            f"SELECT day, count FROM trend_buckets WHERE kind = 'total'{where} ORDER BY day", params
+        ).fetchall()
+
+        return {
+            "total_jobs": total_jobs,
+            "top_skills": {row[0]: row[1] for row in top_skills},
+            "companies_hiring": companies_hiring,
+            "remote_jobs": scalar("remote"),
+            "daily_jobs": {row[0]: row[1] for row in daily},
+            "updated_at": datetime.now().isoformat()
+        }